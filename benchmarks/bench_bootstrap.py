@@ -0,0 +1,24 @@
+# benchmarks/bench_bootstrap.py
+# ---------------------------------------------------------
+# 부트스트랩 신뢰구간: 복제본 1000개 (프로세스 풀 vs 단일 프로세스)
+# ---------------------------------------------------------
+
+import pytest
+
+from metrics.bootstrap import bootstrap_intervals
+
+N_BOOT = 1000
+
+
+@pytest.fixture
+def small_league(league, n_players):
+    if n_players > 1_000:
+        pytest.skip("선수 × 복제본 배열이 커서 1k 명까지만 측정")
+    return league
+
+
+@pytest.mark.parametrize("workers", [1, None], ids=["single", "pool"])
+def bench_bootstrap(benchmark, small_league, workers):
+    result = benchmark.pedantic(bootstrap_intervals, args=small_league,
+                                kwargs=dict(n_boot=N_BOOT, workers=workers), rounds=3)
+    assert (result["OCI_하한"] <= result["OCI_상한"]).all()
@@ -0,0 +1,35 @@
+# benchmarks/bench_dashboard.py
+# ---------------------------------------------------------
+# dashbord.py 재실행 (headless AppTest, 캐시가 채워진 상태)
+# - 사이드바 조작 1회에 해당하는 전체 스크립트 재실행 시간
+# - 100k 명은 브라우저 렌더 한계를 넘으므로 1k 까지만
+# - 팀 분석 페이지: store/ 없이 data/*.csv 기본 슬라이스로 그려지는지 (시간 측정 없음)
+# ---------------------------------------------------------
+
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+DASHBOARD = Path(__file__).resolve().parent.parent / "dashbord.py"
+TEAM_PAGE = DASHBOARD.parent / "pages" / "1_팀_분석.py"
+
+
+def bench_dashboard_rerun(benchmark, league_dir, n_players, monkeypatch):
+    if n_players > 1_000:
+        pytest.skip("대시보드 재실행은 1k 명까지만 측정")
+    monkeypatch.chdir(league_dir)
+    at = AppTest.from_file(str(DASHBOARD), default_timeout=120).run()
+    assert not at.exception
+    benchmark(at.run)
+    assert not at.exception
+
+
+def bench_team_page_without_store(league_dir, n_players, monkeypatch):
+    if n_players > 1_000:
+        pytest.skip("대시보드 페이지는 1k 명까지만")
+    monkeypatch.chdir(league_dir)
+    assert not (league_dir / "store").exists()
+    at = AppTest.from_file(str(TEAM_PAGE), default_timeout=120).run()
+    assert not at.exception, [e.value for e in at.exception]
+    assert not at.warning
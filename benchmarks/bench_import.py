@@ -0,0 +1,50 @@
+# benchmarks/bench_import.py
+# ---------------------------------------------------------
+# 대시보드 프로세스 기동: 공용 모듈 import 시간 예산
+# - 새 인터프리터에서 numpy/pandas/streamlit(어느 대시보드든 필요한 기준선) 위에
+#   대시보드 모듈을 import 하는 데 걸린 시간 (여러 번 중 최소) ≤ 예산
+# - 무거운 모듈(sklearn, scipy, plotly.express, openpyxl)은 쓰는 섹션이 그려질 때만 import
+#   OCI_IMPORT_BUDGET_MS 로 예산 조정 (측정값만 보고 pytest-benchmark 통계는 남기지 않음)
+# - API·정적 리포트 모듈은 streamlit 없이 import (oci_loaders 사용)
+# ---------------------------------------------------------
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+IMPORT_BUDGET_MS = float(os.environ.get("OCI_IMPORT_BUDGET_MS", 250))
+DASHBOARD_MODULES = ["oci_timing", "league_index", "metrics", "oci_data", "oci_figures", "oci_export", "oci_sections"]
+LAZY_MODULES = ["sklearn", "scipy", "plotly.express", "openpyxl"]
+HEADLESS_MODULES = ["oci_api", "oci_report"]
+
+_PROBE = """
+import sys, time
+import numpy, pandas, streamlit
+t = time.perf_counter()
+import {modules}
+print((time.perf_counter() - t) * 1000, *[m for m in {lazy!r} if m in sys.modules])
+"""
+
+
+def _probe() -> tuple:
+    code = _PROBE.format(modules=", ".join(DASHBOARD_MODULES), lazy=LAZY_MODULES)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True,
+                         text=True, check=True).stdout.split()
+    return float(out[0]), out[1:]
+
+
+def bench_dashboard_import():
+    results = [_probe() for _ in range(5)]
+    loaded = {m for _, mods in results for m in mods}
+    assert not loaded, f"기동 시 import 되면 안 되는 모듈: {sorted(loaded)}"
+    best = min(ms for ms, _ in results)
+    assert best <= IMPORT_BUDGET_MS, f"대시보드 모듈 import {best:.0f}ms > 예산 {IMPORT_BUDGET_MS:.0f}ms"
+
+
+def bench_headless_import_without_streamlit():
+    code = f"import sys, {', '.join(HEADLESS_MODULES)}; print('streamlit' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True,
+                         text=True, check=True).stdout.split()
+    assert out == ["False"], f"{HEADLESS_MODULES} 가 streamlit 을 import 함"
@@ -0,0 +1,12 @@
+# benchmarks/bench_load.py
+# ---------------------------------------------------------
+# 지표 파일 로드: read_csv_safe + prepare_df (캐시 미적용 원가)
+# ---------------------------------------------------------
+
+from oci_data import prepare_df
+from oci_loaders import read_csv_safe
+
+
+def bench_read_prepare(benchmark, league_dir):
+    path = league_dir / "남자부_지표.csv"
+    benchmark(lambda: prepare_df(read_csv_safe(path)))
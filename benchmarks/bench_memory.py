@@ -0,0 +1,70 @@
+# benchmarks/bench_memory.py
+# ---------------------------------------------------------
+# 대시보드 메모리: 공유 DF 압축 + 세션당 추가 메모리 상한
+# - 공유 DF (compact_metrics: 팀 category, 지표 float32) 는 원래 DF 의 70% 이하
+# - 재실행 한 번이 세션 쪽에 남기는 데이터(뷰, Top/Bottom, 가중치 Top15, 유사 선수)는
+#   뷰/잘라낸 행뿐 → 세션당 추가 메모리 ≤ max(256KB, 공유 DF 의 2%)
+# ---------------------------------------------------------
+
+import tracemalloc
+
+import pytest
+
+from league_index import ALL_TEAMS, build_league_index
+from metrics import WEIGHTS
+from oci_loaders import clean_columns, coerce_metrics, compact_metrics, ensure_oidr, read_table
+
+SESSIONS = 20
+
+
+def _frame_bytes(df) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+@pytest.fixture(scope="session")
+def frames(league_dir):
+    df = ensure_oidr(coerce_metrics(clean_columns(read_table(league_dir / "남자부_지표.csv"))))
+    return df, compact_metrics(df)
+
+
+@pytest.fixture(scope="session")
+def shared_index(frames):
+    idx = build_league_index(frames[1], ("bench",))
+    _rerun(idx, idx.teams[0], idx.team_players(idx.teams[0])[0])   # 공유 캐시(지표 행렬, 트리) 미리 구성
+    return idx
+
+
+def _rerun(idx, team, player) -> list:
+    """대시보드 재실행 한 번이 세션 쪽에 만드는 데이터"""
+    return [
+        idx.view(team), idx.team_players(team), idx.row(player),
+        idx.ranking(team, 10), idx.ranking(team, 10, bottom=True),
+        idx.reweighted_ranking(WEIGHTS, team, top_n=15),
+        idx.similar(player, 5),
+    ]
+
+
+def bench_compact_frame(benchmark, frames):
+    df, _ = frames
+    out = benchmark(compact_metrics, df)
+    assert _frame_bytes(out) <= 0.7 * _frame_bytes(df)
+
+
+@pytest.mark.parametrize("team", ["all", "team"])
+def bench_session_overhead(benchmark, shared_index, team):
+    idx = shared_index
+    team = ALL_TEAMS if team == "all" else idx.teams[0]
+    player = idx.team_players(team)[0]
+    assert idx.view(ALL_TEAMS) is idx.df   # "전체" 는 공유 DF 그대로
+
+    benchmark(_rerun, idx, team, player)
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        sessions = [_rerun(idx, team, player) for _ in range(SESSIONS)]
+        per_session = (tracemalloc.get_traced_memory()[0] - base) / SESSIONS
+    finally:
+        tracemalloc.stop()
+    assert len(sessions) == SESSIONS
+    budget = max(256 * 1024, 0.02 * _frame_bytes(idx.df))
+    assert per_session <= budget, f"세션당 {per_session / 1024:.0f}KB > {budget / 1024:.0f}KB"
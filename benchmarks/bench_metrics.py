@@ -0,0 +1,21 @@
+# benchmarks/bench_metrics.py
+# ---------------------------------------------------------
+# 지표(ADI/AER/ER/AEI/OCI) 계산: 노트북 pandas 파이프라인 vs 벡터화 엔진
+# ---------------------------------------------------------
+
+import numpy as np
+
+from metrics import compute_indices
+from reference import notebook_pipeline
+
+
+def bench_notebook_pipeline(benchmark, league):
+    benchmark(notebook_pipeline, *league)
+
+
+def bench_compute_indices(benchmark, league):
+    out = benchmark(compute_indices, *league)
+    # 결과가 노트북과 같아야 비교가 의미 있음
+    ref = notebook_pipeline(*league)
+    assert (out["선수"].to_numpy() == ref["선수"].to_numpy()).all()
+    np.testing.assert_allclose(out["OCI"].to_numpy(), ref["OCI"].to_numpy(), atol=1e-9)
@@ -0,0 +1,27 @@
+# benchmarks/bench_report.py
+# ---------------------------------------------------------
+# 정적 리포트 스냅샷: 리그 × 팀 × 선수 페이지 생성 (현재 프로세스 vs 프로세스 풀)
+# ---------------------------------------------------------
+
+import json
+
+import pytest
+
+from oci_report import build_report
+
+
+@pytest.fixture(scope="session")
+def leagues(league_dir, n_players):
+    if n_players > 1_000:
+        pytest.skip("선수 페이지(파일) 수가 많아 1k 선수까지만")
+    return {"남자부": league_dir / "남자부_지표.csv"}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def bench_build_report(benchmark, leagues, tmp_path, workers):
+    out = tmp_path / "report"
+    pages = benchmark(build_report, out, leagues, workers, 100)
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    players = manifest["leagues"]["남자부"]["players"]
+    assert pages == manifest["pages"] == 1 + len(manifest["leagues"]["남자부"]["teams"]) + players
+    assert len(list((out / "남자부" / "players").glob("*.html"))) == players
@@ -0,0 +1,66 @@
+# benchmarks/bench_rolling.py
+# ---------------------------------------------------------
+# 최근 N경기 구간 지표 (metrics.rolling): 누적합 차이 vs 구간마다 다시 합산
+# - 합성 선수 × 경기 기록 (팀당 36경기)
+# - 단순 버전(reference.naive_rolling)은 30명에서만 — 결과 일치 확인 겸 비교 기준
+# - 실시간 버전(RollingWindow): 시즌을 넣어 둔 상태에서 한 경기 반영 + 현재 폼
+# ---------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from metrics import INDEX_COLS, standardize
+from metrics.rolling import RollingWindow, latest, rolling_indices
+from reference import naive_rolling
+from synthetic import make_matches
+
+WINDOW = 5
+
+
+@pytest.fixture(scope="session")
+def matches(n_players):
+    return make_matches(n_players)
+
+
+def bench_naive_rolling(benchmark, matches, n_players):
+    if n_players > 30:
+        pytest.skip("구간마다 다시 합산 — 30명에서만 측정")
+    ref = benchmark.pedantic(naive_rolling, args=(matches, WINDOW), rounds=1)
+    out = rolling_indices(matches, WINDOW, partial=True)
+    assert (out["선수"].to_numpy() == ref["선수"].to_numpy()).all()
+    np.testing.assert_allclose(out[list(INDEX_COLS)].to_numpy(),
+                               standardize(ref[list(INDEX_COLS)].to_numpy(float)), atol=1e-9)
+
+
+@pytest.mark.parametrize("unit,window", [("match", WINDOW), ("set", 15)])
+def bench_rolling_indices(benchmark, matches, unit, window):
+    out = benchmark(rolling_indices, matches, window, unit)
+    assert len(out) == len(matches)
+    full = out["경기수"] >= window if unit == "match" else out["세트수"] >= window
+    # 구간이 덜 찼으면 NaN, 찼으면 값 (구간 시도가 0 이면 ER/AEI 가 정의되지 않아 NaN)
+    assert out.loc[~full, "OCI"].isna().all()
+    assert out.loc[full, "ADI"].notna().all()
+
+
+def bench_rolling_push(benchmark, matches, n_players):
+    """마지막 한 경기를 RollingWindow 에 반영 + 현재 폼 (이전 경기들은 준비 단계에서 반영)"""
+    if n_players > 1_000:
+        pytest.skip("시즌 전체를 경기 단위로 쌓는 준비 단계가 길어 1k 명까지만")
+    last = matches["경기"].max()
+    before, new = matches[matches["경기"] < last], matches[matches["경기"] == last]
+
+    def setup():
+        live = RollingWindow(WINDOW)
+        live.push(before)
+        return (live,), {}
+
+    def push_last(live):
+        live.push(new)
+        return live.current()
+
+    current = benchmark.pedantic(push_last, setup=setup, rounds=5)
+    # 선수별 마지막 구간 = 배치 결과의 선수별 마지막 행 (표준화 모집단만 다름 → 다시 표준화해 비교)
+    batch = latest(rolling_indices(matches, WINDOW))
+    assert (current["선수"].to_numpy() == batch["선수"].to_numpy()).all()
+    np.testing.assert_allclose(current[list(INDEX_COLS)].to_numpy(),
+                               standardize(batch[list(INDEX_COLS)].to_numpy()), atol=1e-9)
@@ -0,0 +1,62 @@
+# benchmarks/bench_scrape.py
+# ---------------------------------------------------------
+# 스크래퍼 재생: 픽스처 서버 → HTTP 수집 → 파싱 → CSV/Parquet 저장 (네트워크·브라우저 없음)
+# 테이블 파싱: 스키마 변환(셀 텍스트 → 타입 컬럼) vs pd.read_html
+# ---------------------------------------------------------
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+import kovo_fixtures
+from kovo_ext import ScrapeJob, make_jobs, parse_table, read_table, save_tables, scrape_all
+
+
+@pytest.fixture(scope="session")
+def fixtures(league_dir, n_players):
+    if n_players > 1_000:
+        pytest.skip("HTML 파싱 벤치는 1k 선수까지만")
+    jobs = make_jobs(genders=["남자부"])
+    kovo_fixtures.fixtures_from_csv(league_dir / "data", league_dir / "fixtures", jobs)
+    return jobs, league_dir / "fixtures"
+
+
+def bench_replay_scrape(benchmark, fixtures, league_dir):
+    jobs, root = fixtures
+    with kovo_fixtures.serve(root) as base_url:
+        results = benchmark(lambda: asyncio.run(scrape_all(jobs, base_url, use_browser=False)))
+    job = jobs[0]
+    expected = pd.read_csv(league_dir / "data" / f"{job.slug}.csv")
+    pd.testing.assert_frame_equal(results[job], expected, check_dtype=False)
+
+
+def bench_replay_save(benchmark, fixtures, tmp_path):
+    jobs, root = fixtures
+    with kovo_fixtures.serve(root) as base_url:
+        results = asyncio.run(scrape_all(jobs, base_url, use_browser=False))
+    counter = iter(range(1_000_000))
+
+    def save():
+        out = tmp_path / str(next(counter))   # 매번 빈 디렉터리 → 전부 새로 기록
+        return save_tables(results, out / "data", out / "store")
+
+    changed = benchmark(save)
+    assert len(changed) == len(jobs)
+
+
+@pytest.fixture(scope="session")
+def table_html(league):
+    type_tables, _, _ = league
+    return next(iter(type_tables.values())).to_html(index=False, border=0)
+
+
+def bench_parse_schema(benchmark, table_html):
+    df = benchmark(read_table, ScrapeJob("남자부", "속공"), table_html)
+    pd.testing.assert_frame_equal(df, parse_table(table_html))
+
+
+def bench_parse_read_html(benchmark, table_html, n_players):
+    if n_players > 1_000:
+        pytest.skip("read_html 은 1k 선수까지만")
+    benchmark(parse_table, table_html)
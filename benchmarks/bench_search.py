@@ -0,0 +1,49 @@
+# benchmarks/bench_search.py
+# ---------------------------------------------------------
+# 선수 이름 검색 인덱스 (player_search): 구성 원가 + 검색어 종류별 조회 시간
+# - 합성 한글 이름 (성 + 두 음절, 같은 seed 면 같은 명단)
+# - 조회는 1k 명까지 1ms 미만 (OCI_SEARCH_BUDGET_MS 로 조정)
+# ---------------------------------------------------------
+
+import os
+
+import numpy as np
+import pytest
+
+from player_search import SearchIndex, choseong
+
+SEARCH_BUDGET_MS = float(os.environ.get("OCI_SEARCH_BUDGET_MS", 1.0))
+SURNAMES = list("김이박최정강조윤장임한오서신권황안송류홍")
+SYLLABLES = list("민서예지현수영준우진나은하유재성경다혜소연봉호태희원동규")
+
+
+@pytest.fixture(scope="session")
+def names(n_players):
+    rng = np.random.default_rng(0)
+    names = (np.array(SURNAMES)[rng.integers(0, len(SURNAMES), n_players)].astype(object)
+             + np.array(SYLLABLES)[rng.integers(0, len(SYLLABLES), n_players)]
+             + np.array(SYLLABLES)[rng.integers(0, len(SYLLABLES), n_players)])
+    return sorted(set(names) | {"비예나", "레오", "허수봉"})
+
+
+@pytest.fixture(scope="session")
+def index(names):
+    return SearchIndex(names)
+
+
+def bench_build_search_index(benchmark, names):
+    index = benchmark(SearchIndex, names)
+    assert len(index) == len(names)
+
+
+@pytest.mark.parametrize("query", ["ㅂㅇㄴ", "비ㅇ", "비예", "예나", "비에나", "ㄱ"])
+def bench_search(benchmark, index, n_players, query):
+    found = benchmark(index.search, query)
+    assert 0 < len(found) <= 20
+    if query != "ㄱ":
+        assert "비예나" in found
+    else:
+        assert all(choseong(name).find("ㄱ") >= 0 for name in found)
+    if n_players <= 1_000:
+        mean_ms = benchmark.stats.stats.mean * 1000
+        assert mean_ms < SEARCH_BUDGET_MS, f"검색 {query!r} {mean_ms:.2f}ms > 예산 {SEARCH_BUDGET_MS}ms"
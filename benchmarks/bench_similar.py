@@ -0,0 +1,38 @@
+# benchmarks/bench_similar.py
+# ---------------------------------------------------------
+# 유사 선수 검색: KDTree 조회 vs 요청마다 전체 거리 계산(브루트포스)
+# ---------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from league_index import RADAR_COLS, build_league_index
+from metrics import compute_indices, standardize
+
+
+@pytest.fixture(scope="session")
+def index(league):
+    idx = build_league_index(compute_indices(*league))
+    idx.neighbors  # 트리는 데이터 버전당 한 번 — 조회 비용만 측정
+    return idx
+
+
+def bench_similar_kdtree(benchmark, index):
+    player = index.df["선수"].iat[len(index.df) // 2]
+    result = benchmark(index.similar, player, 10)
+    assert len(result) == 10
+
+
+def bench_similar_bruteforce(benchmark, index):
+    player = index.df["선수"].iat[len(index.df) // 2]
+
+    def scan():
+        x = standardize(index.df[RADAR_COLS].to_numpy(dtype=float))
+        pos = index.row_of[player]
+        dist = np.sqrt(((x - x[pos]) ** 2).sum(axis=1))
+        order = np.argsort(dist, kind="stable")
+        return order[order != pos][:10], dist
+
+    rows, dist = benchmark(scan)
+    expected = index.similar(player, 10)["거리"].to_numpy()
+    np.testing.assert_allclose(np.sort(dist[rows]), expected, rtol=1e-9)
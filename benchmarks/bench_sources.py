@@ -0,0 +1,50 @@
+# benchmarks/bench_sources.py
+# ---------------------------------------------------------
+# 원시 기록 출처 확인 (시간 측정 없음): 저장소 경유 재계산 = 커밋된 *_지표.csv
+# - CSV 를 저장소로 이관한 뒤 재계산해도 같은 결과
+# - 스크래퍼처럼 유형별 파티션만 있는 저장소는 공개 합계(공격종합/팀 CSV)를 그대로 사용
+#   (유형별 합산으로 대신하면 선수 구성·OCI 가 달라짐)
+# ---------------------------------------------------------
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from metrics import (ATTACK_TYPES, DEFAULT_ROUNDS, DEFAULT_SEASON, INDEX_COLS, import_csv, load_sources,
+                     regenerate, store)
+
+REPO = Path(__file__).resolve().parents[1]
+GENDERS = [g for g in ("남자부", "여자부") if (REPO / f"{g}_지표.csv").exists()]
+
+
+def _assert_committed(indices: pd.DataFrame, gender: str) -> None:
+    committed = pd.read_csv(REPO / f"{gender}_지표.csv", encoding="utf-8")
+    assert indices["선수"].tolist() == committed["선수"].tolist()
+    np.testing.assert_allclose(indices[[*INDEX_COLS, "OCI"]].to_numpy(float),
+                               committed[[*INDEX_COLS, "OCI"]].to_numpy(float), atol=1e-9)
+
+
+@pytest.mark.parametrize("gender", GENDERS)
+def bench_store_sources_match_committed(tmp_path, gender):
+    root = tmp_path / "store"
+    import_csv(gender, REPO / "data", store_root=root)
+    assert store.has_sources(DEFAULT_SEASON, gender, DEFAULT_ROUNDS, root)
+    indices, _ = regenerate(gender, REPO / "data", tmp_path, store_root=root, n_boot=0)
+    _assert_committed(indices, gender)
+    _assert_committed(store.read("index", root=root, gender=gender), gender)
+
+
+@pytest.mark.parametrize("gender", GENDERS)
+def bench_type_only_store_keeps_published_totals(tmp_path, gender):
+    root = tmp_path / "store"
+    type_tables, _, _ = load_sources(gender, REPO / "data")
+    for attack_type in ATTACK_TYPES:
+        store.write_raw(type_tables[attack_type], DEFAULT_SEASON, gender, DEFAULT_ROUNDS, attack_type, root)
+    assert not store.has_sources(DEFAULT_SEASON, gender, DEFAULT_ROUNDS, root)
+    with pytest.raises(FileNotFoundError):
+        store.load_sources(DEFAULT_SEASON, gender, DEFAULT_ROUNDS, root)
+    indices, _ = regenerate(gender, REPO / "data", tmp_path, store_root=root, n_boot=0)
+    _assert_committed(indices, gender)
+
@@ -0,0 +1,34 @@
+# benchmarks/bench_validate.py
+# ---------------------------------------------------------
+# 수집 검증 단계: 원시 기록 검증(validate_sources) vs 지표 계산 원가
+# - 합성 리그는 error 없음, 공백/범위/팀 누락을 넣으면 잡혀야 함
+# ---------------------------------------------------------
+
+import pytest
+
+from metrics import compute_indices, validate
+
+
+def bench_validate_sources(benchmark, league):
+    report = benchmark(validate.validate_sources, *league)
+    assert not validate.has_errors(report)
+
+
+def bench_validate_index(benchmark, league):
+    report = benchmark(validate.validate_index, compute_indices(*league))
+    assert not validate.has_errors(report)
+
+
+def bench_validate_catches(benchmark, league):
+    type_tables, attack, team = league
+    attack = attack.copy()
+    attack.loc[0, "선수"] = f" {attack.loc[0, '선수']} "
+    attack.loc[1, "성공률"] = 150.0
+    report = benchmark(validate.validate_sources, type_tables, attack, team.iloc[1:])
+    found = set(zip(report["check"], report["level"]))
+    assert {("names", "warning"), ("range", "error"), ("coverage", "error")} <= found
+    with pytest.raises(validate.ValidationError):
+        validate.raise_for_errors(report)
+    # 공백 정리 후에는 계산 결과에서 빠지지 않음
+    cleaned = compute_indices(*validate.clean_sources(type_tables, attack, team))
+    assert len(cleaned) == len(compute_indices(*league))
@@ -0,0 +1,39 @@
+# benchmarks/bench_weights.py
+# ---------------------------------------------------------
+# 가중치 실험: 캐시된 지표 행렬 @ 가중치 벡터 vs DataFrame 재계산 + sort_values
+# ---------------------------------------------------------
+
+import pytest
+
+from league_index import build_league_index
+from metrics import INDEX_COLS, compute_indices
+
+WHAT_IF = {"ADI": 0.1, "AER": 0.5, "ER": -0.3, "AEI": 0.2}
+
+
+@pytest.fixture(scope="session")
+def index(league):
+    idx = build_league_index(compute_indices(*league))
+    idx.metric_matrix  # 데이터 버전당 한 번
+    return idx
+
+
+def bench_reweight_matrix(benchmark, index):
+    result = benchmark(index.reweighted_ranking, WHAT_IF)
+    assert len(result) == len(index.rank_order)
+
+
+def bench_reweight_matrix_top15(benchmark, index):
+    result = benchmark(index.reweighted_ranking, WHAT_IF, top_n=15)
+    assert result["선수"].tolist() == index.reweighted_ranking(WHAT_IF)["선수"].head(15).tolist()
+
+
+def bench_reweight_dataframe(benchmark, index):
+    def pipeline():
+        df = index.df.copy()
+        df["OCI"] = sum(df[c] * WHAT_IF[c] for c in INDEX_COLS)
+        return df.dropna(subset=["OCI"]).sort_values("OCI", ascending=False)[["선수", "팀", "OCI"]]
+
+    result = benchmark(pipeline)
+    expected = index.reweighted_ranking(WHAT_IF)
+    assert result["OCI"].round(9).tolist() == expected["OCI"].round(9).tolist()
@@ -0,0 +1,29 @@
+# benchmarks/conftest.py
+# ---------------------------------------------------------
+# 공용 픽스처: 선수 수별 합성 리그 (30 / 1k / 100k)
+# ---------------------------------------------------------
+
+import pytest
+
+from synthetic import make_league, write_league
+
+SIZES = [30, 1_000, 100_000]
+
+
+@pytest.fixture(scope="session", params=SIZES, ids=lambda n: f"{n}players")
+def n_players(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def league(n_players):
+    """(공격유형별 DF dict, 공격종합 DF, 팀 DF)"""
+    return make_league(n_players)
+
+
+@pytest.fixture(scope="session")
+def league_dir(tmp_path_factory, n_players):
+    """합성 원시 CSV + 남자부_지표.csv 가 있는 디렉터리"""
+    out_dir = tmp_path_factory.mktemp(f"league{n_players}")
+    write_league(out_dir, n_players)
+    return out_dir
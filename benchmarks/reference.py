@@ -0,0 +1,77 @@
+# benchmarks/reference.py
+# ---------------------------------------------------------
+# *_파워랭킹.ipynb 의 지표 계산 셀을 그대로 옮긴 pandas 버전
+# - 벡터화 엔진(metrics.compute_indices)과 속도 비교 / 결과 검증용
+# - 구간 지표는 선수 × 경기마다 최근 구간을 잘라 다시 합산하는 단순 버전 (metrics.rolling 검증용)
+# ---------------------------------------------------------
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+
+def notebook_pipeline(type_tables: dict, attack: pd.DataFrame, team: pd.DataFrame) -> pd.DataFrame:
+    dfs = []
+    for file, df in type_tables.items():
+        df = df.copy()
+        df['공격유형'] = file
+        dfs.append(df)
+    df_total = pd.concat(dfs, ignore_index=True)
+
+    pivot = pd.pivot_table(
+        df_total, index='선수', columns='공격유형',
+        values=['세트수', '시도', '성공', '실패', '범실', '성공률'],
+        aggfunc='sum', fill_value=0
+    )
+    pivot.columns = [f'{val}_{col}' for val, col in pivot.columns]
+    pivot = pivot.reset_index()
+
+    df = pivot.copy()
+    df = df.copy()
+    df.columns = df.columns.str.replace(' ', '', regex=False)
+    attempt_cols = [c for c in df.columns if c.startswith('시도_')]
+    df['총시도'] = df[attempt_cols].sum(axis=1)
+    probs = df[attempt_cols].div(df['총시도'].replace(0, np.nan), axis=0).fillna(0)
+    probs_nonzero = probs.replace(0, np.nan)
+    df['ADI'] = -(probs_nonzero * np.log2(probs_nonzero)).sum(axis=1).fillna(0)
+    df_adi = df[['선수', 'ADI']]
+
+    attack = attack.copy()
+    attack['AER'] = attack['시도'] / attack['세트수']
+    attack['ER'] = attack['범실'] / attack['시도']
+    df3 = pd.merge(df_adi, attack[['선수', '팀', 'AER', 'ER']], how='inner', on='선수')
+
+    team = team.rename(columns={'성공률': '팀_성공률'})
+    df_aei = attack.merge(team[['팀', '팀_성공률']], how='left', on='팀')
+    df_aei['AEI'] = df_aei['성공률'] / df_aei['팀_성공률']
+    df_oidr = pd.merge(df3, df_aei[['선수', 'AEI']], on='선수', how='inner')
+
+    ss_df_oidr = StandardScaler().fit_transform(df_oidr.select_dtypes(include='number'))
+    df_oidr_ss = pd.DataFrame()
+    df_oidr_ss[['선수', '팀']] = df_oidr[['선수', '팀']]
+    df_oidr_ss[['ADI', 'AER', 'ER', 'AEI']] = ss_df_oidr
+    df_oidr_ss['OCI'] = (df_oidr_ss['ADI'] * 0.25 + df_oidr_ss['AEI'] * 0.4
+                         + df_oidr_ss['AER'] * 0.25 - df_oidr_ss['ER'] * 0.1)
+    return df_oidr_ss
+
+
+def naive_rolling(matches: pd.DataFrame, window: int) -> pd.DataFrame:
+    """행마다 최근 window 경기를 잘라 합산 → 표준화 전 [선수, 경기, ADI, AER, ER, AEI]"""
+    type_cols = [c for c in matches.columns if c.startswith('시도_')]
+    team = matches.groupby(['팀', '경기'])[['시도', '성공']].sum().reset_index()
+    rows = []
+    for player, games in matches.sort_values('경기').groupby('선수', sort=True):
+        for i in range(len(games)):
+            part = games.iloc[max(0, i - window + 1):i + 1]
+            row = games.iloc[i]
+            team_part = team[(team['팀'] == row['팀']) & (team['경기'] <= row['경기'])].tail(window)
+            p = part[type_cols].sum() / part['시도'].sum() if part['시도'].sum() > 0 else part[type_cols].sum() * 0
+            p = p[p > 0]
+            rows.append({
+                '선수': player, '경기': row['경기'],
+                'ADI': -(p * np.log2(p)).sum(),
+                'AER': part['시도'].sum() / part['세트수'].sum(),
+                'ER': part['범실'].sum() / part['시도'].sum(),
+                'AEI': (part['성공'].sum() / part['시도'].sum()) / (team_part['성공'].sum() / team_part['시도'].sum()),
+            })
+    return pd.DataFrame(rows)
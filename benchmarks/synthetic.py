@@ -0,0 +1,104 @@
+# benchmarks/synthetic.py
+# ---------------------------------------------------------
+# KOVO 형식 합성 데이터 생성기 (벤치마크용)
+# - 공격유형별 기록(순서, 선수, 포지션, 전체팀, …), 공격종합, 팀 기록
+#   컬럼 구성은 data/kovo_men_*.csv 와 동일
+# - 선수 × 경기 기록 (구간 지표 metrics.rolling 용)
+# - 같은 seed 면 같은 데이터
+# ---------------------------------------------------------
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from metrics import ATTACK_TYPES, compute_indices
+
+TEAMS = ["대한항공", "현대캐피탈", "KB손해보험", "우리카드", "OK저축은행", "한국전력", "삼성화재"]
+POSITIONS = ["OH", "OP", "MB", "S", "L"]
+
+
+def _record(rng, names, teams, positions, sets, attempts) -> pd.DataFrame:
+    success = rng.binomial(attempts, 0.5)
+    fault = rng.binomial(attempts - success, 0.4)
+    error = rng.binomial(attempts - success - fault, 0.3)
+    rate = np.round(np.divide(success * 100, attempts, out=np.zeros(len(attempts)), where=attempts > 0), 2)
+    return pd.DataFrame({
+        "선수": names, "포지션": positions, "팀": teams,
+        "경기수": np.minimum(sets // 3 + 1, 36), "세트수": sets,
+        "시도": attempts, "성공": success, "실패": fault, "범실": error, "성공률": rate,
+    })
+
+
+def make_league(n_players: int, seed=0):
+    """(공격유형별 DF dict, 공격종합 DF, 팀 DF) — 선수 n_players 명"""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"선수{i:06d}" for i in range(n_players)], dtype=object)
+    teams = rng.choice(TEAMS, n_players)
+    positions = rng.choice(POSITIONS, n_players)
+    sets = rng.integers(20, 145, n_players)
+
+    type_tables = {}
+    totals = np.zeros(n_players, dtype=int)
+    for attack_type in ATTACK_TYPES:
+        # 유형마다 일부 선수만 기록 (실제 데이터처럼 유형별 명단이 다름)
+        mask = rng.random(n_players) < 0.7
+        attempts = rng.integers(1, 600, mask.sum())
+        totals[mask] += attempts
+        df = _record(rng, names[mask], teams[mask], positions[mask], sets[mask], attempts)
+        df = df.rename(columns={"팀": "전체팀"})
+        df.insert(0, "순서", np.arange(1, len(df) + 1))
+        type_tables[attack_type] = df
+
+    has_attack = totals > 0
+    attack = _record(rng, names[has_attack], teams[has_attack], positions[has_attack],
+                     sets[has_attack], totals[has_attack])
+    attack.insert(0, "순위", np.arange(1, len(attack) + 1))
+
+    team = attack.groupby("팀")[["세트수", "시도", "성공", "실패", "범실"]].sum().reset_index()
+    team["성공률"] = np.round(team["성공"] * 100 / team["시도"], 2)
+    team.insert(0, "순위", np.arange(1, len(team) + 1))
+    return type_tables, attack, team
+
+
+def make_matches(n_players: int, n_matches=36, seed=0) -> pd.DataFrame:
+    """선수 × 경기 기록 [선수, 팀, 경기, 세트수, 시도, 성공, 범실, 시도_<유형>…]
+
+    팀마다 n_matches 경기, 선수는 경기마다 80% 확률로 출전, 유형별 시도 ~ Poisson(선수 비율 × 세트수)
+    """
+    rng = np.random.default_rng(seed)
+    names = np.array([f"선수{i:06d}" for i in range(n_players)], dtype=object)
+    team_code = rng.integers(0, len(TEAMS), n_players)
+    team_sets = rng.integers(3, 6, (len(TEAMS), n_matches))
+    per_set = rng.gamma(1.0, 0.6, (n_players, len(ATTACK_TYPES))) * (rng.random((n_players, len(ATTACK_TYPES))) < 0.7)
+
+    player, match = np.nonzero(rng.random((n_players, n_matches)) < 0.8)
+    sets = np.minimum(team_sets[team_code[player], match], rng.integers(1, 6, len(player)))
+    types = rng.poisson(per_set[player] * sets[:, None])
+    tries = types.sum(axis=1)
+    success = rng.binomial(tries, 0.5)
+    out = pd.DataFrame({
+        "선수": names[player], "팀": np.array(TEAMS, dtype=object)[team_code[player]], "경기": match + 1,
+        "세트수": sets, "시도": tries, "성공": success, "범실": rng.binomial(tries - success, 0.15),
+    })
+    for k, attack_type in enumerate(ATTACK_TYPES):
+        out[f"시도_{attack_type}"] = types[:, k]
+    return out
+
+
+def write_league(out_dir, n_players: int, gender="남자부", seed=0) -> Path:
+    """합성 원시 CSV(data/) + 지표 CSV({gender}_지표.csv) 를 out_dir 에 저장"""
+    from metrics import LEAGUES
+
+    out_dir = Path(out_dir)
+    data_dir = out_dir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    type_tables, attack, team = make_league(n_players, seed)
+    prefix, team_name = LEAGUES[gender]["prefix"], LEAGUES[gender]["team"]
+    for attack_type, df in type_tables.items():
+        df.to_csv(data_dir / f"{prefix}_{attack_type}.csv", index=False, encoding="utf-8")
+    attack.to_csv(data_dir / f"{prefix}_attack.csv", index=False, encoding="utf-8-sig")
+    team.to_csv(data_dir / f"{team_name}.csv", index=False, encoding="utf-8-sig")
+    index_path = out_dir / f"{gender}_지표.csv"
+    compute_indices(type_tables, attack, team).to_csv(index_path, index=False, encoding="utf-8")
+    return index_path
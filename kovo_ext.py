@@ -1,44 +1,389 @@
+# kovo_ext.py
+# ---------------------------------------------------------
+# KOVO 선수기록(공격유형별) 스크래퍼 - 남자부/여자부 통합
+# - 브라우저(headless Chromium)는 한 번만 띄우고 작업마다 context 만 새로 생성
+# - (성별, 공격유형, 시즌, 라운드 범위) 작업을 async 워커 풀로 동시 실행
+# - 고정 sleep 대신 테이블 요소가 뜰 때까지 대기
+# - 테이블은 page.evaluate 한 번으로 셀 텍스트 배열만 받아 고정 스키마(store.RAW_SCHEMA)로 바로 변환
+#   헤더/값이 스키마와 다르면 경고 후 pd.read_html 로 대체 (스키마 변경 감지)
+# - 녹화/재생 (kovo_fixtures.py):
+#   --record DIR : 받은 테이블 HTML 을 작업별 픽스처로 저장
+#   --replay DIR : 픽스처를 로컬 HTTP 서버로 띄워 네트워크 없이 파싱~CSV 저장까지 실행
+#                  (--http 면 브라우저 없이 HTTP 로 바로 받아 파싱)
+# - data/<slug>.csv 와 *_지표.csv 는 기본 슬라이스(SEASON, ROUNDS)만 — 파일명에 시즌·라운드가 없음
+#   다른 시즌·라운드 슬라이스는 store/ 에만 기록하고 슬라이스 지표·이력으로 갱신
+# - 테이블별 내용 지문(fingerprint)을 기록해 바뀐 파일만 다시 쓰고(CSV + store/ Parquet),
+#   바뀐 리그만 지표(파워랭킹) 재계산
+# - 재계산 전에 수집 데이터 검증(metrics.validate) — error 면 지표를 갱신하지 않고 종료 코드 1
+#
+# 사용 예)
+#   python kovo_ext.py                                   # 남/여 × 6개 유형 전체
+#   python kovo_ext.py --gender 여자부 --types 속공 퀵오픈 --rounds 1 3
+#   python kovo_ext.py --season "도드람 2023-2024 V-리그" "도드람 2024-2025 V-리그" --per-round
+#     → 시즌 × 라운드(1R, 2R, …) 슬라이스를 모두 store/ 에 누적, 추이 이력 갱신
+#   python kovo_ext.py --replay fixtures --http --out-dir /tmp/out --no-refresh
+#   python kovo_ext.py --report report                   # 지표 재계산 후 정적 리포트 스냅샷 (oci_report.py)
+# ---------------------------------------------------------
 import re
-from playwright.sync_api import Playwright, sync_playwright, expect
-import pandas as pd
-from io import StringIO
+import json
+import asyncio
+import argparse
+import hashlib
+import logging
 import time
+import urllib.request
+from dataclasses import dataclass
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from lxml import etree
+from playwright.async_api import async_playwright, Browser
+
+import kovo_fixtures
+from metrics import DEFAULT_ROUNDS, DEFAULT_SEASON, history, regenerate, store, validate
+
+KOVO_URL = "https://kovo.co.kr"
+TABLE_SELECTOR = "#root > article > div > article > section > article > div > section.css-1g6h5ls > table"
+TABLE_TIMEOUT_MS = 15_000
+
 # 팀기록, 선수기록
 # 남자부, 여자부
-#types = ['오픈공격', '시간차공격','이동공격','후위공격','속공','퀵오픈']
-types = ['속공','퀵오픈']
-genders =['남자부','여자부']
-# 
-def kovo_ext(playwright: Playwright, type) -> None:
-    browser = playwright.chromium.launch(headless=False)
-    context = browser.new_context()
-    page = context.new_page()
-    page.goto("https://kovo.co.kr/")
-    page.goto("https://kovo.co.kr/KOVO")
-    page.get_by_role("button", name="STATS").click()
-    page.get_by_role("tab", name="선수 기록").click()
-    #time.sleep(5)
-    page.locator(".ant-select-selector").first.click()
-    page.get_by_text("도드람 2024-2025 V-리그").click()
-    page.locator("div").filter(has_text=re.compile(r"^진에어 2025-2026 V-리그$")).nth(2).click()
-    page.get_by_text("도드람 2024-2025 V-리그").nth(2).click()
-    page.locator("div").filter(has_text=re.compile(r"^1 Round$")).nth(3).click()
-    page.get_by_text("6 Round").click()
-    page.locator(".hidden > .ant-select > .ant-select-selector").first.click()
-    page.get_by_title(type).locator("div").click()
-    page.get_by_role("button", name="기록 보기").click()
-    time.sleep(1)
-    # 테이블 파싱 - locator: selector copy
-    tables = page.locator("#root > article > div > article > section > article > div > section.css-1g6h5ls > table").evaluate("element => element.outerHTML")
-    #tables = page.locator("#root > article > div > article > section > article > div > section.css-1g6h5ls > table").evaluate("element => element.outerHTML")
-    df = pd.read_html(StringIO(tables), header=0)[0]
-    #print(df)
-    df.to_csv(f'data/kovo_men_{type}.csv',index=False, encoding='utf-8')
-    # ---------------------
-    context.close()
-    browser.close()
-
-
-with sync_playwright() as playwright:
-    for type in types:
-        kovo_ext(playwright, type)
+types = ['오픈공격', '시간차공격', '이동공격', '후위공격', '속공', '퀵오픈']
+genders = ['남자부', '여자부']
+SEASON = DEFAULT_SEASON
+ROUNDS = DEFAULT_ROUNDS
+MAX_WORKERS = 4
+
+# 출력 파일 접두어 (data/kovo_men_속공.csv 등)
+FILE_PREFIX = {'남자부': 'kovo_men', '여자부': 'kovo_women'}
+
+logger = logging.getLogger("kovo")
+
+
+@dataclass(frozen=True)
+class ScrapeJob:
+    gender: str
+    type: str
+    season: str = SEASON
+    rounds: tuple = ROUNDS
+
+    @property
+    def slug(self) -> str:
+        """출력 파일/픽스처 이름 (예: kovo_men_속공) — 시즌·라운드 미포함 (key / is_default 참고)"""
+        return f"{FILE_PREFIX[self.gender]}_{self.type}"
+
+    @property
+    def is_default(self) -> bool:
+        """기본 슬라이스(SEASON, ROUNDS) — data/<slug>.csv 를 쓰는 유일한 슬라이스"""
+        return (self.season, tuple(self.rounds)) == (SEASON, tuple(ROUNDS))
+
+    @property
+    def round_key(self) -> str:
+        return store.round_key(self.rounds)
+
+    @property
+    def key(self) -> str:
+        """지문 기록 키 (시즌/라운드 슬라이스 구분)"""
+        return f"{self.season}|{self.round_key}|{self.slug}"
+
+
+def round_slices(rounds=ROUNDS, per_round=False) -> list:
+    """(1, 6) → [(1, 6)] 또는 per_round 이면 [(1, 1), (2, 2), …, (6, 6)]"""
+    start, end = rounds
+    return [(r, r) for r in range(start, end + 1)] if per_round else [(start, end)]
+
+
+def make_jobs(genders=genders, types=types, seasons=(SEASON,), rounds=ROUNDS, per_round=False):
+    if isinstance(seasons, str):
+        seasons = [seasons]
+    return [ScrapeJob(g, t, season, rs)
+            for season in seasons for rs in round_slices(rounds, per_round)
+            for g in genders for t in types]
+
+
+# ============================ 페이지 조작 ============================
+async def _select_query(page, job: ScrapeJob) -> None:
+    """STATS > 선수 기록 에서 성별/시즌/라운드/공격유형 선택 후 조회"""
+    await page.goto(f"{KOVO_URL}/KOVO")
+    await page.get_by_role("button", name="STATS").click()
+    await page.get_by_role("tab", name="선수 기록").click()
+    if job.gender == '여자부':
+        await page.locator("label").filter(has_text="여자부").click()
+    # 시즌
+    await page.locator(".ant-select-selector").first.click()
+    await page.get_by_title(job.season).locator("div").click()
+    # 라운드 범위 (시작/끝 셀렉터 순서)
+    round_selects = page.locator(".ant-select-selector").filter(has_text=re.compile(r"^\d+ Round$"))
+    start, end = job.rounds
+    for nth, rnd in ((0, start), (1, end)):
+        await round_selects.nth(nth).click()
+        await page.get_by_title(f"{rnd} Round").locator("div").click()
+    # 공격유형
+    await page.locator(".hidden > .ant-select > .ant-select-selector").first.click()
+    await page.get_by_title(job.type).locator("div").click()
+    await page.get_by_role("button", name="기록 보기").click()
+    await page.wait_for_load_state("networkidle")
+
+
+# ============================ 테이블 파싱 ============================
+# 기록 테이블 헤더 = store.RAW_SCHEMA (공격유형별 페이지는 순서/전체팀 으로 표기)
+HEADER_ALIASES = {"순서": "순위", "전체팀": "팀"}
+
+# 셀 텍스트만 배열로 (녹화할 때만 outerHTML 도 함께)
+_CELLS_JS = """(table, withHtml) => {
+    const rows = Array.from(table.rows, r => Array.from(r.cells, c => c.textContent.trim()));
+    return {header: rows[0] || [], rows: rows.slice(1), html: withHtml ? table.outerHTML : null};
+}"""
+
+
+class SchemaMismatch(ValueError):
+    """기록 테이블이 예상 스키마와 다름 (헤더 또는 값 형식)"""
+
+
+def _column(values: list, dtype: pa.DataType) -> np.ndarray:
+    if pa.types.is_string(dtype):
+        return np.asarray(values, dtype=object)
+    text = np.asarray(values, dtype=str)
+    if any("," in v for v in values):
+        text = np.char.replace(text, ",", "")
+    try:
+        return text.astype(np.int64 if pa.types.is_integer(dtype) else np.float64)
+    except ValueError as e:
+        raise SchemaMismatch(str(e)) from None
+
+
+def build_table(header: list, rows: list) -> pd.DataFrame:
+    """셀 텍스트 → 스키마 타입의 DataFrame (헤더 이름은 페이지 표기 그대로)"""
+    expected = store.RAW_SCHEMA.names
+    if [HEADER_ALIASES.get(h, h) for h in header] != expected:
+        raise SchemaMismatch(f"헤더 {header} ≠ {expected}")
+    if any(len(row) != len(header) for row in rows):
+        raise SchemaMismatch("행마다 셀 수가 다름")
+    columns = list(zip(*rows)) if rows else [()] * len(header)
+    return pd.DataFrame({name: _column(list(values), field.type)
+                         for name, values, field in zip(header, columns, store.RAW_SCHEMA)})
+
+
+def parse_table(html: str) -> pd.DataFrame:
+    """기록 테이블 HTML → DataFrame (첫 행 = 헤더, pd.read_html 추론 — 스키마 불일치 시 대체 경로)"""
+    return pd.read_html(StringIO(html), header=0)[0]
+
+
+def _cell_text(cell) -> str:
+    return ((cell.text or "") if len(cell) == 0 else "".join(cell.itertext())).strip()
+
+
+def table_cells(html: str) -> tuple:
+    """HTML(페이지 또는 테이블) 첫 테이블의 (헤더, 행들) 셀 텍스트
+
+    lxml.html 요소 클래스 없이 etree 로 바로 (셀 수만큼 생기는 요소 객체 비용이 작음)
+    """
+    root = etree.fromstring(html, etree.HTMLParser())   # 파서는 스레드마다 따로
+    table = next(root.iter("table"), None) if root is not None else None
+    if table is None:
+        raise SchemaMismatch("테이블 없음")
+    rows = [[_cell_text(cell) for cell in tr if cell.tag in ("th", "td")] for tr in table.iter("tr")]
+    return (rows[0], rows[1:]) if rows else ([], [])
+
+
+def _schema_warning(job: "ScrapeJob", error: SchemaMismatch) -> None:
+    logger.warning("스키마 불일치 (%s): %s → read_html 로 대체", job.key, error)
+
+
+def read_table(job: "ScrapeJob", html: str) -> pd.DataFrame:
+    """HTML → 스키마 변환, 실패하면 경고 후 read_html"""
+    try:
+        return build_table(*table_cells(html))
+    except SchemaMismatch as e:
+        _schema_warning(job, e)
+        return parse_table(html)
+
+
+# ============================ 수집 ============================
+async def scrape_job(browser: Browser, job: ScrapeJob, base_url=KOVO_URL, record_dir=None) -> pd.DataFrame:
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        if base_url == KOVO_URL:
+            await _select_query(page, job)
+        else:
+            await page.goto(kovo_fixtures.fixture_url(base_url, job.season, job.round_key, job.slug))
+        # 테이블 파싱 - locator: selector copy
+        table = page.locator(TABLE_SELECTOR)
+        await table.wait_for(state="visible", timeout=TABLE_TIMEOUT_MS)
+        cells = await table.evaluate(_CELLS_JS, bool(record_dir))
+        html = cells["html"]
+        try:
+            df = build_table(cells["header"], cells["rows"])
+        except SchemaMismatch as e:
+            _schema_warning(job, e)
+            html = html or await table.evaluate("element => element.outerHTML")
+            df = parse_table(html)
+    finally:
+        await context.close()
+    if record_dir:
+        kovo_fixtures.save_fixture(record_dir, job.season, job.round_key, job.slug, html)
+    return df
+
+
+def fetch_fixture(job: ScrapeJob, base_url: str) -> pd.DataFrame:
+    """재생 서버에서 픽스처를 HTTP 로 받아 파싱 (브라우저 없음 — 파싱/저장 단계 측정용)"""
+    url = kovo_fixtures.fixture_url(base_url, job.season, job.round_key, job.slug)
+    with urllib.request.urlopen(url, timeout=TABLE_TIMEOUT_MS / 1000) as resp:
+        html = resp.read().decode("utf-8")
+    return read_table(job, html)
+
+
+async def scrape_all(jobs, base_url=KOVO_URL, max_workers=MAX_WORKERS, record_dir=None,
+                     use_browser=True) -> dict:
+    """브라우저 1개 + 작업별 context, 동시 실행 수는 max_workers 로 제한
+
+    use_browser=False: 픽스처 서버에서 HTTP 로 직접 받기 (base_url 이 재생 서버일 때만)
+    """
+    sem = asyncio.Semaphore(max_workers)
+    if not use_browser:
+        if base_url == KOVO_URL:
+            raise ValueError("브라우저 없는 수집은 픽스처 재생 서버에서만 가능합니다")
+
+        async def fetch(job):
+            async with sem:
+                return job, await asyncio.to_thread(fetch_fixture, job, base_url)
+
+        return dict(await asyncio.gather(*(fetch(job) for job in jobs)))
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+
+        async def run(job):
+            async with sem:
+                return job, await scrape_job(browser, job, base_url, record_dir)
+
+        try:
+            results = await asyncio.gather(*(run(job) for job in jobs))
+        finally:
+            await browser.close()
+    return dict(results)
+
+
+# ============================ 증분 저장 ============================
+FINGERPRINT_FILE = ".fingerprints.json"
+
+
+def table_fingerprint(df: pd.DataFrame) -> str:
+    """테이블 내용 지문 — 저장될 CSV 바이트 기준 sha256"""
+    return hashlib.sha256(df.to_csv(index=False).encode('utf-8')).hexdigest()
+
+
+def _load_fingerprints(out_dir: Path) -> dict:
+    path = out_dir / FINGERPRINT_FILE
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def save_tables(results: dict, out_dir="data", store_root=store.STORE_ROOT) -> list:
+    """지문이 바뀐(또는 파일이 없는) 테이블만 저장, 바뀐 작업 목록 반환
+
+    저장소(store/)에는 항상 추가 기록, data/<slug>.csv 는 기본 슬라이스 작업만
+    (파일명에 시즌·라운드가 없어 다른 슬라이스가 기본 슬라이스 CSV 를 덮어쓰지 않도록)
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    fingerprints = _load_fingerprints(out_dir)
+    changed = []
+    for job, df in results.items():
+        path = out_dir / f"{job.slug}.csv"
+        fp = table_fingerprint(df)
+        stored = store.latest_file("raw", store_root, season=job.season, gender=job.gender,
+                                   round=store.round_key(job.rounds), type=job.type)
+        if fingerprints.get(job.key) == fp and stored and (path.exists() or not job.is_default):
+            continue
+        if job.is_default:
+            df.to_csv(path, index=False, encoding='utf-8')
+        store.write_raw(df, job.season, job.gender, job.rounds, job.type, store_root)
+        fingerprints[job.key] = fp
+        changed.append(job)
+    (out_dir / FINGERPRINT_FILE).write_text(
+        json.dumps(fingerprints, ensure_ascii=False, indent=2, sort_keys=True), encoding='utf-8'
+    )
+    return changed
+
+
+def refresh_indices(changed: list, data_dir="data", store_root=store.STORE_ROOT) -> None:
+    """바뀐 슬라이스만 지표 재계산
+
+    기본 슬라이스: *_지표.csv / *_파워랭킹.csv / store/index / 이력 갱신 (regenerate)
+    다른 슬라이스: store/index 슬라이스별 갱신 후 리그 이력 한 번 재구성 (루트 CSV 는 그대로)
+                  6개 유형이 모두 저장소에 없으면(일부 유형만 수집) 건너뜀 — 나머지 유형 수집 후 갱신
+    """
+    slices = sorted({(job.gender, job.season, job.rounds, job.is_default) for job in changed})
+    rebuild = set()
+    for gender, season, rounds, is_default in slices:
+        if is_default:
+            regenerate(gender, data_dir, season=season, rounds=rounds, store_root=store_root)
+        elif store.has_sources(season, gender, rounds, store_root, totals=False):
+            history.update_slice(season, gender, rounds, store_root)
+            rebuild.add(gender)
+        else:
+            logger.warning("유형별 기록이 모두 있지 않아 지표 갱신 생략: %s %s %sR",
+                           gender, season, store.round_key(rounds))
+    for gender in sorted(rebuild):
+        history.rebuild_history(gender, store_root)
+
+
+# ============================ CLI ============================
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="KOVO 공격유형별 선수기록 스크래퍼",
+        epilog=f"--out-dir 의 CSV 와 *_지표.csv 는 기본 슬라이스({SEASON}, {ROUNDS[0]}~{ROUNDS[1]}R)만 기록. "
+               "다른 시즌·라운드는 --store 저장소에만 쌓이고 슬라이스 지표·추이 이력으로 반영",
+    )
+    parser.add_argument("--gender", nargs="+", default=genders, choices=genders)
+    parser.add_argument("--types", nargs="+", default=types, choices=types)
+    parser.add_argument("--season", nargs="+", default=[SEASON],
+                        help="수집 시즌 (기본 시즌 외에는 저장소에만 기록)")
+    parser.add_argument("--rounds", nargs=2, type=int, default=ROUNDS, metavar=("START", "END"),
+                        help="라운드 범위 (기본 범위 외에는 저장소에만 기록)")
+    parser.add_argument("--per-round", action="store_true",
+                        help="라운드별 슬라이스로 나눠 수집 (저장소에만 기록)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--base-url", default=KOVO_URL, help="픽스처 서버 주소 (기본: KOVO)")
+    parser.add_argument("--record", metavar="DIR", help="받은 테이블 HTML 을 픽스처로 저장")
+    parser.add_argument("--replay", metavar="DIR", help="픽스처 디렉터리를 로컬 서버로 띄워 재생")
+    parser.add_argument("--http", action="store_true", help="재생 시 브라우저 없이 HTTP 로 받기")
+    parser.add_argument("--out-dir", default="data", help="기본 슬라이스 CSV(<slug>.csv) 위치")
+    parser.add_argument("--store", default=str(store.STORE_ROOT), help="Parquet 저장소 경로")
+    parser.add_argument("--no-refresh", action="store_true", help="지표 재계산 생략")
+    parser.add_argument("--report", metavar="DIR", help="지표 재계산 후 정적 리포트(oci_report.py) 생성")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    jobs = make_jobs(args.gender, args.types, args.season, args.rounds, args.per_round)
+    started = time.perf_counter()
+    if args.replay:
+        with kovo_fixtures.serve(args.replay) as base_url:
+            results = asyncio.run(scrape_all(jobs, base_url, args.workers, use_browser=not args.http))
+    else:
+        results = asyncio.run(scrape_all(jobs, args.base_url, args.workers, record_dir=args.record))
+    scraped = time.perf_counter()
+    changed = save_tables(results, args.out_dir, Path(args.store))
+    print(f"수집 {scraped - started:.2f}s, 저장 {time.perf_counter() - scraped:.2f}s")
+    print(f"변경된 테이블: {len(changed)}/{len(jobs)}", *(job.key for job in changed))
+    if changed and not args.no_refresh:
+        try:
+            refresh_indices(changed, args.out_dir, Path(args.store))
+        except validate.ValidationError as e:
+            raise SystemExit(str(e))
+        if args.report:
+            import oci_report
+
+            print(f"리포트 {oci_report.build_report(args.report)}페이지 → {args.report}")
+
+
+if __name__ == "__main__":
+    main()
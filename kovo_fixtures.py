@@ -0,0 +1,113 @@
+# kovo_fixtures.py
+# ---------------------------------------------------------
+# KOVO 스크래퍼 녹화/재생 픽스처
+# - 녹화: 실제 사이트에서 받은 기록 테이블 HTML 을 작업(시즌/라운드/리그/유형)별 파일로 저장
+#     fixtures/<시즌>/<라운드>/<slug>.html  (예: fixtures/도드람 2024-2025 V-리그/1-6/kovo_men_속공.html)
+#   파일은 KOVO 페이지와 같은 DOM 경로로 테이블을 감싸서 TABLE_SELECTOR 가 그대로 동작
+# - 재생: 픽스처 디렉터리를 로컬 HTTP 서버로 띄워 base_url 로 사용 (네트워크 없이 파싱~CSV 저장까지)
+# - data/*.csv 로 픽스처 생성 (녹화 없이도 CI 에서 사용)
+#
+# 사용 예)
+#   python kovo_ext.py --record fixtures                 # 실제 사이트 스크랩 + 픽스처 녹화
+#   python kovo_ext.py --replay fixtures --out-dir /tmp/out --no-refresh
+#   python kovo_fixtures.py --from-csv data --out fixtures
+#   python kovo_fixtures.py --serve fixtures --port 8765
+# ---------------------------------------------------------
+
+import argparse
+import threading
+from contextlib import contextmanager
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote
+
+import pandas as pd
+
+# KOVO 페이지의 테이블 위치와 같은 DOM 경로 (kovo_ext.TABLE_SELECTOR)
+_PAGE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{title}</title></head>
+<body><div id="root"><article><div><article><section><article><div>
+<section class="css-1g6h5ls">
+{table}
+</section>
+</div></article></section></article></div></article></div></body></html>
+"""
+
+
+def fixture_path(season: str, round_key: str, slug: str) -> Path:
+    """픽스처 상대 경로 (디스크)"""
+    return Path(season) / round_key / f"{slug}.html"
+
+
+def fixture_url(base_url: str, season: str, round_key: str, slug: str) -> str:
+    rel = "/".join(quote(part) for part in fixture_path(season, round_key, slug).parts)
+    return f"{base_url.rstrip('/')}/{rel}"
+
+
+def save_fixture(root, season: str, round_key: str, slug: str, table_html: str) -> Path:
+    """테이블 outerHTML → KOVO DOM 경로로 감싼 픽스처 파일"""
+    path = Path(root) / fixture_path(season, round_key, slug)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(_PAGE.format(title=slug, table=table_html), encoding="utf-8")
+    return path
+
+
+# ============================ 재생 서버 ============================
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve(root, host="127.0.0.1", port=0):
+    """픽스처 디렉터리를 정적 HTTP 서버로 (백그라운드 스레드), base_url 을 넘겨줌"""
+    handler = partial(_QuietHandler, directory=str(root))
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# ============================ CSV → 픽스처 ============================
+def fixtures_from_csv(data_dir="data", out_dir="fixtures", jobs=None) -> list:
+    """data/<slug>.csv 를 KOVO 테이블 HTML 로 변환 (녹화 없이 재생 테스트용, CSV 가 있는 기본 슬라이스만)"""
+    from kovo_ext import make_jobs
+    from metrics import store
+
+    written = []
+    for job in jobs or make_jobs():
+        csv = Path(data_dir) / f"{job.slug}.csv"
+        if not job.is_default or not csv.exists():
+            continue
+        df = pd.read_csv(csv, encoding="utf-8-sig")
+        written.append(save_fixture(out_dir, job.season, store.round_key(job.rounds), job.slug,
+                                    df.to_html(index=False, border=0)))
+    return written
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="KOVO 스크래퍼 픽스처 생성/재생 서버")
+    parser.add_argument("--from-csv", metavar="DATA_DIR", help="data/*.csv 로 픽스처 생성")
+    parser.add_argument("--out", default="fixtures")
+    parser.add_argument("--serve", metavar="FIXTURE_DIR", help="픽스처 디렉터리를 HTTP 로 제공")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+    if args.from_csv:
+        written = fixtures_from_csv(args.from_csv, args.out)
+        print(f"픽스처 {len(written)}개 → {args.out}")
+    if args.serve:
+        with serve(args.serve, port=args.port) as base_url:
+            print(f"재생 서버: {base_url} (Ctrl+C 로 종료)")
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                pass
+
+
+if __name__ == "__main__":
+    main()
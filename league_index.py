@@ -0,0 +1,286 @@
+# league_index.py
+# ---------------------------------------------------------
+# 리그 단위 사전 계산 인덱스 (대시보드 뷰 조회용)
+# - 선수 → 행 위치, OCI 내림차순 순위 배열, 팀별 행/순위 배열,
+#   팀별 Top10 인원, 레이더 축 범위를 데이터 로드 시 한 번만 계산
+# - 재실행마다 하던 boolean mask 필터 / sort_values / value_counts /
+#   nanmin·nanmax 를 O(1)·O(N) 조회로 대체
+# - 가중치 실험: 지표 행렬(선수 × ADI/AER/ER/AEI)을 한 번 만들어 두고 OCI = 행렬 @ 가중치 벡터
+# - 유사 선수 검색: ADI/AER/ER/AEI 재표준화 벡터의 KDTree (처음 조회할 때 한 번 구성)
+# - 이름 검색: 접두사·초성·오타 검색 인덱스 (player_search, 처음 검색할 때 한 번 구성)
+#   사이드바 선택지는 전체 명단 대신 검색 결과 / OCI 상위 OPTION_LIMIT 명만
+# ---------------------------------------------------------
+
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from metrics.engine import standardize, weight_vector
+from player_search import SEARCH_LIMIT, SearchIndex
+
+ALL_TEAMS = "전체"
+RADAR_COLS = ["ADI", "AER", "ER", "AEI"]
+RANK_COLS = ["선수", "팀", "OCI"]
+SIMILAR_COLS = ["선수", "팀", "거리", *RADAR_COLS, "OCI"]
+REWEIGHT_COLS = ["순위", "선수", "팀", "OCI", "기존 OCI", "기존 순위", "변동"]
+OPTION_LIMIT = 200      # 검색어가 없을 때 선택지 상한 (넘으면 OCI 상위 순)
+
+
+def _radar_range(values: np.ndarray) -> tuple:
+    """데이터 기반 레이더 축 범위 (여백 포함)"""
+    if values.size == 0 or np.isnan(values).all():
+        return -3.0, 3.0
+    lo, hi = float(np.nanmin(values)), float(np.nanmax(values))
+    pad = max(0.5, (hi - lo) * 0.1)
+    return lo - pad, hi + pad
+
+
+class NeighborIndex:
+    """선수 지표 벡터 최근접 이웃 (scipy cKDTree, 유클리드 거리)
+
+    지표를 리그 안에서 다시 표준화해 축별 스케일을 맞춤 (v1 의 0~1 정규화 데이터도 동일 기준)
+    지표에 결측이 있는 선수는 제외
+    """
+
+    def __init__(self, df: pd.DataFrame, cols=RADAR_COLS):
+        from scipy.spatial import cKDTree   # sklearn.neighbors 보다 import 가 훨씬 가벼움
+
+        x = df[list(cols)].to_numpy(dtype=float)
+        self.rows = np.flatnonzero(~np.isnan(x).any(axis=1) & df["선수"].notna().to_numpy())
+        self.vectors = standardize(x[self.rows])
+        self.slot = {pos: i for i, pos in enumerate(self.rows)}   # 행 위치 → 트리 안 위치
+        self.tree = cKDTree(self.vectors) if len(self.rows) else None
+
+    def query(self, pos: int, k: int) -> tuple:
+        """행 위치 pos 의 이웃 k명 → (행 위치 배열, 거리 배열), 자기 자신 제외"""
+        i = self.slot.get(pos)
+        if i is None or self.tree is None:
+            return np.empty(0, dtype=int), np.empty(0)
+        dist, ind = self.tree.query(self.vectors[i], k=[*range(1, min(k + 1, len(self.rows)) + 1)])
+        keep = ind != i
+        return self.rows[ind[keep][:k]], dist[keep][:k]
+
+
+@dataclass(frozen=True)
+class LeagueIndex:
+    df: pd.DataFrame                    # 원본 지표 (모든 세션 공유, 읽기 전용)
+    teams: list                         # 정렬된 팀 목록
+    row_of: dict                        # 선수 → 첫 행 위치
+    rank_order: np.ndarray              # OCI 내림차순 행 위치 (선수/팀/OCI 결측 제외)
+    team_rows: dict                     # 팀 → 행 위치 (원본 순서)
+    team_rank_order: dict               # 팀 → OCI 내림차순 행 위치
+    players: dict                       # 팀(또는 "전체") → 정렬된 선수 목록
+    ranges: dict                        # 팀(또는 "전체") → 레이더 축 범위
+    top10_counts: pd.DataFrame          # 리그 Top10 팀별 인원 [팀, Top10_인원]
+    league_pos: dict = field(default_factory=dict)   # 선수 → 리그 순위(1부터)
+    team_pos: dict = field(default_factory=dict)     # 선수 → 팀 내 순위(1부터)
+    version: tuple = ()                 # 데이터 버전 (파일 서명) — 그림 캐시 키
+
+    # ----------------------------- 조회 -----------------------------
+    def view(self, team=ALL_TEAMS) -> pd.DataFrame:
+        """팀 필터 뷰 ("전체"면 원본 그대로, 팀은 처음 한 번 잘라 모든 세션 공유 — 읽기 전용)"""
+        if team == ALL_TEAMS:
+            return self.df
+        hit = self._team_views.get(team)
+        if hit is None:
+            hit = self._team_views[team] = self.df.iloc[self.team_rows.get(team, np.empty(0, dtype=int))]
+        return hit
+
+    @cached_property
+    def _team_views(self) -> dict:
+        return {}   # 팀 → 팀 행만 잘라낸 DF
+
+    def row(self, player):
+        """선수 행 (없으면 None)"""
+        pos = self.row_of.get(player)
+        return None if pos is None else self.df.iloc[pos]
+
+    def has_player(self, player, team=ALL_TEAMS) -> bool:
+        pos = self.row_of.get(player)
+        if pos is None:
+            return False
+        return team == ALL_TEAMS or self.df["팀"].iat[pos] == team
+
+    def rank_rows(self, team=ALL_TEAMS) -> np.ndarray:
+        """OCI 내림차순 행 위치 (팀 필터)"""
+        return self.rank_order if team == ALL_TEAMS else self.team_rank_order.get(team, np.empty(0, dtype=int))
+
+    def ranking(self, team=ALL_TEAMS, top_n=None, bottom=False) -> pd.DataFrame:
+        """OCI 내림차순 [선수, 팀, OCI]
+
+        top_n: 상위 n명만 (bottom 이면 하위 n명, 낮은 순) — 잘라낸 행만 복사
+        """
+        order = self.rank_rows(team)
+        if top_n is not None:
+            order = order[::-1][:top_n] if bottom else order[:top_n]
+        return self.df.iloc[order][RANK_COLS]
+
+    def axis_range(self, team=ALL_TEAMS) -> tuple:
+        return self.ranges.get(team, (-3.0, 3.0))
+
+    def team_players(self, team=ALL_TEAMS) -> list:
+        return self.players.get(team, [])
+
+    def league_rank(self, player) -> tuple:
+        """(리그 순위, 리그 인원) — 순위 없으면 (None, 인원)"""
+        return self.league_pos.get(player), len(self.rank_order)
+
+    def team_rank(self, player) -> tuple:
+        """(팀 내 순위, 팀 인원) — 순위 없으면 (None, 0)"""
+        pos = self.row_of.get(player)
+        if pos is None:
+            return None, 0
+        team = self.df["팀"].iat[pos]
+        return self.team_pos.get(player), len(self.team_rank_order.get(team, ()))
+
+    # ----------------------------- 가중치 실험 -----------------------------
+    @cached_property
+    def metric_matrix(self) -> np.ndarray:
+        """선수 × [ADI, AER, ER, AEI] (float, 행 = df 행 위치)"""
+        return self.df[RADAR_COLS].to_numpy(dtype=float)
+
+    @cached_property
+    def _ranked(self) -> dict:
+        return {}   # 팀(또는 "전체") → (지표 행렬, 선수, 팀, 기존 OCI) — 기존 순위 순서
+
+    def _ranked_arrays(self, team) -> tuple:
+        hit = self._ranked.get(team)
+        if hit is None:
+            rows = self.rank_rows(team)
+            hit = self._ranked[team] = (
+                self.metric_matrix[rows],
+                self.df["선수"].to_numpy(dtype=object)[rows],
+                self.df["팀"].to_numpy(dtype=object)[rows],
+                self.df["OCI"].to_numpy(dtype=float)[rows],
+            )
+        return hit
+
+    def reweighted_ranking(self, weights, team=ALL_TEAMS, top_n=None) -> pd.DataFrame:
+        """가중치 {ADI, AER, ER, AEI} 로 OCI 재계산 → 내림차순 [순위, 선수, 팀, OCI, 기존 OCI, 기존 순위, 변동]
+
+        기존 순위 대상만 행렬-벡터 곱 한 번 + 정렬 (top_n 이면 부분 정렬), DataFrame 은 결과에만 생성
+        """
+        mat, names, teams, prev = self._ranked_arrays(team)
+        oci = mat @ weight_vector(weights)
+        valid = np.flatnonzero(~np.isnan(oci))
+        key = -oci[valid]
+        if top_n is not None and top_n < len(valid):
+            part = np.argpartition(key, top_n - 1)[:top_n]
+            order = valid[part[np.argsort(key[part], kind="stable")]]
+        else:
+            order = valid[np.argsort(key, kind="stable")]
+        new_rank = np.arange(1, len(order) + 1)
+        return pd.DataFrame({
+            "순위": new_rank,
+            "선수": names[order],
+            "팀": teams[order],
+            "OCI": oci[order],
+            "기존 OCI": prev[order],
+            "기존 순위": order + 1,       # 배열이 기존 OCI 내림차순
+            "변동": order + 1 - new_rank,  # + : 상승
+        }, columns=REWEIGHT_COLS)
+
+    # ----------------------------- 유사 선수 -----------------------------
+    @cached_property
+    def neighbors(self) -> NeighborIndex:
+        return NeighborIndex(self.df)
+
+    def similar(self, player, k=5) -> pd.DataFrame:
+        """지표 벡터가 가장 가까운 선수 k명 [선수, 팀, 거리, ADI, AER, ER, AEI, OCI]"""
+        pos = self.row_of.get(player)
+        if pos is None:
+            return pd.DataFrame(columns=SIMILAR_COLS)
+        rows, dist = self.neighbors.query(pos, k)
+        cols = [c for c in SIMILAR_COLS if c in self.df.columns]
+        out = self.df.iloc[rows][cols].reset_index(drop=True)
+        out.insert(2, "거리", dist)
+        return out
+
+    # ----------------------------- 이름 검색 -----------------------------
+    @cached_property
+    def search_index(self) -> SearchIndex:
+        """전체 선수 이름 검색 인덱스 (같은 단계 안에서는 리그 OCI 순위순)"""
+        names = self.players.get(ALL_TEAMS, [])
+        unranked = len(self.rank_order) + 1
+        return SearchIndex(names, [self.league_pos.get(n, unranked) for n in names])
+
+    @cached_property
+    def _team_masks(self) -> dict:
+        return {}   # 팀 → search_index 이름 중 그 팀 선수 (bool 배열)
+
+    def _team_mask(self, team):
+        if team == ALL_TEAMS:
+            return None
+        hit = self._team_masks.get(team)
+        if hit is None:
+            hit = self._team_masks[team] = np.isin(self.search_index.names, self.team_players(team))
+        return hit
+
+    def search_players(self, query, team=ALL_TEAMS, limit=SEARCH_LIMIT) -> list:
+        """이름/초성/오타 검색 (팀 필터) → 순위순 선수 목록"""
+        return self.search_index.search(query, limit, self._team_mask(team))
+
+    def player_options(self, team=ALL_TEAMS, query="", keep=()) -> list:
+        """선택 위젯 선택지: 검색어가 있으면 검색 결과, 없으면 팀 선수 (OPTION_LIMIT 명 넘으면 OCI 상위)
+
+        keep: 이미 고른 선수 (선택지가 바뀌어도 선택 유지되도록 앞에 둠)
+        """
+        if query.strip():
+            found = self.search_players(query, team)
+        else:
+            found = self.team_players(team)
+            if len(found) > OPTION_LIMIT:
+                found = self.df["선수"].to_numpy(dtype=object)[self.rank_rows(team)[:OPTION_LIMIT]].tolist()
+        return list(dict.fromkeys([*keep, *found]))
+
+
+def build_league_index(df: pd.DataFrame, version=()) -> LeagueIndex:
+    """지표 DF → LeagueIndex (데이터 버전당 한 번)"""
+    names = df["선수"].to_numpy(dtype=object)
+    team_col = df["팀"].to_numpy(dtype=object)
+    oci = df["OCI"].to_numpy(dtype=float)
+
+    row_of = {}
+    for i, name in enumerate(names):
+        if pd.notna(name):
+            row_of.setdefault(name, i)
+
+    # OCI 순위: 선수/팀/OCI 모두 있는 행만, 동점은 원래 순서 유지
+    rankable = np.flatnonzero(pd.notna(names) & pd.notna(team_col) & ~np.isnan(oci))
+    rank_order = rankable[np.argsort(-oci[rankable], kind="stable")]
+
+    teams = sorted(pd.unique(team_col[pd.notna(team_col)]).tolist())
+    codes = pd.Index(teams).get_indexer(team_col)
+    team_rows = {t: np.flatnonzero(codes == k) for k, t in enumerate(teams)}
+    rank_codes = codes[rank_order]
+    team_rank_order = {t: rank_order[rank_codes == k] for k, t in enumerate(teams)}
+
+    radar_cols = [c for c in RADAR_COLS if c in df.columns]
+    radar = df[radar_cols].to_numpy(dtype=float)
+    ranges = {ALL_TEAMS: _radar_range(radar)}
+    ranges.update({t: _radar_range(radar[rows]) for t, rows in team_rows.items()})
+
+    players = {ALL_TEAMS: sorted(pd.unique(names[pd.notna(names)]).tolist())}
+    for t, rows in team_rows.items():
+        sub = names[rows]
+        players[t] = sorted(pd.unique(sub[pd.notna(sub)]).tolist())
+
+    league_pos = {}
+    for r, pos in enumerate(rank_order, start=1):
+        league_pos.setdefault(names[pos], r)
+    team_pos = {}
+    for order in team_rank_order.values():
+        for r, pos in enumerate(order, start=1):
+            team_pos.setdefault(names[pos], r)
+
+    top10_counts = pd.Series(team_col[rank_order[:10]]).value_counts().reset_index()
+    top10_counts.columns = ["팀", "Top10_인원"]
+
+    return LeagueIndex(
+        df=df, teams=teams, row_of=row_of, rank_order=rank_order,
+        team_rows=team_rows, team_rank_order=team_rank_order, players=players,
+        ranges=ranges, top10_counts=top10_counts,
+        league_pos=league_pos, team_pos=team_pos, version=tuple(version),
+    )
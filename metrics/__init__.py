@@ -0,0 +1,53 @@
+"""OCI 지표 계산 패키지 (노트북 파이프라인의 벡터화 버전)
+
+    from metrics import compute_indices, regenerate
+    python -m metrics --gender 남자부 여자부
+"""
+
+from .engine import (
+    ATTACK_TYPES,
+    INDEX_COLS,
+    OUTPUT_COLS,
+    WEIGHTS,
+    attack_diversity,
+    attempt_matrix,
+    compute_indices,
+    derive_attack,
+    derive_team,
+    power_ranking,
+    standardize,
+    weight_vector,
+)
+from .sources import DEFAULT_ROUNDS, DEFAULT_SEASON, LEAGUES, load_matches, load_sources, output_paths
+from . import bootstrap, history, rolling, store, teams, validate, weights
+from .cli import import_csv, regenerate
+
+__all__ = [
+    "ATTACK_TYPES",
+    "INDEX_COLS",
+    "OUTPUT_COLS",
+    "WEIGHTS",
+    "DEFAULT_ROUNDS",
+    "DEFAULT_SEASON",
+    "LEAGUES",
+    "attack_diversity",
+    "attempt_matrix",
+    "compute_indices",
+    "derive_attack",
+    "derive_team",
+    "power_ranking",
+    "standardize",
+    "weight_vector",
+    "load_matches",
+    "load_sources",
+    "output_paths",
+    "bootstrap",
+    "history",
+    "import_csv",
+    "regenerate",
+    "rolling",
+    "store",
+    "teams",
+    "validate",
+    "weights",
+]
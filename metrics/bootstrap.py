@@ -0,0 +1,114 @@
+# metrics/bootstrap.py
+# ---------------------------------------------------------
+# OCI / 순위 부트스트랩 신뢰구간
+# - 선수별 공격 시도를 복원추출:
+#   · 유형별 시도 수  ~ Multinomial(유형 시도 합, 유형 비율)   → ADI
+#   · (성공, 범실, 기타) ~ Multinomial(시도, 결과 비율)        → ER, AEI
+#   (세트수·팀 성공률은 고정 → AER 은 변하지 않음)
+# - 복제본 묶음(B × 선수)을 한 번에 계산: 표준화 → OCI → 순위까지 배열 연산
+# - 묶음을 프로세스 풀에 나눠 실행 (묶음마다 독립 시드 → 작업자 수와 무관하게 같은 결과)
+# ---------------------------------------------------------
+
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .engine import WEIGHTS, attack_diversity, league_arrays, raw_indices, standardize, weight_vector
+
+N_BOOT = 1000
+CHUNK = 100                 # 작업 하나당 복제본 수
+LEVEL = 0.95
+CI_COLS = ["선수", "팀", "OCI", "OCI_하한", "OCI_상한", "순위", "순위_하한", "순위_상한"]
+
+
+def _standardize_rows(x: np.ndarray) -> np.ndarray:
+    """복제본별(축 1 = 선수) z-score — engine.standardize 와 같은 규칙"""
+    with np.errstate(invalid="ignore"):
+        mean = np.nanmean(x, axis=1, keepdims=True)
+        std = np.nanstd(x, axis=1, keepdims=True)
+    std[std == 0] = 1.0
+    return (x - mean) / std
+
+
+def ranks(oci: np.ndarray) -> np.ndarray:
+    """OCI 내림차순 순위(1부터, 마지막 축 기준), NaN 은 NaN"""
+    key = np.where(np.isnan(oci), np.inf, -oci)
+    order = np.argsort(key, axis=-1, kind="stable")
+    out = np.empty(oci.shape, dtype=float)
+    np.put_along_axis(out, order, np.broadcast_to(np.arange(1, oci.shape[-1] + 1, dtype=float), oci.shape), axis=-1)
+    out[np.isnan(oci)] = np.nan
+    return out
+
+
+def _replicates(arrays: dict, n: int, seed, weights=WEIGHTS) -> tuple:
+    """복제본 n 개 → (OCI[n × 선수], 순위[n × 선수]) — float32"""
+    rng = np.random.default_rng(seed)
+    types = np.nan_to_num(arrays["types"])
+    n_types = types.sum(axis=1)
+    p_type = np.divide(types, n_types[:, None], out=np.full_like(types, 1 / types.shape[1]),
+                       where=n_types[:, None] > 0)
+    type_bs = rng.multinomial(n_types.astype(np.int64), p_type, size=(n, len(types)))
+
+    tries = np.nan_to_num(arrays["tries"])
+    success = np.clip(np.nan_to_num(arrays["success"]), 0, tries)
+    faults = np.clip(np.nan_to_num(arrays["faults"]), 0, tries - success)
+    p_out = np.column_stack([success, faults, tries - success - faults])
+    p_out = np.divide(p_out, tries[:, None], out=np.tile([0.0, 0.0, 1.0], (len(tries), 1)),
+                      where=tries[:, None] > 0)
+    out_bs = rng.multinomial(tries.astype(np.int64), p_out, size=(n, len(tries)))
+
+    adi = attack_diversity(type_bs.reshape(-1, types.shape[1]).astype(float)).reshape(n, -1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = out_bs[..., 0] * 100 / tries
+    raw = raw_indices(adi, arrays["sets"], arrays["tries"], out_bs[..., 1], rate, arrays["team_rate"])
+    oci = _standardize_rows(raw) @ weight_vector(weights)
+    return oci.astype(np.float32), ranks(oci).astype(np.float32)
+
+
+def _run_chunk(args) -> tuple:
+    return _replicates(*args)
+
+
+def bootstrap_intervals(type_tables: dict, attack: pd.DataFrame, team: pd.DataFrame,
+                        n_boot=N_BOOT, level=LEVEL, weights=WEIGHTS, seed=0,
+                        workers=None, chunk=CHUNK) -> pd.DataFrame:
+    """원시 테이블 → 선수별 OCI·순위 신뢰구간 [선수, 팀, OCI, OCI_하한, OCI_상한, 순위, 순위_하한, 순위_상한]
+
+    선수 순서는 compute_indices 와 동일 (선수명 정렬)
+    workers: 프로세스 수 (None 이면 CPU 수, 1 이면 현재 프로세스에서 실행)
+    """
+    arrays = league_arrays(type_tables, attack, team)
+    raw = raw_indices(attack_diversity(arrays["types"]), arrays["sets"], arrays["tries"],
+                      arrays["faults"], arrays["rate"], arrays["team_rate"])
+    point = standardize(raw) @ weight_vector(weights)
+
+    sizes = [min(chunk, n_boot - start) for start in range(0, n_boot, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(arrays, n, s, weights) for n, s in zip(sizes, seeds)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        results = [_run_chunk(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            results = list(pool.map(_run_chunk, tasks))
+    oci_bs = np.concatenate([r[0] for r in results])
+    rank_bs = np.concatenate([r[1] for r in results])
+
+    q = [(1 - level) / 2 * 100, (1 + level) / 2 * 100]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)   # 복제본이 전부 NaN 인 선수
+        oci_lo, oci_hi = np.nanpercentile(oci_bs, q, axis=0)
+        rank_lo, rank_hi = np.nanpercentile(rank_bs, q, axis=0)
+    return pd.DataFrame({
+        "선수": arrays["players"],
+        "팀": arrays["teams"],
+        "OCI": point,
+        "OCI_하한": oci_lo.astype(float),
+        "OCI_상한": oci_hi.astype(float),
+        "순위": ranks(point),
+        "순위_하한": rank_lo.astype(float),
+        "순위_상한": rank_hi.astype(float),
+    }, columns=CI_COLS)
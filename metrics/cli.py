@@ -0,0 +1,94 @@
+# metrics/cli.py
+# ---------------------------------------------------------
+# *_지표.csv / *_파워랭킹.csv 재생성 CLI (노트북 재실행 대체)
+#   python -m metrics                       # 남자부 + 여자부
+#   python -m metrics --gender 여자부 --data-dir data --out-dir .
+#   python -m metrics --import-csv          # 기존 data/*.csv 를 Parquet 저장소로 이관
+#   python -m metrics --history             # 저장소의 모든 시즌·라운드 슬라이스 지표/이력 갱신
+#   python -m metrics --bootstrap 1000 --workers 8   # 신뢰구간 복제본 수 / 프로세스 수 (기본 0 = 생략)
+#   python -m metrics --window 15 --window-unit set  # 경기별 기록이 있으면 최근 15세트 구간 지표 (0 이면 생략)
+# - 원시 데이터는 Parquet 저장소(store/)에 유형별 + 공격종합 + 팀 파티션이 모두 있으면 우선 사용, 없으면 CSV
+#   (공개 합계를 유형별 합산으로 대신하지 않음 — 선수 구성·성공률이 달라짐)
+# - 산출 지표는 CSV 와 저장소(store/index) 양쪽에 기록, 팀 집계/신뢰구간(--bootstrap N 일 때만)은 저장소에만
+# - 경기별 기록(data/*_matches.csv)이 있으면 최근 구간 지표(metrics.rolling)를 {리그}_구간지표.csv 로
+# - 계산 전에 원시 기록 검증(metrics.validate) → 보고서는 store/validation, error 면 아무것도 쓰지 않고 중단
+# ---------------------------------------------------------
+
+import argparse
+from pathlib import Path
+
+from . import bootstrap, history, rolling, store, validate
+from .engine import power_ranking
+from .teams import team_aggregates
+from .sources import DEFAULT_ROUNDS, DEFAULT_SEASON, LEAGUES, load_matches, load_sources, output_paths, rolling_path
+
+
+def import_csv(gender: str, data_dir="data", season=DEFAULT_SEASON, rounds=DEFAULT_ROUNDS,
+               store_root=store.STORE_ROOT) -> None:
+    """CSV 원시 기록(유형별/공격종합/팀)을 저장소 파티션으로 복사"""
+    type_tables, attack, team = load_sources(gender, data_dir)
+    for attack_type, df in type_tables.items():
+        store.write_raw(df, season, gender, rounds, attack_type, store_root)
+    store.write_raw(attack, season, gender, rounds, store.ATTACK_TOTAL, store_root)
+    store.write_team(team, season, gender, rounds, store_root)
+
+
+def regenerate(gender: str, data_dir="data", out_dir=".", season=DEFAULT_SEASON,
+               rounds=DEFAULT_ROUNDS, store_root=store.STORE_ROOT, n_boot=0, workers=None,
+               window=rolling.WINDOW, window_unit="match"):
+    """원시 기록 → 지표/파워랭킹(+ 신뢰구간, 구간 지표) 저장, (지표 DF, 파워랭킹 DF) 반환
+
+    n_boot: 부트스트랩 복제본 수 — 프로세스 풀을 쓰는 무거운 작업이라 기본은 생략 (스크랩 갱신 포함)
+    """
+    if store.has_sources(season, gender, rounds, store_root):
+        sources = store.load_sources(season, gender, rounds, store_root)
+    else:
+        sources = load_sources(gender, data_dir)
+    sources, indices = validate.compute_validated(*sources, season, gender, rounds, store_root)
+    ranking = power_ranking(indices)
+    index_path, ranking_path = output_paths(gender, out_dir)
+    indices.to_csv(index_path, encoding='utf-8', index=False)
+    ranking.to_csv(ranking_path, encoding='utf-8')
+    store.write_index(indices, season, gender, rounds, store_root)
+    store.write_team_agg(team_aggregates(*sources, indices), season, gender, rounds, store_root)
+    if n_boot:
+        intervals = bootstrap.bootstrap_intervals(*sources, n_boot=n_boot, workers=workers)
+        store.write_ci(intervals, season, gender, rounds, store_root)
+    matches = load_matches(gender, data_dir) if window else None
+    if matches is not None:
+        form = rolling.rolling_indices(matches, window, window_unit)
+        form.to_csv(rolling_path(gender, out_dir), encoding='utf-8', index=False)
+    history.rebuild_history(gender, store_root)
+    return indices, ranking
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="OCI 지표/파워랭킹 재계산")
+    parser.add_argument("--gender", nargs="+", default=list(LEAGUES), choices=list(LEAGUES))
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--out-dir", default=".")
+    parser.add_argument("--store", default=str(store.STORE_ROOT), help="Parquet 저장소 경로")
+    parser.add_argument("--import-csv", action="store_true", help="CSV 원시 기록을 저장소로 이관")
+    parser.add_argument("--history", action="store_true", help="저장소 슬라이스 지표/이력만 갱신")
+    parser.add_argument("--bootstrap", type=int, default=0, metavar="N",
+                        help=f"OCI 신뢰구간 부트스트랩 복제본 수 (기본 0 = 생략, 보통 {bootstrap.N_BOOT})")
+    parser.add_argument("--workers", type=int, default=None, help="부트스트랩 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--window", type=int, default=rolling.WINDOW,
+                        help="구간 지표 크기 (경기별 기록이 있을 때, 0 이면 생략)")
+    parser.add_argument("--window-unit", default="match", choices=rolling.UNITS, help="구간 단위: 경기 / 세트")
+    args = parser.parse_args(argv)
+    store_root = Path(args.store)
+    if args.history:
+        for season, gender, rk in history.refresh(root=store_root):
+            print(f"{gender} {season} {rk}R 갱신")
+        return
+    for gender in args.gender:
+        if args.import_csv:
+            import_csv(gender, args.data_dir, store_root=store_root)
+        try:
+            indices, _ = regenerate(gender, args.data_dir, args.out_dir, store_root=store_root,
+                                    n_boot=args.bootstrap, workers=args.workers,
+                                    window=args.window, window_unit=args.window_unit)
+        except validate.ValidationError as e:
+            raise SystemExit(f"{gender}: {e}")
+        print(f"{gender}: {len(indices)}명 → {output_paths(gender, args.out_dir)[0]}")
@@ -0,0 +1,142 @@
+# metrics/engine.py
+# ---------------------------------------------------------
+# 공격 지표(ADI, AER, ER, AEI, OCI) 벡터화 계산 엔진
+# - 노트북(*_파워랭킹.ipynb)의 concat → pivot_table → merge 단계를
+#   선수 × 공격유형 행렬 한 번으로 대체
+# - 결과는 노트북과 동일: 선수명 정렬, 표준화(모집단 표준편차) 후 가중합
+# ---------------------------------------------------------
+
+import numpy as np
+import pandas as pd
+
+ATTACK_TYPES = ('오픈공격', '시간차공격', '이동공격', '후위공격', '속공', '퀵오픈')
+INDEX_COLS = ("ADI", "AER", "ER", "AEI")
+OUTPUT_COLS = ["선수", "팀", "ADI", "AER", "ER", "AEI", "OCI"]
+
+# OCI 가중치 (ER 은 낮을수록 좋으므로 감점)
+WEIGHTS = {"ADI": 0.25, "AER": 0.25, "ER": -0.1, "AEI": 0.4}
+
+
+def weight_vector(weights=WEIGHTS) -> np.ndarray:
+    """{지표: 가중치} → INDEX_COLS 순서 벡터 (OCI = 표준화 지표 행렬 @ 벡터)"""
+    return np.array([weights[c] for c in INDEX_COLS], dtype=float)
+
+
+def attempt_matrix(type_tables: dict):
+    """공격유형별 테이블 → (선수 배열(정렬), 선수 × 유형 시도 행렬)"""
+    frames = list(type_tables.values())
+    names = np.concatenate([f["선수"].to_numpy(dtype=object) for f in frames])
+    attempts = np.concatenate([pd.to_numeric(f["시도"], errors="coerce").to_numpy(float) for f in frames])
+    type_idx = np.repeat(np.arange(len(frames)), [len(f) for f in frames])
+
+    valid = pd.notna(names)
+    players, codes = np.unique(names[valid], return_inverse=True)
+    mat = np.zeros((len(players), len(frames)))
+    np.add.at(mat, (codes, type_idx[valid]), np.nan_to_num(attempts[valid]))
+    return players, mat
+
+
+def attack_diversity(mat: np.ndarray) -> np.ndarray:
+    """ADI = -Σ p_i * log2(p_i) (총시도=0 이면 0, p_i=0 항은 무시)"""
+    total = mat.sum(axis=1, keepdims=True)
+    p = np.divide(mat, total, out=np.zeros_like(mat), where=total > 0)
+    logp = np.log2(p, out=np.zeros_like(p), where=p > 0)
+    return -(p * logp).sum(axis=1)
+
+
+def standardize(x: np.ndarray) -> np.ndarray:
+    """열별 z-score (StandardScaler 와 동일: ddof=0, NaN 무시, 분산 0 이면 0)"""
+    mean = np.nanmean(x, axis=0)
+    std = np.nanstd(x, axis=0)
+    std[std == 0] = 1.0
+    return (x - mean) / std
+
+
+def league_arrays(type_tables: dict, attack: pd.DataFrame, team: pd.DataFrame) -> dict:
+    """지표 계산용 선수별 배열 (공격종합에 있는 선수만, 선수명 정렬 순서)
+
+    players, teams, types(선수 × 유형 시도), sets, tries, success, faults, rate, team_rate
+    """
+    players, mat = attempt_matrix(type_tables)
+
+    # 공격종합에 있는 선수만 (노트북의 inner merge), 선수명 정렬 순서 유지
+    pos = pd.Index(players).get_indexer(attack["선수"])
+    rows = np.flatnonzero(pos >= 0)
+    rows = rows[np.argsort(pos[rows], kind="stable")]
+
+    tries = attack["시도"].to_numpy(float)[rows]
+    rate = attack["성공률"].to_numpy(float)[rows]
+    if "성공" in attack.columns:
+        success = pd.to_numeric(attack["성공"], errors="coerce").to_numpy(float)[rows]
+    else:
+        success = np.round(rate * tries / 100)
+    teams = attack["팀"].to_numpy(dtype=object)[rows]
+    team_rate = pd.Series(team["성공률"].to_numpy(float), index=team["팀"]).groupby(level=0).first()
+    return {
+        "players": players[pos[rows]],
+        "teams": teams,
+        "types": mat[pos[rows]],
+        "sets": attack["세트수"].to_numpy(float)[rows],
+        "tries": tries,
+        "success": success,
+        "faults": attack["범실"].to_numpy(float)[rows],
+        "rate": rate,
+        "team_rate": team_rate.reindex(teams).to_numpy(),
+    }
+
+
+def raw_indices(adi, sets, tries, faults, rate, team_rate) -> np.ndarray:
+    """표준화 전 [ADI, AER, ER, AEI] (마지막 축), 입력은 브로드캐스트 가능한 배열"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.stack(np.broadcast_arrays(
+            adi,                # ADI
+            tries / sets,       # AER = 시도 / 세트수
+            faults / tries,     # ER  = 범실 / 시도
+            rate / team_rate,   # AEI = 성공률 / 팀_성공률
+        ), axis=-1)
+
+
+def compute_indices(type_tables: dict, attack: pd.DataFrame, team: pd.DataFrame,
+                    weights=WEIGHTS) -> pd.DataFrame:
+    """원시 테이블 → [선수, 팀, ADI, AER, ER, AEI, OCI] (ADI~AEI 는 표준화 값)
+
+    type_tables: {공격유형: 선수기록 DF(선수, 시도)}
+    attack:      공격종합 선수기록 (선수, 팀, 세트수, 시도, 범실, 성공률)
+    team:        팀 공격기록 (팀, 성공률)
+    """
+    a = league_arrays(type_tables, attack, team)
+    raw = raw_indices(attack_diversity(a["types"]), a["sets"], a["tries"], a["faults"],
+                      a["rate"], a["team_rate"])
+    z = standardize(raw)
+    oci = z @ weight_vector(weights)
+
+    out = pd.DataFrame(z, columns=list(INDEX_COLS))
+    out.insert(0, "팀", a["teams"])
+    out.insert(0, "선수", a["players"])
+    out["OCI"] = oci
+    return out
+
+
+def derive_attack(type_tables: dict) -> pd.DataFrame:
+    """공격종합 기록이 없을 때 유형별 기록 합산 (세트수는 유형 중 최대값)"""
+    df = pd.concat(list(type_tables.values()), ignore_index=True)
+    attack = df.groupby("선수", sort=False).agg(
+        팀=("팀", "first"), 세트수=("세트수", "max"),
+        시도=("시도", "sum"), 성공=("성공", "sum"), 범실=("범실", "sum"),
+    ).reset_index()
+    attack["성공률"] = attack["성공"] / attack["시도"].where(attack["시도"] > 0) * 100
+    return attack
+
+
+def derive_team(attack: pd.DataFrame) -> pd.DataFrame:
+    """팀 기록이 없을 때 선수 공격종합 합산으로 팀 성공률 산출"""
+    team = attack.groupby("팀", sort=False)[["시도", "성공"]].sum().reset_index()
+    team["성공률"] = team["성공"] / team["시도"].where(team["시도"] > 0) * 100
+    return team
+
+
+def power_ranking(indices: pd.DataFrame) -> pd.DataFrame:
+    """OCI 내림차순 파워랭킹 [선수, 팀, OCI]"""
+    return (indices[["선수", "팀", "OCI"]]
+            .sort_values(by="OCI", ascending=False)
+            .reset_index(drop=True))
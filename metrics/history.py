@@ -0,0 +1,79 @@
+# metrics/history.py
+# ---------------------------------------------------------
+# 시즌 × 라운드 슬라이스별 지표 이력 (추이 뷰용 사전 집계)
+# - 슬라이스마다 store/index 에 지표, store/team_agg 에 팀 집계 저장
+#   (계산 전 검증 — 보고서는 store/validation, error 면 ValidationError)
+#   (원시 기록이 더 새로울 때만 재계산)
+#   (라운드별 슬라이스는 공격종합/팀 합계가 공개되지 않으므로 없으면 유형별 기록 합산)
+# - 리그별 전체 이력을 store/history 한 파일로 합쳐 두어
+#   대시보드는 필터만 하면 되도록 함
+# ---------------------------------------------------------
+
+import re
+
+import pandas as pd
+
+from . import store, validate
+from .engine import ATTACK_TYPES
+from .teams import team_aggregates
+
+
+def season_year(season: str) -> int:
+    """'도드람 2024-2025 V-리그' → 2024 (정렬용, 연도가 없으면 0)"""
+    m = re.search(r"(\d{4})-\d{4}", season)
+    return int(m.group(1)) if m else 0
+
+
+def competition(season: str) -> str:
+    """'도드람 2024-2025 V-리그' → '도드람 V-리그' (연도를 뺀 대회 이름 — 시즌을 이어 볼 이력 단위)"""
+    return " ".join(re.sub(r"\d{4}(-\d{4})?", " ", season).split())
+
+
+def _parse_round(rk: str) -> tuple:
+    start, end = rk.split("-")
+    return int(start), int(end)
+
+
+def update_slice(season, gender, rounds, root=store.STORE_ROOT) -> pd.DataFrame:
+    """저장소 원시 기록으로 한 슬라이스의 지표 계산 → store/index, store/team_agg"""
+    sources = store.load_sources(season, gender, rounds, root, derive=True)
+    sources, indices = validate.compute_validated(*sources, season, gender, rounds, root)
+    store.write_index(indices, season, gender, rounds, root)
+    store.write_team_agg(team_aggregates(*sources, indices), season, gender, rounds, root)
+    return indices
+
+
+def is_stale(season, gender, rounds, root=store.STORE_ROOT, types=ATTACK_TYPES) -> bool:
+    """지표/팀 집계가 없거나 원시 기록보다 오래됐는지 (part 파일명 = 기록 시각)"""
+    index = store.index_file(season, gender, rounds, root)
+    rk = store.round_key(rounds)
+    if index is None or store.latest_file("team_agg", root, season=season, gender=gender, round=rk) is None:
+        return True
+    raws = [store.latest_file("raw", root, season=season, gender=gender, round=rk, type=t)
+            for t in (*types, store.ATTACK_TOTAL)]
+    return any(f is not None and f.name > index.name for f in raws)
+
+
+def rebuild_history(gender, root=store.STORE_ROOT) -> pd.DataFrame:
+    """리그의 모든 슬라이스 지표(최신본)를 하나의 추이 테이블로 저장"""
+    hist = store.read("index", root=root, gender=gender).drop(columns="gender")
+    rounds = hist["round"].map(_parse_round)
+    hist["season_year"] = hist["season"].map(season_year)
+    hist["round_start"] = rounds.str[0]
+    hist["round_end"] = rounds.str[1]
+    hist = hist.sort_values(["season_year", "round_start", "round_end", "선수"], ignore_index=True)
+    store.write_history(hist, gender, root)
+    return hist
+
+
+def refresh(gender=None, root=store.STORE_ROOT) -> list:
+    """오래된 슬라이스만 재계산 후 해당 리그 이력 갱신, 갱신된 슬라이스 반환"""
+    updated = []
+    for season, g, rk in store.slices(gender, root):
+        rounds = _parse_round(rk)
+        if store.has_sources(season, g, rounds, root, totals=False) and is_stale(season, g, rounds, root):
+            update_slice(season, g, rounds, root)
+            updated.append((season, g, rk))
+    for g in sorted({g for _, g, _ in updated}):
+        rebuild_history(g, root)
+    return updated
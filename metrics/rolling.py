@@ -0,0 +1,206 @@
+# metrics/rolling.py
+# ---------------------------------------------------------
+# 경기별 기록 → 최근 N경기(또는 N세트) 구간 지표 (ADI, AER, ER, AEI, OCI)
+# - 시즌 누적 기록으로는 안 보이는 부진/상승 구간을 보기 위한 이동 구간 계산
+# - 입력: 선수 × 경기 한 행 (선수, 팀, 경기, 세트수, 시도, 성공, 범실, 시도_<공격유형>…)
+#   '경기' 는 정렬 가능한 경기 순서 키 (경기 번호 / 날짜)
+#   팀 경기 기록(팀, 경기, 세트수, 시도, 성공)이 없으면 선수 기록 합산 (세트수는 최대값)
+# - 구간 합은 누적합 차이 한 번 (= 새 경기 더하고 가장 오래된 경기 빼기를 모든 행에 동시에)
+#   → 선수 × 경기마다 구간을 다시 합산하는 O(경기²) 대신 O(행 수)
+# - RollingWindow: 경기 단위로 들어오는 기록을 구간에 더하고 밀어내는 실시간 버전
+#   (마지막 구간 값은 rolling_indices 의 선수별 마지막 행과 같음)
+# - 표준화는 구간 전체(모든 선수 × 경기)를 한 모집단으로 — 선수끼리, 시점끼리 비교 가능
+#   구간이 덜 찬 행(시즌 초반)은 지표를 NaN 으로 두고 표준화에서도 제외 (partial=True 면 포함)
+#
+# 사용 예)
+#   form = rolling_indices(matches, window=5)                 # 최근 5경기
+#   form = rolling_indices(matches, window=15, unit="set")    # 최근 15세트 이상
+#   live = RollingWindow(5); live.push(match_rows); live.current()
+# ---------------------------------------------------------
+
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from .engine import INDEX_COLS, WEIGHTS, attack_diversity, raw_indices, standardize, weight_vector
+from .teams import TYPE_COLS
+
+WINDOW = 5
+UNITS = ("match", "set")
+# 구간에 합산하는 컬럼 (순서 = 합계 배열의 열)
+SUM_COLS = ["세트수", "시도", "성공", "범실", *TYPE_COLS]
+TEAM_SUM_COLS = ["세트수", "시도", "성공"]
+ROLLING_COLS = ["선수", "팀", "경기", "경기수", "세트수", *INDEX_COLS, "OCI"]
+
+_SETS, _TRIES, _SUCCESS, _FAULTS = range(4)
+
+
+def _counts(df: pd.DataFrame, cols: list) -> np.ndarray:
+    return np.nan_to_num(df[cols].apply(pd.to_numeric, errors="coerce").to_numpy(float))
+
+
+def derive_team_matches(matches: pd.DataFrame) -> pd.DataFrame:
+    """팀 경기 기록이 없을 때 선수 경기 기록 합산 (세트수는 선수 중 최대값)"""
+    return matches.groupby(["팀", "경기"], sort=False).agg(
+        세트수=("세트수", "max"), 시도=("시도", "sum"), 성공=("성공", "sum"),
+    ).reset_index()
+
+
+def window_starts(groups: np.ndarray, sizes=None, window=WINDOW) -> np.ndarray:
+    """그룹별로 연속 정렬된 행 → 행마다 구간의 첫 행 (그룹 경계를 넘지 않음)
+
+    sizes 가 없으면 최근 window 행, 있으면 sizes 합이 window 이상인 가장 짧은 최근 구간
+    (그룹 기록이 모자라면 그룹 첫 행부터)
+    """
+    n = len(groups)
+    rows = np.arange(n)
+    first = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]) if n else np.empty(0, dtype=np.int64)
+    group_first = np.repeat(first, np.diff(np.r_[first, n]))
+    if sizes is None:
+        start = rows - window + 1
+    else:
+        end = np.cumsum(sizes)
+        # 구간 [j, i] 의 합 = end[i] - (end[j] - sizes[j]) ≥ window 인 가장 큰 j
+        start = np.searchsorted(end - sizes, end - window, side="right") - 1
+    return np.maximum(start, group_first)
+
+
+def window_sums(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """행 i 의 구간 [starts[i], i] 합 — 누적합 차이 (행 수에 선형)"""
+    csum = np.zeros((len(values) + 1, *values.shape[1:]))
+    np.cumsum(values, axis=0, out=csum[1:])
+    return csum[1:] - csum[starts]
+
+
+def _raw(sums: np.ndarray, team_rate) -> np.ndarray:
+    """구간 합계 [SUM_COLS] → 표준화 전 [ADI, AER, ER, AEI]"""
+    tries = sums[..., _TRIES]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = sums[..., _SUCCESS] * 100 / tries
+    return raw_indices(attack_diversity(sums[..., 4:]), sums[..., _SETS], tries,
+                       sums[..., _FAULTS], rate, team_rate)
+
+
+def _frame(players, teams, match, n_matches, sums, team_rate, window, unit, partial, weights) -> pd.DataFrame:
+    """구간 합계 → ROLLING_COLS (구간이 덜 찬 행은 partial 이 아니면 NaN, 나머지끼리 표준화)"""
+    raw = _raw(sums, team_rate)
+    if not partial:
+        raw[(n_matches if unit == "match" else sums[:, _SETS]) < window] = np.nan
+    z = standardize(raw)
+
+    out = pd.DataFrame(z, columns=list(INDEX_COLS))
+    out.insert(0, "세트수", sums[:, _SETS])
+    out.insert(0, "경기수", n_matches)
+    out.insert(0, "경기", match)
+    out.insert(0, "팀", teams)
+    out.insert(0, "선수", players)
+    out["OCI"] = z @ weight_vector(weights)
+    return out
+
+
+def _sorted_windows(df: pd.DataFrame, key: str, cols: list, window, unit) -> tuple:
+    """(key, 경기) 정렬 DF, 행별 구간 합계, 구간 경기 수"""
+    df = df.sort_values([key, "경기"], kind="stable", ignore_index=True)
+    groups = pd.factorize(df[key])[0]
+    values = _counts(df, cols)
+    starts = window_starts(groups, values[:, 0] if unit == "set" else None, window)
+    return df, window_sums(values, starts), np.arange(len(df)) - starts + 1
+
+
+def rolling_indices(matches: pd.DataFrame, window=WINDOW, unit="match", team_matches=None,
+                    partial=False, weights=WEIGHTS) -> pd.DataFrame:
+    """경기별 기록 → 행마다 그 경기까지 최근 구간의 [선수, 팀, 경기, 경기수, 세트수, ADI, AER, ER, AEI, OCI]
+
+    unit:    "match" 면 최근 window 경기, "set" 이면 세트 합이 window 이상인 최근 경기들
+    partial: 구간이 덜 찬 행도 지표 계산 (기본은 NaN)
+    AEI 의 팀 성공률도 같은 구간 규칙으로 팀의 그 경기까지 최근 구간에서 계산
+    """
+    if unit not in UNITS:
+        raise ValueError(f"unit 은 {UNITS} 중 하나: {unit!r}")
+    df, sums, n_matches = _sorted_windows(matches, "선수", SUM_COLS, window, unit)
+
+    team_df, team_sums, _ = _sorted_windows(
+        derive_team_matches(matches) if team_matches is None else team_matches,
+        "팀", TEAM_SUM_COLS, window, unit)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        team_rate = team_sums[:, 2] * 100 / team_sums[:, 1]
+    pos = pd.MultiIndex.from_frame(team_df[["팀", "경기"]]).get_indexer(
+        pd.MultiIndex.from_frame(df[["팀", "경기"]]))
+    team_rate = np.where(pos >= 0, team_rate[pos], np.nan)
+
+    return _frame(df["선수"].to_numpy(dtype=object), df["팀"].to_numpy(dtype=object), df["경기"].to_numpy(),
+                  n_matches, sums, team_rate, window, unit, partial, weights)
+
+
+def latest(rolling: pd.DataFrame) -> pd.DataFrame:
+    """rolling_indices 결과 → 선수별 마지막 경기 구간 한 행 (현재 폼)"""
+    return rolling.groupby("선수", sort=True).tail(1).reset_index(drop=True)
+
+
+class _Window:
+    """키 하나(선수/팀)의 구간: 경기 합계를 더하고 구간을 넘는 가장 오래된 경기를 뺌"""
+
+    __slots__ = ("rows", "total")
+
+    def __init__(self, width: int):
+        self.rows = deque()
+        self.total = np.zeros(width)
+
+    def push(self, values: np.ndarray, window, unit) -> None:
+        self.rows.append(values)
+        self.total += values
+        if unit == "match":
+            while len(self.rows) > window:
+                self.total -= self.rows.popleft()
+        else:
+            while len(self.rows) > 1 and self.total[0] - self.rows[0][0] >= window:
+                self.total -= self.rows.popleft()
+
+
+class RollingWindow:
+    """경기 단위로 들어오는 기록의 실시간 구간 지표 (경기 하나 반영은 그 경기 행 수에 비례)
+
+    push 는 경기 순서대로 — 선수 구간과 함께 팀 구간도 갱신하고,
+    선수의 팀 성공률은 그 선수의 마지막 경기 시점 팀 구간 값 (rolling_indices 와 같은 규칙)
+    """
+
+    def __init__(self, window=WINDOW, unit="match"):
+        if unit not in UNITS:
+            raise ValueError(f"unit 은 {UNITS} 중 하나: {unit!r}")
+        self.window, self.unit = window, unit
+        self.players, self.teams = {}, {}
+        self.team_of, self.last_match, self.team_rate = {}, {}, {}
+
+    def _push(self, windows: dict, key, values: np.ndarray) -> _Window:
+        window = windows.get(key)
+        if window is None:
+            window = windows[key] = _Window(len(values))
+        window.push(values, self.window, self.unit)
+        return window
+
+    def push(self, matches: pd.DataFrame, team_matches=None) -> None:
+        """새 경기(들)의 선수 기록 반영 (팀 기록이 없으면 선수 기록 합산)"""
+        if team_matches is None:
+            team_matches = derive_team_matches(matches)
+        team_rows = dict(tuple(team_matches.groupby("경기", sort=False)))
+        for match, rows in matches.groupby("경기", sort=True):
+            teams = team_rows.get(match, team_matches.iloc[:0])
+            for team, values in zip(teams["팀"], _counts(teams, TEAM_SUM_COLS)):
+                self._push(self.teams, team, values)
+            for name, team, values in zip(rows["선수"], rows["팀"], _counts(rows, SUM_COLS)):
+                self._push(self.players, name, values)
+                total = self.teams[team].total if team in self.teams else (np.nan,) * 3
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    self.team_rate[name] = np.float64(total[2]) * 100 / total[1]
+                self.team_of[name], self.last_match[name] = team, match
+
+    def current(self, partial=False, weights=WEIGHTS) -> pd.DataFrame:
+        """선수별 현재 구간 [선수, 팀, 경기, 경기수, 세트수, ADI, AER, ER, AEI, OCI] (현재 선수끼리 표준화)"""
+        names = sorted(self.players)
+        sums = np.array([self.players[p].total for p in names]).reshape(-1, len(SUM_COLS))
+        n_matches = np.array([len(self.players[p].rows) for p in names], dtype=np.int64)
+        return _frame(np.array(names, dtype=object), np.array([self.team_of[p] for p in names], dtype=object),
+                      [self.last_match[p] for p in names], n_matches, sums,
+                      np.array([self.team_rate[p] for p in names], dtype=float),
+                      self.window, self.unit, partial, weights)
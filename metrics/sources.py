@@ -0,0 +1,53 @@
+# metrics/sources.py
+# ---------------------------------------------------------
+# 리그별 원시 CSV 위치 / 산출물 파일명
+#   data/kovo_men_{유형}.csv, data/kovo_men_attack.csv, data/kovo_man_team.csv
+#   → 남자부_지표.csv, 남자부_파워랭킹.csv
+#   data/kovo_men_matches.csv (선수 × 경기 기록, 있을 때만) → 남자부_구간지표.csv
+# ---------------------------------------------------------
+
+from pathlib import Path
+
+import pandas as pd
+
+from .engine import ATTACK_TYPES
+
+DEFAULT_SEASON = "도드람 2024-2025 V-리그"
+DEFAULT_ROUNDS = (1, 6)
+
+LEAGUES = {
+    "남자부": {"prefix": "kovo_men", "team": "kovo_man_team"},
+    "여자부": {"prefix": "kovo_women", "team": "kovo_woman_team"},
+}
+
+
+def _read(path: Path) -> pd.DataFrame:
+    # 공격종합/팀 기록은 BOM 포함 UTF-8
+    return pd.read_csv(path, encoding="utf-8-sig")
+
+
+def load_sources(gender: str, data_dir="data", types=ATTACK_TYPES):
+    """(공격유형별 DF dict, 공격종합 DF, 팀 DF)"""
+    data_dir = Path(data_dir)
+    league = LEAGUES[gender]
+    type_tables = {t: _read(data_dir / f"{league['prefix']}_{t}.csv") for t in types}
+    attack = _read(data_dir / f"{league['prefix']}_attack.csv")
+    team = _read(data_dir / f"{league['team']}.csv")
+    return type_tables, attack, team
+
+
+def load_matches(gender: str, data_dir="data"):
+    """선수 × 경기 기록 DF (metrics.rolling 입력), 파일이 없으면 None"""
+    path = Path(data_dir) / f"{LEAGUES[gender]['prefix']}_matches.csv"
+    return _read(path) if path.exists() else None
+
+
+def output_paths(gender: str, out_dir=".") -> tuple:
+    """(지표 CSV, 파워랭킹 CSV)"""
+    out_dir = Path(out_dir)
+    return out_dir / f"{gender}_지표.csv", out_dir / f"{gender}_파워랭킹.csv"
+
+
+def rolling_path(gender: str, out_dir=".") -> Path:
+    """구간 지표 CSV"""
+    return Path(out_dir) / f"{gender}_구간지표.csv"
@@ -0,0 +1,273 @@
+# metrics/store.py
+# ---------------------------------------------------------
+# Parquet 컬럼 저장소 (원시 기록 / 팀 기록 / 산출 지표 / 시즌·라운드 추이)
+#   store/raw/season=…/gender=…/round=1-6/type=속공/part-<ns>.parquet
+#   store/team/season=…/gender=…/round=1-6/part-<ns>.parquet
+#   store/index/season=…/gender=…/round=1-6/part-<ns>.parquet
+#   store/ci/season=…/gender=…/round=1-6/part-<ns>.parquet      (부트스트랩 신뢰구간)
+#   store/team_agg/season=…/gender=…/round=1-6/part-<ns>.parquet (팀 집계)
+#   store/validation/season=…/gender=…/round=1-6/part-<ns>.parquet (수집 데이터 검증 보고서)
+#   store/history/gender=…/part-<ns>.parquet
+# - append-only: 쓰기마다 새 part 파일, 읽기는 파티션별 최신 파일만
+# - 스키마 고정(타입 지정) → 읽을 때 인코딩 판별·타입 추론 없음
+# - 읽기는 필요한 컬럼 + 파티션 필터만 (pyarrow.dataset)
+# ---------------------------------------------------------
+
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .engine import ATTACK_TYPES, OUTPUT_COLS, derive_attack, derive_team
+from .teams import AGG_COLS
+
+STORE_ROOT = Path("store")
+ATTACK_TOTAL = "공격종합"   # kovo_*_attack.csv 의 type 파티션 값
+
+PARTITION_SCHEMA = pa.schema([
+    ("season", pa.string()),
+    ("gender", pa.string()),
+    ("round", pa.string()),
+    ("type", pa.string()),
+])
+
+# 데이터셋별 파티션 키 (디렉터리 순서)
+KIND_PARTS = {
+    "raw": ("season", "gender", "round", "type"),
+    "team": ("season", "gender", "round"),
+    "index": ("season", "gender", "round"),
+    "ci": ("season", "gender", "round"),
+    "team_agg": ("season", "gender", "round"),
+    "validation": ("season", "gender", "round"),
+    "history": ("gender",),
+}
+
+RAW_SCHEMA = pa.schema([
+    ("순위", pa.int32()),
+    ("선수", pa.string()),
+    ("포지션", pa.string()),
+    ("팀", pa.string()),
+    ("경기수", pa.int32()),
+    ("세트수", pa.int32()),
+    ("시도", pa.int32()),
+    ("성공", pa.int32()),
+    ("실패", pa.int32()),
+    ("범실", pa.int32()),
+    ("성공률", pa.float64()),
+])
+
+TEAM_SCHEMA = pa.schema([f for f in RAW_SCHEMA if f.name not in ("선수", "포지션")])
+
+INDEX_SCHEMA = pa.schema(
+    [("선수", pa.string()), ("팀", pa.string())]
+    + [(c, pa.float64()) for c in OUTPUT_COLS[2:]]
+)
+
+# 부트스트랩 신뢰구간 (순위는 결측 가능 → float)
+CI_SCHEMA = pa.schema(
+    [("선수", pa.string()), ("팀", pa.string())]
+    + [(c, pa.float64()) for c in ("OCI", "OCI_하한", "OCI_상한", "순위", "순위_하한", "순위_상한")]
+)
+
+# 팀 집계 (합산 가능한 통계, metrics.teams)
+TEAM_AGG_SCHEMA = pa.schema([("팀", pa.string())] + [(c, pa.float64()) for c in AGG_COLS[1:]])
+
+# 검증 보고서 (metrics.validate): 이슈 한 건이 한 행, 이슈가 없으면 빈 테이블
+VALIDATION_SCHEMA = pa.schema([
+    ("check", pa.string()),
+    ("level", pa.string()),
+    ("table", pa.string()),
+    ("count", pa.int64()),
+    ("message", pa.string()),
+    ("examples", pa.string()),
+])
+
+# 추이 테이블: 슬라이스(시즌 × 라운드 범위)별 지표를 한 파일로
+HISTORY_SCHEMA = pa.schema(
+    [("season", pa.string()), ("season_year", pa.int32()), ("round", pa.string()),
+     ("round_start", pa.int32()), ("round_end", pa.int32())]
+    + list(INDEX_SCHEMA)
+)
+
+# 스크랩 원본마다 다른 컬럼명 통일 (순서/순위, 전체팀/팀)
+_RENAME = {"순서": "순위", "전체팀": "팀"}
+
+
+def round_key(rounds) -> str:
+    """(1, 6) → '1-6'"""
+    start, end = rounds
+    return f"{start}-{end}"
+
+
+def _partition_dir(kind: str, root=STORE_ROOT, **parts) -> Path:
+    path = Path(root) / kind
+    for key in KIND_PARTS[kind]:
+        if key in parts:
+            path = path / f"{key}={quote(str(parts[key]), safe='')}"
+    return path
+
+
+def latest_file(kind: str, root=STORE_ROOT, **parts):
+    """파티션의 최신 part 파일 (없으면 None)"""
+    files = sorted(_partition_dir(kind, root, **parts).glob("part-*.parquet"))
+    return files[-1] if files else None
+
+
+def _clean_name(col) -> str:
+    col = str(col).replace("\ufeff", "").strip()  # BOM 제거
+    return _RENAME.get(col, col)
+
+
+def _to_table(df: pd.DataFrame, schema: pa.Schema) -> pa.Table:
+    df = df.rename(columns=_clean_name)
+    df = df[[f.name for f in schema]].copy()
+    for f in schema:
+        if pa.types.is_integer(f.type) or pa.types.is_floating(f.type):
+            df[f.name] = pd.to_numeric(df[f.name], errors="coerce")
+    return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+
+def _write(table: pa.Table, directory: Path) -> Path:
+    """새 part 파일로 추가 (기존 파일은 이력으로 유지)"""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"part-{time.time_ns():020d}.parquet"
+    tmp = path.with_suffix(".tmp")
+    pq.write_table(table, tmp)
+    tmp.replace(path)   # 읽는 쪽이 쓰다 만 파일을 보지 않도록
+    return path
+
+
+# ============================ 쓰기 ============================
+def write_raw(df, season, gender, rounds, attack_type, root=STORE_ROOT) -> Path:
+    """공격유형별(또는 공격종합) 선수 기록 저장"""
+    directory = _partition_dir("raw", root, season=season, gender=gender,
+                               round=round_key(rounds), type=attack_type)
+    return _write(_to_table(df, RAW_SCHEMA), directory)
+
+
+def write_team(df, season, gender, rounds, root=STORE_ROOT) -> Path:
+    directory = _partition_dir("team", root, season=season, gender=gender, round=round_key(rounds))
+    return _write(_to_table(df, TEAM_SCHEMA), directory)
+
+
+def write_index(df, season, gender, rounds, root=STORE_ROOT) -> Path:
+    """산출 지표 [선수, 팀, ADI, AER, ER, AEI, OCI] 저장"""
+    directory = _partition_dir("index", root, season=season, gender=gender, round=round_key(rounds))
+    return _write(_to_table(df, INDEX_SCHEMA), directory)
+
+
+def write_ci(df, season, gender, rounds, root=STORE_ROOT) -> Path:
+    """OCI·순위 신뢰구간 저장 (metrics.bootstrap)"""
+    directory = _partition_dir("ci", root, season=season, gender=gender, round=round_key(rounds))
+    return _write(_to_table(df, CI_SCHEMA), directory)
+
+
+def write_team_agg(df, season, gender, rounds, root=STORE_ROOT) -> Path:
+    """슬라이스 팀 집계 저장 (metrics.teams.team_aggregates)"""
+    directory = _partition_dir("team_agg", root, season=season, gender=gender, round=round_key(rounds))
+    return _write(_to_table(df, TEAM_AGG_SCHEMA), directory)
+
+
+def write_validation(df, season, gender, rounds, root=STORE_ROOT) -> Path:
+    """슬라이스 검증 보고서 저장 (metrics.validate) — 지표보다 먼저 기록"""
+    directory = _partition_dir("validation", root, season=season, gender=gender, round=round_key(rounds))
+    return _write(_to_table(df, VALIDATION_SCHEMA), directory)
+
+
+def write_history(df, gender, root=STORE_ROOT) -> Path:
+    """시즌·라운드 추이 테이블 저장 (리그 단위 전체 교체)"""
+    return _write(_to_table(df, HISTORY_SCHEMA), _partition_dir("history", root, gender=gender))
+
+
+def index_file(season, gender, rounds, root=STORE_ROOT):
+    """지표 파티션의 최신 파일 (없으면 None)"""
+    return latest_file("index", root, season=season, gender=gender, round=round_key(rounds))
+
+
+def ci_file(season, gender, rounds, root=STORE_ROOT):
+    """신뢰구간 파티션의 최신 파일 (없으면 None)"""
+    return latest_file("ci", root, season=season, gender=gender, round=round_key(rounds))
+
+
+def validation_file(season, gender, rounds, root=STORE_ROOT):
+    """검증 보고서 파티션의 최신 파일 (없으면 None)"""
+    return latest_file("validation", root, season=season, gender=gender, round=round_key(rounds))
+
+
+# ============================ 읽기 ============================
+def _filter(parts: dict):
+    expr = None
+    for key, value in parts.items():
+        if value is None:
+            continue
+        cond = ds.field(key).isin(list(value)) if isinstance(value, (list, tuple, set)) else ds.field(key) == value
+        expr = cond if expr is None else expr & cond
+    return expr
+
+
+def latest_files(kind: str, root=STORE_ROOT) -> list:
+    """파티션별 최신 part 파일 목록"""
+    latest = {}
+    for f in sorted((Path(root) / kind).rglob("part-*.parquet")):
+        latest[f.parent] = f
+    return list(latest.values())
+
+
+def read(kind: str, columns=None, root=STORE_ROOT, **parts) -> pd.DataFrame:
+    """kind(raw/team/index/ci/team_agg/validation/history) 데이터셋에서 필요한 컬럼·파티션만 읽기 (파티션별 최신본)
+
+    예) read("raw", columns=["선수", "시도", "type"], gender="남자부", round="1-6")
+    """
+    files = latest_files(kind, root)
+    if not files:
+        return pd.DataFrame(columns=columns)
+    partitioning = ds.partitioning(
+        pa.schema([PARTITION_SCHEMA.field(k) for k in KIND_PARTS[kind]]), flavor="hive",
+    )
+    dataset = ds.dataset([str(f) for f in files], format="parquet", partitioning=partitioning,
+                         partition_base_dir=str(Path(root) / kind))
+    return dataset.to_table(columns=columns, filter=_filter(parts)).to_pandas()
+
+
+def slices(gender=None, root=STORE_ROOT) -> list:
+    """원시 기록이 있는 (season, gender, round) 슬라이스 목록"""
+    raw = read("raw", columns=["season", "gender", "round"], root=root, gender=gender)
+    return sorted(raw.drop_duplicates().itertuples(index=False, name=None))
+
+
+def has_sources(season, gender, rounds, root=STORE_ROOT, types=ATTACK_TYPES, totals=True) -> bool:
+    """지표 계산에 필요한 원시/팀 파티션이 모두 있는지
+
+    totals=False 면 공격유형별 파티션만 확인 (공격종합/팀 합계가 공개되지 않는 라운드별 슬라이스)
+    """
+    rk = round_key(rounds)
+    kinds = [("raw", dict(type=t)) for t in types]
+    if totals:
+        kinds += [("raw", dict(type=ATTACK_TOTAL)), ("team", {})]
+    return all(latest_file(kind, root, season=season, gender=gender, round=rk, **parts)
+               for kind, parts in kinds)
+
+
+def load_sources(season, gender, rounds, root=STORE_ROOT, types=ATTACK_TYPES, derive=False):
+    """저장소에서 compute_indices 입력 읽기 — 계산에 쓰는 컬럼만
+
+    derive: 공격종합/팀 파티션이 없으면 유형별 기록에서 합산 (라운드별 슬라이스용)
+            아니면 없을 때 FileNotFoundError — 합산값은 공개 합계와 선수 구성·성공률이 달라짐
+    """
+    rk = round_key(rounds)
+    raw = read("raw", columns=["type", "선수", "팀", "세트수", "시도", "성공", "범실", "성공률"],
+               root=root, season=season, gender=gender, round=rk, type=[*types, ATTACK_TOTAL])
+    type_tables = {t: raw.loc[raw["type"] == t].reset_index(drop=True) for t in types}
+    attack = raw.loc[raw["type"] == ATTACK_TOTAL].reset_index(drop=True)
+    team = read("team", columns=["팀", "성공률"], root=root, season=season, gender=gender, round=rk)
+    if (attack.empty or team.empty) and not derive:
+        raise FileNotFoundError(f"{season} {gender} {rk}R: 공격종합/팀 파티션 없음")
+    if attack.empty:
+        attack = derive_attack(type_tables)
+    if team.empty:
+        team = derive_team(attack)
+    return type_tables, attack, team
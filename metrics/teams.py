@@ -0,0 +1,79 @@
+# metrics/teams.py
+# ---------------------------------------------------------
+# 팀 단위 집계 (팀 분석 페이지용)
+# - 슬라이스(시즌 × 라운드) 하나를 계산할 때 그 슬라이스의 팀 집계만 만들어 store/team_agg 에 저장
+#   → 새 스크랩이 들어오면 바뀐 슬라이스만 다시 집계, 나머지는 그대로
+# - 합쳐도 되는 통계만 저장 (인원, 합, 제곱합, 최소/최대, 유형별 시도 합)
+#   → 여러 라운드·시즌을 묶어 볼 때 선수 테이블을 다시 읽지 않고 합산만 (merge_aggregates)
+# - 화면용 평균/표준편차/공격 비중/유효 공격수는 summarize 에서 파생
+# ---------------------------------------------------------
+
+import numpy as np
+import pandas as pd
+
+from .engine import ATTACK_TYPES, INDEX_COLS, league_arrays
+
+AGG_METRICS = (*INDEX_COLS, "OCI")
+TYPE_COLS = [f"시도_{t}" for t in ATTACK_TYPES]
+
+# 집계 방법별 컬럼 (merge_aggregates 기준)
+SUM_COLS = (["인원", "시도_합", "시도_제곱합", *TYPE_COLS]
+            + [f"{m}_{s}" for m in AGG_METRICS for s in ("n", "합", "제곱합")])
+MIN_COLS = [f"{m}_최소" for m in AGG_METRICS]
+MAX_COLS = ["시도_최대"] + [f"{m}_최대" for m in AGG_METRICS]
+AGG_COLS = ["팀", *SUM_COLS, *MIN_COLS, *MAX_COLS]
+
+
+def team_aggregates(type_tables: dict, attack: pd.DataFrame, team: pd.DataFrame,
+                    indices: pd.DataFrame) -> pd.DataFrame:
+    """한 슬라이스의 팀별 집계 (indices 는 같은 입력의 compute_indices 결과 — 행 순서 동일)"""
+    a = league_arrays(type_tables, attack, team)
+    tries = np.nan_to_num(a["tries"])
+    cols = {"팀": a["teams"], "인원": 1, "시도_합": tries, "시도_제곱합": tries ** 2, "시도_최대": tries}
+    cols.update({c: a["types"][:, k] for k, c in enumerate(TYPE_COLS)})
+    for m in AGG_METRICS:
+        x = indices[m].to_numpy(float)
+        ok = ~np.isnan(x)
+        cols.update({
+            f"{m}_n": ok.astype(int),
+            f"{m}_합": np.where(ok, x, 0.0),
+            f"{m}_제곱합": np.where(ok, x ** 2, 0.0),
+            f"{m}_최소": x,
+            f"{m}_최대": x,
+        })
+    return _group(pd.DataFrame(cols), ["팀"])
+
+
+def _group(df: pd.DataFrame, keys: list) -> pd.DataFrame:
+    spec = {c: "sum" for c in SUM_COLS}
+    spec.update({c: "min" for c in MIN_COLS})
+    spec.update({c: "max" for c in MAX_COLS})
+    out = df.dropna(subset=["팀"]).groupby(keys, sort=True).agg(spec).reset_index()
+    return out[[*keys, *AGG_COLS[1:]]]
+
+
+def merge_aggregates(aggs: pd.DataFrame, by=("팀",)) -> pd.DataFrame:
+    """여러 슬라이스의 집계를 합침 (선수-슬라이스 단위 관측을 모두 더한 것과 같음)"""
+    return _group(aggs, list(by))
+
+
+def summarize(agg: pd.DataFrame) -> pd.DataFrame:
+    """집계 → 화면용 [팀, 인원, 지표별 평균/표준편차/최소/최대, 유형별 비중, 유효 공격수, 최다 시도 비중]"""
+    out = agg[["팀"]].copy()
+    out["인원"] = agg["인원"].astype(int)   # 여러 슬라이스를 합치면 선수-슬라이스 수
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for m in AGG_METRICS:
+            n = agg[f"{m}_n"].to_numpy(float)
+            mean = agg[f"{m}_합"].to_numpy(float) / n
+            var = np.maximum(agg[f"{m}_제곱합"].to_numpy(float) / n - mean ** 2, 0)
+            out[f"{m}_평균"] = mean
+            out[f"{m}_표준편차"] = np.sqrt(var)
+            out[f"{m}_최소"] = agg[f"{m}_최소"]
+            out[f"{m}_최대"] = agg[f"{m}_최대"]
+        total = agg["시도_합"].to_numpy(float)
+        for t, c in zip(ATTACK_TYPES, TYPE_COLS):
+            out[f"비중_{t}"] = agg[c].to_numpy(float) / agg[TYPE_COLS].sum(axis=1).to_numpy(float)
+        # 유효 공격수 = (Σ시도)² / Σ시도² — 시도가 고르게 퍼질수록 인원에 가까움
+        out["유효_공격수"] = total ** 2 / agg["시도_제곱합"].to_numpy(float)
+        out["최다시도_비중"] = agg["시도_최대"].to_numpy(float) / total
+    return out
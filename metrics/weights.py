@@ -0,0 +1,60 @@
+# metrics/weights.py
+# ---------------------------------------------------------
+# OCI 가중치 프리셋 (이름 → {ADI, AER, ER, AEI})
+# - 기본 프리셋은 engine.WEIGHTS (노트북과 같은 값)
+# - 사용자 프리셋은 JSON 파일 하나에 저장 (oci_weights.json)
+# - OCI = 표준화 지표 행렬 @ weight_vector(가중치)  (ER 은 음수 가중치 = 감점)
+# ---------------------------------------------------------
+
+import json
+from pathlib import Path
+
+from .engine import INDEX_COLS, WEIGHTS
+
+PRESETS_FILE = Path("oci_weights.json")
+DEFAULT_PRESET = "기본 (노트북)"
+BUILTIN_PRESETS = {DEFAULT_PRESET: dict(WEIGHTS)}
+
+
+def _check(weights: dict) -> dict:
+    missing = [c for c in INDEX_COLS if c not in weights]
+    if missing:
+        raise ValueError(f"가중치 누락: {missing}")
+    return {c: float(weights[c]) for c in INDEX_COLS}
+
+
+def _read(path: Path) -> dict:
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write(presets: dict, path: Path) -> None:
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(presets, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+def load_presets(path=PRESETS_FILE) -> dict:
+    """기본 프리셋 + 저장된 프리셋 (이름 순서 유지)"""
+    presets = dict(BUILTIN_PRESETS)
+    presets.update({name: _check(w) for name, w in _read(path).items()})
+    return presets
+
+
+def save_preset(name: str, weights: dict, path=PRESETS_FILE) -> None:
+    """프리셋 추가/덮어쓰기 (기본 프리셋 이름은 사용 불가)"""
+    name = name.strip()
+    if not name or name in BUILTIN_PRESETS:
+        raise ValueError(f"사용할 수 없는 프리셋 이름: {name!r}")
+    presets = _read(path)
+    presets[name] = _check(weights)
+    _write(presets, path)
+
+
+def delete_preset(name: str, path=PRESETS_FILE) -> None:
+    presets = _read(path)
+    if presets.pop(name, None) is not None:
+        _write(presets, path)
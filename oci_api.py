@@ -0,0 +1,275 @@
+# oci_api.py
+# ---------------------------------------------------------
+# OCI 랭킹 / 선수 지표 JSON API (다른 내부 앱용, Streamlit 없이 동작)
+#   GET /leagues/{gender}/rankings?team=&top_n=   → OCI 내림차순 순위
+#   GET /players/{name}?gender=                   → 선수 지표 벡터 + 리그/팀 순위
+#   GET /players/{name}/similar?k=&gender=        → 지표 벡터가 가까운 선수 k명 + 거리
+#   GET /compare?a=&b=&gender=                    → 두 선수 지표 + 차이(a-b)
+#   GET /leagues/{gender}/export?team=&format=    → 필터 테이블 CSV/Parquet/Excel (조각 단위 스트리밍)
+# - dashbord.py 와 같은 지표 파일·전처리·LeagueIndex 사용 (store/index 우선, 없으면 *_지표.csv)
+# - 리그 인덱스는 파일 서명(경로, mtime, 내용 해시)이 바뀔 때만 다시 구성
+#   (로더는 oci_loaders — Streamlit 을 import 하지 않음)
+# - 핸들러는 일반 def → FastAPI 가 스레드 풀에서 실행 (파일 읽기·인덱스 구성이 이벤트 루프를 막지 않음)
+# - 응답은 (데이터 버전, 요청) 키로 메모리에 캐시 — 본문과 gzip 본문을 함께 보관
+# - ETag 는 데이터 버전 + 요청에서 파생 → If-None-Match 가 맞으면 304
+#
+# 실행 예)
+#   python oci_api.py --port 8000
+#   uvicorn oci_api:app --workers 2
+#   curl -H "Accept-Encoding: gzip" "localhost:8000/leagues/men/rankings?team=대한항공&top_n=5"
+# ---------------------------------------------------------
+
+import argparse
+import gzip
+import hashlib
+import json
+import math
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from urllib.parse import quote
+
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from league_index import ALL_TEAMS, RADAR_COLS, LeagueIndex
+from metrics import LEAGUES
+from oci_export import FORMATS, iter_export
+from oci_loaders import league_file, read_league_index
+
+METRIC_KEYS = [*RADAR_COLS, "OCI"]
+GENDER_ALIASES = {"men": "남자부", "women": "여자부"}
+RESPONSE_CACHE_SIZE = 1024
+GZIP_MIN_BYTES = 500
+# ?format= 값 → oci_export 형식 (이름 또는 확장자)
+EXPORT_FORMATS = {k: f for f, (ext, _) in FORMATS.items() for k in (f.lower(), ext.lstrip("."))}
+
+
+# ============================ 리그 인덱스 ============================
+_indices = {}           # gender → ((경로, mtime_ns, 크기), LeagueIndex)
+_index_lock = threading.Lock()
+
+
+def resolve_gender(gender: str) -> str:
+    gender = GENDER_ALIASES.get(gender.lower(), gender)
+    if gender not in LEAGUES:
+        raise HTTPException(404, f"알 수 없는 리그: {gender}")
+    return gender
+
+
+def league_index(gender: str) -> LeagueIndex:
+    """리그 인덱스 — 요청마다 stat 한 번, 파일이 바뀌었을 때만 다시 구성"""
+    path = league_file(gender)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise HTTPException(503, f"지표 파일 없음: {path}")
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    cached = _indices.get(gender)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with _index_lock:
+        cached = _indices.get(gender)
+        if cached is None or cached[0] != key:
+            cached = _indices[gender] = (key, read_league_index(path))
+    return cached[1]
+
+
+# ============================ 직렬화 ============================
+def _num(value):
+    """NaN → null"""
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def player_profile(idx: LeagueIndex, gender: str, name: str) -> dict:
+    row = idx.row(name)
+    league_rank, league_n = idx.league_rank(name)
+    team_rank, team_n = idx.team_rank(name)
+    return {
+        "player": name,
+        "gender": gender,
+        "team": row["팀"],
+        "metrics": {c: _num(row[c]) for c in METRIC_KEYS},
+        "league_rank": league_rank,
+        "league_size": league_n,
+        "team_rank": team_rank,
+        "team_size": team_n,
+    }
+
+
+def rankings_payload(idx: LeagueIndex, gender: str, team: str, top_n: int) -> dict:
+    head = idx.ranking(team, top_n)
+    return {
+        "gender": gender,
+        "team": team,
+        "total": len(idx.rank_rows(team)),
+        "rankings": [
+            {"rank": r, "player": p, "team": t, "OCI": _num(v)}
+            for r, (p, t, v) in enumerate(head.itertuples(index=False, name=None), start=1)
+        ],
+    }
+
+
+def similar_payload(idx: LeagueIndex, gender: str, name: str, k: int) -> dict:
+    sim = idx.similar(name, k)
+    return {
+        "player": name,
+        "gender": gender,
+        "similar": [
+            {"player": r["선수"], "team": r["팀"], "distance": _num(r["거리"]),
+             "metrics": {c: _num(r[c]) for c in METRIC_KEYS}}
+            for r in sim.to_dict("records")
+        ],
+    }
+
+
+def compare_payload(idx: LeagueIndex, gender: str, a: str, b: str) -> dict:
+    prof_a, prof_b = player_profile(idx, gender, a), player_profile(idx, gender, b)
+    delta = {}
+    for c in METRIC_KEYS:
+        va, vb = prof_a["metrics"][c], prof_b["metrics"][c]
+        delta[c] = None if va is None or vb is None else va - vb
+    return {"a": prof_a, "b": prof_b, "delta": delta}
+
+
+# ============================ 응답 캐시 ============================
+class CachedBody:
+    __slots__ = ("body", "gzipped", "etag")
+
+    def __init__(self, payload: dict, etag: str):
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.gzipped = gzip.compress(self.body, 6) if len(self.body) >= GZIP_MIN_BYTES else None
+        self.etag = etag
+
+
+_responses = OrderedDict()     # (데이터 버전, 요청 키) → CachedBody  (LRU)
+_response_lock = threading.Lock()
+
+
+def cached_body(version: tuple, key: tuple, build) -> CachedBody:
+    cache_key = (version, key)
+    with _response_lock:
+        hit = _responses.get(cache_key)
+        if hit is not None:
+            _responses.move_to_end(cache_key)
+            return hit
+    etag = 'W/"' + hashlib.sha1(repr(cache_key).encode("utf-8")).hexdigest()[:20] + '"'
+    entry = CachedBody(build(), etag)
+    with _response_lock:
+        _responses[cache_key] = entry
+        while len(_responses) > RESPONSE_CACHE_SIZE:
+            _responses.popitem(last=False)
+    return entry
+
+
+def json_response(request: Request, entry: CachedBody) -> Response:
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if request.headers.get("if-none-match") == entry.etag:
+        return Response(status_code=304, headers=headers)
+    if entry.gzipped is not None and "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(entry.gzipped, media_type="application/json", headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+
+# ============================ 앱 ============================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 시작 시 리그 인덱스를 미리 구성 (첫 요청 지연 방지, 파일 I/O 는 스레드 풀에서)
+    for gender in LEAGUES:
+        try:
+            await run_in_threadpool(league_index, gender)
+        except HTTPException:
+            pass
+    yield
+
+
+app = FastAPI(title="OCI API", lifespan=lifespan)
+
+
+def _require_player(idx: LeagueIndex, name: str) -> None:
+    if not idx.has_player(name):
+        raise HTTPException(404, f"선수 없음: {name}")
+
+
+def _find_player(name: str, gender) -> tuple:
+    """gender 가 없으면 모든 리그에서 찾기 → (gender, idx)"""
+    genders = [resolve_gender(gender)] if gender else list(LEAGUES)
+    for g in genders:
+        idx = league_index(g)
+        if idx.has_player(name):
+            return g, idx
+    raise HTTPException(404, f"선수 없음: {name}")
+
+
+@app.get("/leagues/{gender}/rankings")
+def rankings(request: Request, gender: str, team: str = ALL_TEAMS,
+             top_n: int = Query(10, ge=1, le=1000)):
+    gender = resolve_gender(gender)
+    idx = league_index(gender)
+    if team != ALL_TEAMS and team not in idx.team_rows:
+        raise HTTPException(404, f"팀 없음: {team}")
+    entry = cached_body(idx.version, ("rankings", gender, team, top_n),
+                        lambda: rankings_payload(idx, gender, team, top_n))
+    return json_response(request, entry)
+
+
+@app.get("/players/{name}")
+def player(request: Request, name: str, gender: str = None):
+    gender, idx = _find_player(name, gender)
+    entry = cached_body(idx.version, ("player", gender, name),
+                        lambda: player_profile(idx, gender, name))
+    return json_response(request, entry)
+
+
+@app.get("/players/{name}/similar")
+def similar(request: Request, name: str, k: int = Query(5, ge=1, le=100), gender: str = None):
+    gender, idx = _find_player(name, gender)
+    entry = cached_body(idx.version, ("similar", gender, name, k),
+                        lambda: similar_payload(idx, gender, name, k))
+    return json_response(request, entry)
+
+
+@app.get("/compare")
+def compare(request: Request, a: str, b: str, gender: str = None):
+    gender, idx = _find_player(a, gender)
+    _require_player(idx, b)
+    entry = cached_body(idx.version, ("compare", gender, a, b),
+                        lambda: compare_payload(idx, gender, a, b))
+    return json_response(request, entry)
+
+
+@app.get("/leagues/{gender}/export")
+def export(request: Request, gender: str, team: str = ALL_TEAMS, format: str = "csv"):
+    gender = resolve_gender(gender)
+    idx = league_index(gender)
+    if team != ALL_TEAMS and team not in idx.team_rows:
+        raise HTTPException(404, f"팀 없음: {team}")
+    fmt = EXPORT_FORMATS.get(format.lower())
+    if fmt is None:
+        raise HTTPException(400, f"지원하지 않는 형식: {format}")
+    ext, mime = FORMATS[fmt]
+    etag = 'W/"' + hashlib.sha1(repr((idx.version, "export", team, fmt)).encode("utf-8")).hexdigest()[:20] + '"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache",
+               "Content-Disposition": f"attachment; filename*=UTF-8''{quote(f'{gender}_{team}_OCI{ext}')}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return StreamingResponse(iter_export(idx.view(team), fmt), media_type=mime, headers=headers)
+
+
+# ============================ CLI ============================
+def main(argv=None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="OCI 랭킹/선수 지표 JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+    uvicorn.run("oci_api:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+# oci_data.py
+# ---------------------------------------------------------
+# 대시보드 공용 데이터 레이어 (캐시 로더) — 순수 로더·전처리는 oci_loaders (Streamlit 없음)
+# - 통합 대시보드(oci_sections.py — dashbord.py / v1_dashbord.py 진입점)가 사용
+# - 캐시 키: 파일 경로 + mtime + 내용 해시
+#   → 사이드바 변경으로 재실행될 때는 파일 I/O·정규화 없이 캐시 반환
+#   → CSV 가 바뀌면 mtime/해시가 달라져 자동으로 다시 로드
+# - 지표 파일: Parquet 저장소(store/index) 우선, 없으면 *_지표.csv
+#   Parquet 은 필요한 컬럼만 읽고 인코딩 판별이 필요 없음
+# - 리그 레지스트리: 남자부/여자부 + oci_leagues.json (컵대회 등) — 대시보드는 고른 리그만 로드
+#   신뢰구간·추이·검증 보고서도 리그 스펙(시즌·라운드) 기준 (같은 성별의 다른 대회 것을 쓰지 않음)
+# - 검증 통과 지표: store/validation 보고서에 error 가 없는 저장소 지표는 수집 단계에서 이미 검증됨
+#   → 필수 컬럼 체크·숫자 변환·OCI 보장 없이 그대로 사용 (CSV / 보고서 없는 지표만 검사)
+# ---------------------------------------------------------
+
+import hashlib
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+import oci_loaders
+from league_index import LeagueIndex, build_league_index
+from metrics import (DEFAULT_ROUNDS, DEFAULT_SEASON, LEAGUES, WEIGHTS, compute_indices, history, load_sources,
+                     store, teams, validate)
+from oci_loaders import (REQUIRED_COLS, LeagueSpec, clean_columns, coerce_metrics, compact_metrics, read_table,
+                         scale_metrics)
+
+# ============================ 리그 레지스트리 ============================
+@st.cache_data(show_spinner=False, max_entries=4)
+def _custom_leagues(path: str, mtime_ns: int) -> dict:
+    return oci_loaders.custom_leagues(path)
+
+def league_registry() -> dict:
+    """{이름: LeagueSpec} (선택지 순서 = 기본 리그 → oci_leagues.json 순서)
+
+    등록만 하고 로드하지 않음 — 지표는 load_league 로 처음 고를 때 읽어 모든 세션이 공유
+    """
+    return oci_loaders.league_registry(_custom_leagues)
+
+# ============================ 전처리 (화면 안내) ============================
+# 순수 전처리는 oci_loaders — 여기서는 문제를 화면에 표시
+def check_required(df: pd.DataFrame, required=REQUIRED_COLS) -> None:
+    """필수 컬럼 누락 시 에러 표시 후 중단"""
+    missing = oci_loaders.missing_required(df, required)
+    if missing:
+        st.error(f"필수 컬럼 누락: {missing}")
+        st.stop()
+
+def ensure_oidr(df: pd.DataFrame) -> pd.DataFrame:
+    """oci_loaders.ensure_oidr + 안내 (계산 불가면 에러 표시 후 그대로, 계산했으면 사용 가중치 표시)"""
+    if not oci_loaders.needs_oidr(df):
+        return df
+    try:
+        df = oci_loaders.ensure_oidr(df)
+    except ValueError as e:
+        st.error(str(e))
+        return df
+    desc = ", ".join(f"{k} {v:+g}" for k, v in WEIGHTS.items())
+    st.info(f"ℹ️ OCI 값이 없어 기본 가중치로 계산했습니다. ({desc})")
+    return df
+
+def prepare_df(df: pd.DataFrame) -> pd.DataFrame:
+    """v1 전처리: 컬럼 정리 → 필수 컬럼 체크 → 0~1 정규화 → 숫자 캐스팅"""
+    df = clean_columns(df)
+    check_required(df)
+    return coerce_metrics(scale_metrics(df), strip_names=True)
+
+# ============================ 캐시 키 ============================
+@st.cache_data(show_spinner=False, max_entries=64)
+def _content_hash(path: str, mtime_ns: int, size: int) -> str:
+    """파일 내용 해시 — (경로, mtime, 크기)가 같으면 파일을 다시 읽지 않음"""
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+def file_signature(path) -> tuple:
+    """(절대경로, mtime_ns, 내용 해시) — 재실행 시에는 stat 한 번만 발생"""
+    path = Path(path)
+    if not path.exists():
+        st.error(f"파일을 찾을 수 없습니다: {path}")
+        st.stop()
+    stat = path.stat()
+    abs_path = str(path.resolve())
+    return abs_path, stat.st_mtime_ns, _content_hash(abs_path, stat.st_mtime_ns, stat.st_size)
+
+# ============================ 캐시 로더 ============================
+# cache_resource: 모든 세션이 같은 DataFrame 객체를 공유 (읽기 전용으로 사용할 것)
+# 공유 DF 는 compact_metrics 로 압축 — 세션 쪽은 뷰/필요한 행만 잘라 씀 (LeagueIndex)
+# validated: 수집 단계 검증을 통과한 저장소 지표 → 검사/변환 생략 (스키마 고정 Parquet)
+# 캐시 함수는 세션 상태를 건드리지 않음 — 소요 시간은 호출하는 쪽(oci_sections.main)에서 계측
+@st.cache_resource(show_spinner="데이터 로드 중...", max_entries=16)
+def _load_metrics(path: str, mtime_ns: int, digest: str, validated=False) -> pd.DataFrame:
+    df = read_table(path)
+    if validated:
+        return compact_metrics(df)
+    df = clean_columns(df)
+    check_required(df)
+    df = coerce_metrics(df)
+    return compact_metrics(ensure_oidr(df))
+
+@st.cache_resource(show_spinner="데이터 로드 중...", max_entries=16)
+def _load_scaled_metrics(path: str, mtime_ns: int, digest: str, validated=False) -> pd.DataFrame:
+    df = read_table(path)
+    return compact_metrics(scale_metrics(df) if validated else prepare_df(df))
+
+def load_metrics(path) -> pd.DataFrame:
+    """지표 파일 로드 (표준화 지표 보기): 컬럼 정리 + 숫자 캐스팅 + OCI 보장"""
+    return _load_metrics(*file_signature(path))
+
+# 리그 인덱스: 지표 DF 와 같은 키로 한 번만 구성 (선수 조회/순위/팀 슬라이스)
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _league_index(path: str, mtime_ns: int, digest: str, validated=False) -> LeagueIndex:
+    df = _load_metrics(path, mtime_ns, digest, validated)
+    return build_league_index(df, (path, mtime_ns, digest))
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _scaled_league_index(path: str, mtime_ns: int, digest: str, validated=False) -> LeagueIndex:
+    df = _load_scaled_metrics(path, mtime_ns, digest, validated)
+    return build_league_index(df, (path, mtime_ns, digest, "scaled"))
+
+def load_league_index(path, validated=False) -> LeagueIndex:
+    """load_metrics 결과의 사전 계산 인덱스 (표준화 지표 보기)"""
+    return _league_index(*file_signature(path), validated)
+
+def load_scaled_league_index(path, validated=False) -> LeagueIndex:
+    """load_scaled_metrics 결과의 사전 계산 인덱스 (0~1 정규화 보기)"""
+    return _scaled_league_index(*file_signature(path), validated)
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _load_validation(path: str, mtime_ns: int, digest: str) -> pd.DataFrame:
+    return pd.read_parquet(path)
+
+def load_validation(spec: LeagueSpec):
+    """리그 슬라이스의 수집 검증 보고서 (metrics.validate 이슈 테이블), 저장소 지표가 아니거나 보고서가 없으면 None"""
+    if spec.file or store.index_file(spec.season, spec.gender, spec.rounds) is None:
+        return None
+    path = store.validation_file(spec.season, spec.gender, spec.rounds)
+    return None if path is None else _load_validation(*file_signature(path))
+
+def load_league(spec: LeagueSpec, scaled=False) -> LeagueIndex:
+    """레지스트리 리그 하나의 인덱스 (처음 고른 리그만 읽음, 이후 모든 세션 공유)
+
+    최신 검증 보고서에 error 가 없으면 검증된 지표로 보고 검사 없이 로드
+    (검증 실패 시에는 지표가 갱신되지 않으므로, error 보고서가 최신이면 이전 지표를 검사해서 사용)
+    """
+    report = load_validation(spec)
+    validated = report is not None and not validate.has_errors(report)
+    return (load_scaled_league_index if scaled else load_league_index)(spec.path(), validated)
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _load_history(path: str, mtime_ns: int, digest: str, league: str) -> pd.DataFrame:
+    hist = pd.read_parquet(path)
+    return hist[hist["season"].map(history.competition) == league].reset_index(drop=True)
+
+def load_history(spec: LeagueSpec):
+    """리그 대회의 시즌·라운드별 지표 이력 (store/history 사전 집계본 중 spec.season 과 같은 대회)
+
+    파일 지정 리그이거나 이력이 없으면 None (추이 섹션 숨김)
+    """
+    path = None if spec.file else store.latest_file("history", gender=spec.gender)
+    if path is None:
+        return None
+    hist = _load_history(*file_signature(path), history.competition(spec.season))
+    return hist if len(hist) else None
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _load_intervals(path: str, mtime_ns: int, digest: str) -> pd.DataFrame:
+    return pd.read_parquet(path)
+
+def load_intervals(spec: LeagueSpec):
+    """리그 슬라이스의 부트스트랩 OCI·순위 95% 구간 (store/ci), 파일 지정 리그이거나 없으면 None"""
+    path = None if spec.file else store.ci_file(spec.season, spec.gender, spec.rounds)
+    return None if path is None else _load_intervals(*file_signature(path))
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _load_team_aggregates(gender: str, files: tuple) -> pd.DataFrame:
+    aggs = store.read("team_agg", gender=gender).drop(columns="gender")
+    return _with_slice_order(aggs)
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _csv_team_aggregates(gender: str, files: tuple) -> pd.DataFrame:
+    sources = load_sources(gender)
+    aggs = teams.team_aggregates(*sources, compute_indices(*sources))
+    return _with_slice_order(aggs.assign(season=DEFAULT_SEASON, round=store.round_key(DEFAULT_ROUNDS)))
+
+def _with_slice_order(aggs: pd.DataFrame) -> pd.DataFrame:
+    rounds = aggs["round"].str.split("-", expand=True).astype(int)
+    aggs = aggs.assign(season_year=aggs["season"].map(history.season_year),
+                       round_start=rounds[0], round_end=rounds[1])
+    return aggs.sort_values(["season_year", "round_start", "round_end", "팀"], ignore_index=True)
+
+def load_team_aggregates(gender: str) -> pd.DataFrame:
+    """슬라이스별 팀 집계 (store/team_agg, 없으면 data/*.csv 로 기본 슬라이스 하나 계산)
+
+    캐시 키는 파티션별 최신 part 파일 목록 → 새 스크랩으로 파일이 늘 때만 다시 읽음
+    """
+    files = tuple(str(f) for f in store.latest_files("team_agg"))
+    if files:
+        return _load_team_aggregates(gender, files)
+    prefix = LEAGUES[gender]["prefix"]
+    csvs = sorted(Path("data").glob(f"{prefix}_*.csv")) + [Path("data") / f"{LEAGUES[gender]['team']}.csv"]
+    return _csv_team_aggregates(gender, tuple((str(f), f.stat().st_mtime_ns) for f in csvs if f.exists()))
+
+def load_scaled_metrics(path) -> pd.DataFrame:
+    """지표 파일 로드 (0~1 정규화 보기): prepare_df 의 0~1 정규화까지 적용"""
+    return _load_scaled_metrics(*file_signature(path))
@@ -0,0 +1,117 @@
+# oci_export.py
+# ---------------------------------------------------------
+# 필터 테이블 내보내기 (CSV / Parquet / Excel)
+# - iter_export: 행 묶음(chunk) 단위로 인코딩해 bytes 조각을 순서대로 생성
+#   → oci_api 의 StreamingResponse 가 그대로 흘려보냄 (전체 파일을 메모리에 두지 않음)
+# - write_export: 같은 조각을 임시 파일에 차례로 기록 (대시보드 다운로드용, 메모리 캐시 없음)
+# - Excel 은 스트리밍 불가: xlsx 는 zip 이라 저장이 끝나야 첫 바이트가 나옴
+#   → 메모리(BytesIO) 대신 임시 파일에 저장한 뒤 조각으로 읽어 보냄
+# - Streamlit 없이 동작 (oci_api 에서 사용) — 대시보드 화면은 oci_sections.export_section
+# ---------------------------------------------------------
+
+import io
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+CHUNK_ROWS = 50_000
+READ_BYTES = 1 << 20
+
+# 형식 → (확장자, MIME)
+FORMATS = {
+    "CSV": (".csv", "text/csv"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+    "Excel": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+
+# ============================ 조각 단위 인코딩 ============================
+def _chunks(df: pd.DataFrame, chunk_rows: int):
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def iter_csv(df: pd.DataFrame, chunk_rows=CHUNK_ROWS):
+    """UTF-8-SIG CSV (엑셀 호환, 기존 다운로드와 같은 바이트)"""
+    yield df.iloc[:0].to_csv(index=False).encode("utf-8-sig")
+    for chunk in _chunks(df, chunk_rows):
+        yield chunk.to_csv(index=False, header=False).encode("utf-8")
+
+
+class _Sink(io.RawIOBase):
+    """ParquetWriter 출력 버퍼 — 행 그룹마다 비워서 조각으로 내보냄"""
+
+    def __init__(self):
+        self.parts = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.parts.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data, self.parts = b"".join(self.parts), []
+        return data
+
+
+def iter_parquet(df: pd.DataFrame, chunk_rows=CHUNK_ROWS):
+    """chunk 하나 = 행 그룹 하나"""
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    sink = _Sink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for chunk in _chunks(df, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def iter_excel(df: pd.DataFrame, chunk_rows=CHUNK_ROWS):
+    """openpyxl write-only 시트 (행 단위 기록)
+
+    xlsx(zip) 는 wb.save 가 끝나야 완성되므로 첫 조각까지 전체 인코딩을 기다림 (스트리밍 불가)
+    → 완성된 파일은 임시 파일에 두고 READ_BYTES 씩 읽어 보냄
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("OCI")
+    ws.append([str(c) for c in df.columns])
+    for chunk in _chunks(df, chunk_rows):
+        for row in chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None):
+            ws.append(row)
+    with tempfile.TemporaryFile() as f:
+        wb.save(f)
+        f.seek(0)
+        while data := f.read(READ_BYTES):
+            yield data
+
+
+_WRITERS = {"CSV": iter_csv, "Parquet": iter_parquet, "Excel": iter_excel}
+
+
+def iter_export(df: pd.DataFrame, fmt="CSV", chunk_rows=CHUNK_ROWS):
+    if fmt not in _WRITERS:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (가능: {list(_WRITERS)})")
+    return _WRITERS[fmt](df, chunk_rows)
+
+
+def write_export(df: pd.DataFrame, path, fmt="CSV", chunk_rows=CHUNK_ROWS) -> Path:
+    """조각을 path 에 차례로 기록 — 임시 이름에 쓴 뒤 교체 (다른 세션이 쓰다 만 파일을 읽지 않음)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for data in iter_export(df, fmt, chunk_rows):
+                f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return path
@@ -0,0 +1,95 @@
+# oci_figures.py
+# ---------------------------------------------------------
+# 대시보드 Plotly 그림 빌더 (메모이즈)
+# - 입력(리그 데이터 버전, 팀, 선수, top_n …)이 같으면 모든 세션이 같은 Figure 재사용
+# - LeagueIndex 는 내용 대신 version(파일 서명)으로 해시
+# - 반환 Figure 는 공유 객체이므로 호출 측에서 수정하지 말 것
+# - plotly 는 그림을 처음 그릴 때 import (대시보드 프로세스 기동 시간 단축)
+# ---------------------------------------------------------
+
+from typing import TYPE_CHECKING
+
+import streamlit as st
+
+from league_index import RADAR_COLS, LeagueIndex
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+_HASH = {LeagueIndex: lambda idx: idx.version}
+_cached_figure = st.cache_resource(show_spinner=False, max_entries=512, hash_funcs=_HASH)
+
+
+def _radar_values(idx: LeagueIndex, player) -> tuple:
+    row = idx.row(player)
+    cats = [c for c in RADAR_COLS if c in idx.df.columns]
+    vals = [row[c] for c in cats]
+    return row, cats + [cats[0]], vals + [vals[0]]
+
+
+@_cached_figure
+def profile_radar(idx: LeagueIndex, team, player) -> "go.Figure":
+    """선수 프로파일 레이더 (축 범위: 팀 필터 기준)"""
+    row, cats_c, vals_c = _radar_values(idx, player)
+    import plotly.graph_objects as go
+
+    rmin, rmax = idx.axis_range(team)
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(r=vals_c, theta=cats_c, fill='toself', name=player))
+    fig.update_layout(
+        title=f"{player} (팀: {row['팀']})",
+        polar=dict(radialaxis=dict(visible=True, range=[rmin, rmax])),
+        showlegend=False,
+        height=420
+    )
+    return fig
+
+
+@_cached_figure
+def compare_radar(idx: LeagueIndex, team, players: tuple) -> "go.Figure":
+    """선수 비교 레이더"""
+    import plotly.graph_objects as go
+
+    rmin, rmax = idx.axis_range(team)
+    fig = go.Figure()
+    for p in players:
+        row, cats_c, vals_c = _radar_values(idx, p)
+        fig.add_trace(go.Scatterpolar(
+            r=vals_c, theta=cats_c, fill='toself', name=f"{p} ({row['팀']})", opacity=0.6
+        ))
+    fig.update_layout(
+        title="선수 비교 레이더",
+        polar=dict(radialaxis=dict(visible=True, range=[rmin, rmax])),
+        height=460
+    )
+    return fig
+
+
+@_cached_figure
+def rank_bar(idx: LeagueIndex, team, top_n: int, bottom=False, intervals=None) -> "go.Figure":
+    """OCI Top(파랑) / Bottom(빨강) N 막대 (intervals 가 있으면 부트스트랩 95% 구간 오차 막대)"""
+    import plotly.express as px
+
+    df = idx.ranking(team, top_n, bottom)
+    error = {}
+    if intervals is not None and len(intervals):
+        df = df.merge(intervals[["선수", "OCI_하한", "OCI_상한"]], on="선수", how="left")
+        df["오차_상"] = df["OCI_상한"] - df["OCI"]
+        df["오차_하"] = df["OCI"] - df["OCI_하한"]
+        error = dict(error_y="오차_상", error_y_minus="오차_하")
+    fig = px.bar(df, x="선수", y="OCI", color="OCI",
+                 color_continuous_scale="Reds" if bottom else "Blues", height=420, **error)
+    fig.update_layout(xaxis_tickangle=-30)
+    return fig
+
+
+@_cached_figure
+def team_top10_bar(idx: LeagueIndex) -> "go.Figure":
+    """리그 Top10 팀별 인원 막대 (필터와 무관)"""
+    import plotly.express as px
+
+    fig = px.bar(idx.top10_counts, x="팀", y="Top10_인원", text="Top10_인원",
+                 color="Top10_인원", color_continuous_scale="Viridis", height=420)
+    fig.update_traces(textposition="outside")
+    return fig
+
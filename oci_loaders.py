@@ -0,0 +1,159 @@
+# oci_loaders.py
+# ---------------------------------------------------------
+# 지표 파일 위치 / 리그 레지스트리 / 전처리 / 캐시 없는 로더 (Streamlit 없이 동작)
+# - oci_api·oci_report 가 직접 사용, 대시보드(oci_data)는 이 함수들을 캐시로 감싸 사용
+# - 문제는 예외(ValueError)로 올리고 안내는 로그(logger "oci.data")로 — 화면 표시는 oci_data 몫
+#
+# 사용 예)
+#   idx = read_league_index(league_file("남자부"))
+#   paths = {name: spec.path() for name, spec in league_registry().items()}
+# ---------------------------------------------------------
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from league_index import LeagueIndex, build_league_index
+from metrics import DEFAULT_ROUNDS, DEFAULT_SEASON, INDEX_COLS, LEAGUES, WEIGHTS, store, weight_vector
+
+logger = logging.getLogger("oci.data")
+
+REQUIRED_COLS = ("선수", "팀", "ADI", "AER", "ER", "AEI", "OCI")
+METRIC_COLS = ("ADI", "AER", "ER", "AEI", "OCI")
+
+# ============================ 파일 위치 ============================
+def league_file(gender: str, season=DEFAULT_SEASON, rounds=DEFAULT_ROUNDS) -> Path:
+    """리그 지표 파일: 저장소 Parquet 파티션이 있으면 그것, 없으면 CSV"""
+    parquet = store.index_file(season, gender, rounds)
+    return parquet if parquet is not None else Path(f"{gender}_지표.csv")
+
+# ============================ 리그 레지스트리 ============================
+# 이름 → 지표 위치. 기본은 metrics.LEAGUES 의 정규 시즌, 추가 리그는 oci_leagues.json:
+#   {"KOVO컵 남자부": {"gender": "남자부", "season": "2024 통영·도드람컵", "rounds": [1, 1]},
+#    "올스타": {"gender": "여자부", "file": "올스타_지표.csv"}}
+LEAGUES_FILE = Path("oci_leagues.json")
+
+@dataclass(frozen=True)
+class LeagueSpec:
+    name: str
+    gender: str                         # 저장소 파티션 / 이력·팀 집계 키
+    season: str = DEFAULT_SEASON
+    rounds: tuple = DEFAULT_ROUNDS
+    file: str = ""                      # 지정하면 저장소 대신 이 지표 파일
+
+    def path(self) -> Path:
+        return Path(self.file) if self.file else league_file(self.gender, self.season, self.rounds)
+
+def custom_leagues(path: str, mtime_ns=None) -> dict:
+    """oci_leagues.json → {이름: LeagueSpec} (mtime_ns 는 캐시 키용, 읽기에는 쓰지 않음)"""
+    entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {name: LeagueSpec(name, **{**e, "rounds": tuple(e.get("rounds", DEFAULT_ROUNDS))})
+            for name, e in entries.items()}
+
+def league_registry(load_custom=custom_leagues) -> dict:
+    """{이름: LeagueSpec} (선택지 순서 = 기본 리그 → oci_leagues.json 순서)
+
+    load_custom: oci_leagues.json 읽기 (경로, mtime_ns) — 대시보드는 캐시 버전을 넘김
+    """
+    registry = {g: LeagueSpec(g, g) for g in LEAGUES}
+    if LEAGUES_FILE.exists():
+        registry.update(load_custom(str(LEAGUES_FILE), LEAGUES_FILE.stat().st_mtime_ns))
+    return registry
+
+# ============================ 전처리 유틸 ============================
+def read_csv_safe(path):
+    """UTF-8-SIG 우선, 실패 시 CP949로 재시도"""
+    try:
+        return pd.read_csv(path, encoding="utf-8-sig")
+    except Exception:
+        return pd.read_csv(path, encoding="cp949")
+
+def read_table(path, columns=REQUIRED_COLS) -> pd.DataFrame:
+    """Parquet 이면 필요한 컬럼만 읽고, CSV 면 read_csv_safe"""
+    if Path(path).suffix == ".parquet":
+        return pd.read_parquet(path, columns=list(columns))
+    return read_csv_safe(path)
+
+# 전처리 함수는 얕은 복사(데이터 공유)만 — 컬럼을 통째로 바꿔 끼우므로 입력 DF 는 그대로
+def clean_columns(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy(deep=False)
+    df.columns = (
+        df.columns.astype(str)
+        .str.replace("\ufeff", "", regex=True)  # BOM 제거
+        .str.strip()
+    )
+    return df
+
+def coerce_metrics(df: pd.DataFrame, metrics=METRIC_COLS, strip_names=False) -> pd.DataFrame:
+    df = df.copy(deep=False)
+    for c in metrics:
+        if c in df.columns:
+            df[c] = pd.to_numeric(df[c], errors="coerce")
+    # 문자열 컬럼 공백 정리
+    if strip_names:
+        for c in ["선수", "팀"]:
+            if c in df.columns:
+                df[c] = df[c].astype(str).str.strip()
+    return df
+
+def missing_required(df: pd.DataFrame, required=REQUIRED_COLS) -> list:
+    return sorted(set(required) - set(df.columns))
+
+def needs_oidr(df: pd.DataFrame) -> bool:
+    """OCI 컬럼이 없거나 모두 NaN"""
+    return "OCI" not in df.columns or df["OCI"].isna().all()
+
+def ensure_oidr(df: pd.DataFrame) -> pd.DataFrame:
+    """OIDR 미존재/NaN이면 기본 가중치(metrics.WEIGHTS)로 계산 (표준화 값 가정: ADI/AER/ER/AEI)
+
+    계산에 필요한 컬럼이 없으면 ValueError
+    """
+    if not needs_oidr(df):
+        return df
+    missing = [k for k in INDEX_COLS if k not in df.columns]
+    if missing:
+        raise ValueError(f"임시 OCI 계산 불가 (누락 컬럼: {missing})")
+    df = df.copy(deep=False)
+    df["OCI"] = df[list(INDEX_COLS)].to_numpy(dtype=float) @ weight_vector(WEIGHTS)
+    logger.info("OCI 값이 없어 기본 가중치로 계산 (%s)", ", ".join(f"{k} {v:+g}" for k, v in WEIGHTS.items()))
+    return df
+
+def scale_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    """지표 0~1 정규화 (MinMaxScaler 와 같은 규칙: 결측은 무시하고 유지, 값이 모두 같은 컬럼은 0)"""
+    df = df.copy(deep=False)
+    scale_cols = list(METRIC_COLS)
+    x = df[scale_cols].to_numpy(dtype=float)
+    lo, hi = np.nanmin(x, axis=0), np.nanmax(x, axis=0)
+    span = hi - lo
+    span[span == 0] = 1.0
+    df[scale_cols] = (x - lo) / span
+    return df
+
+def compact_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    """세션 공유용 압축: 선수/팀 category, 지표 float32 (읽기 전용으로 사용)
+
+    category 는 값이 반복될 때만 이득 → 고유값이 행의 절반을 넘는 컬럼(보통 선수)은 그대로
+    """
+    dtypes = {c: np.float32 for c in METRIC_COLS if c in df.columns}
+    for c in ("선수", "팀"):
+        if c in df.columns and df[c].nunique() * 2 <= len(df):
+            dtypes[c] = "category"
+    return df.astype(dtypes)
+
+# ============================ 캐시 없는 로더 (API·정적 리포트) ============================
+def read_league_index(path) -> LeagueIndex:
+    """지표 파일 → LeagueIndex (대시보드 load_league_index 와 같은 전처리, 필수 컬럼 누락은 ValueError)"""
+    path = Path(path)
+    raw = path.read_bytes()
+    df = clean_columns(read_table(path))
+    missing = missing_required(df)
+    if missing:
+        raise ValueError(f"필수 컬럼 누락: {missing} ({path})")
+    df = ensure_oidr(coerce_metrics(df))
+    version = (str(path.resolve()), path.stat().st_mtime_ns, hashlib.sha1(raw).hexdigest())
+    return build_league_index(df, version)
@@ -0,0 +1,289 @@
+# oci_report.py
+# ---------------------------------------------------------
+# 정적 리포트 스냅샷 (HTML + JSON) — 대시보드 없이 읽는 스카우팅 사이트
+# - 데이터 갱신 후 한 번: 리그 × 팀 × 선수 뷰(KPI 카드, 레이더, 순위, 유사 선수)를 모두 미리 생성
+#   report/index.html                     리그 목록
+#   report/<리그>/index.html|json          OCI 순위 전체 + 팀별 Top10 인원
+#   report/<리그>/teams/<팀>.html|json     팀 내 순위
+#   report/<리그>/players/<선수>.html|json KPI + 레이더(SVG) + 리그/팀 순위 + 유사 선수
+#   report/manifest.json                  생성 시각, 리그별 데이터 버전
+# - 선수 페이지는 묶음(chunk) 단위로 프로세스 풀에서 생성 (리그 인덱스는 작업자마다 한 번만 전달)
+# - <out>.tmp 에 만든 뒤 통째로 교체 → 정적 서버/CDN 이 만들다 만 사이트를 보지 않음
+# - JSON 키는 oci_api 응답과 같은 이름 (player, team, metrics, league_rank …)
+#
+# 사용 예)
+#   python oci_report.py --out report
+#   python oci_report.py --out report --workers 4
+#   python kovo_ext.py --report report          # 스크랩 → 지표 재계산 → 리포트
+# ---------------------------------------------------------
+
+import argparse
+import html
+import json
+import math
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import quote
+
+from league_index import ALL_TEAMS, RADAR_COLS, LeagueIndex
+from oci_loaders import league_registry, read_league_index
+
+METRIC_KEYS = [*RADAR_COLS, "OCI"]
+CHUNK = 200                 # 작업 하나당 선수 페이지 수
+SIMILAR_K = 5
+
+_STYLE = """body{font-family:system-ui,sans-serif;margin:24px auto;max-width:980px;color:#0f172a}
+a{color:#1d4ed8;text-decoration:none}table{border-collapse:collapse;width:100%}
+th,td{padding:6px 10px;border-bottom:1px solid #e5e7eb;text-align:left}td.num{text-align:right}
+.kpi{display:grid;grid-template-columns:repeat(5,1fr);gap:12px;margin:16px 0}
+.kpi div{padding:14px;border-radius:14px;background:#f8f9fb;border:1px solid #e9edf5}
+.kpi b{display:block;font-size:26px}.neg{color:#b91c1c}.muted{color:#64748b;font-size:13px}
+"""
+
+_PAGE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{title}</title>
+<link rel="stylesheet" href="{root}style.css"></head>
+<body><p class="muted"><a href="{root}index.html">🏐 OCI 리포트</a>{crumbs}</p>
+<h1>{title}</h1>
+{body}
+<p class="muted">생성: {generated}</p></body></html>
+"""
+
+
+# ============================ 공용 ============================
+def slug(text) -> str:
+    """파일 이름 (경로 구분자·공백 등 → _)"""
+    return re.sub(r'[\\/:*?"<>|\s]+', "_", str(text)).strip("_") or "_"
+
+
+def _href(*parts) -> str:
+    return "/".join(quote(p) for p in parts)
+
+
+def _num(value):
+    """NaN → None (JSON null)"""
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def _fmt(value, nd=3) -> str:
+    return "NA" if value is None or (isinstance(value, float) and math.isnan(value)) else f"{value:.{nd}f}"
+
+
+def _write(path: Path, payload: dict, page: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.with_suffix(".json").write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    path.with_suffix(".html").write_text(page, encoding="utf-8")
+
+
+def _page(title, body, root, generated, crumbs=()) -> str:
+    crumb_html = "".join(f" › <a href=\"{h}\">{html.escape(t)}</a>" for t, h in crumbs)
+    return _PAGE.format(title=html.escape(title), body=body, root=root, crumbs=crumb_html, generated=generated)
+
+
+def _rank_table(rows, root) -> str:
+    """[(순위, 선수, 팀, OCI)] → HTML 표 (선수/팀 링크)"""
+    lines = ["<table><tr><th>순위</th><th>선수</th><th>팀</th><th>OCI</th></tr>"]
+    for rank, player, team, oci in rows:
+        lines.append(
+            f"<tr><td class=num>{rank}</td>"
+            f"<td><a href=\"{root}players/{_href(slug(player))}.html\">{html.escape(str(player))}</a></td>"
+            f"<td><a href=\"{root}teams/{_href(slug(team))}.html\">{html.escape(str(team))}</a></td>"
+            f"<td class=num>{_fmt(oci)}</td></tr>")
+    lines.append("</table>")
+    return "\n".join(lines)
+
+
+def _ranked_rows(idx: LeagueIndex, team=ALL_TEAMS) -> list:
+    rank_df = idx.ranking(team)
+    return [(r, p, t, _num(v)) for r, (p, t, v) in enumerate(rank_df.itertuples(index=False, name=None), start=1)]
+
+
+def radar_svg(values: dict, axis_range: tuple, size=280) -> str:
+    """ADI/AER/ER/AEI 레이더 (축 범위 = 리그 레이더 범위, NaN 은 중심)"""
+    lo, hi = axis_range
+    c, radius = size / 2, size / 2 - 36
+    angles = [-math.pi / 2 + k * 2 * math.pi / len(RADAR_COLS) for k in range(len(RADAR_COLS))]
+
+    def xy(frac, a):
+        return c + radius * frac * math.cos(a), c + radius * frac * math.sin(a)
+
+    def point(frac, a):
+        return "{:.1f},{:.1f}".format(*xy(frac, a))
+
+    fracs = [0.0 if v is None else min(max((v - lo) / (hi - lo), 0.0), 1.0) for v in (values[k] for k in RADAR_COLS)]
+    grid = " ".join(point(1, a) for a in angles)
+    shape = " ".join(point(f, a) for f, a in zip(fracs, angles))
+    labels = "".join(
+        f'<text x="{c + (radius + 18) * math.cos(a):.1f}" y="{c + (radius + 18) * math.sin(a) + 4:.1f}" '
+        f'text-anchor="middle" font-size="12">{k}</text>' for k, a in zip(RADAR_COLS, angles))
+    axes = "".join('<line x1="{0}" y1="{0}" x2="{1:.1f}" y2="{2:.1f}" stroke="#cbd5e1"/>'.format(c, *xy(1, a))
+                   for a in angles)
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 {size} {size}">'
+            f'<polygon points="{grid}" fill="none" stroke="#cbd5e1"/>{axes}'
+            f'<polygon points="{shape}" fill="#3b82f655" stroke="#2563eb"/>{labels}</svg>')
+
+
+# ============================ 선수 페이지 (작업자) ============================
+_INDICES = {}               # 리그 → LeagueIndex (작업자 프로세스마다 한 번 받음)
+
+
+def _init_worker(indices: dict) -> None:
+    _INDICES.update(indices)
+
+
+def player_arrays(idx: LeagueIndex) -> tuple:
+    """(선수, 팀, 지표 행렬[ADI, AER, ER, AEI, OCI]) — 선수 페이지마다 DataFrame 을 만들지 않도록"""
+    df = idx.df
+    return df["선수"].to_numpy(dtype=object), df["팀"].to_numpy(dtype=object), df[METRIC_KEYS].to_numpy(dtype=float)
+
+
+def _text(value):
+    return value if isinstance(value, str) else None
+
+
+def player_payload(idx: LeagueIndex, league: str, player: str, arrays=None) -> dict:
+    names, teams, metrics = arrays or player_arrays(idx)
+    pos = idx.row_of[player]
+    league_rank, league_n = idx.league_rank(player)
+    team_rank, team_n = idx.team_rank(player)
+    rows, dist = idx.neighbors.query(pos, SIMILAR_K)
+    return {
+        "player": player,
+        "league": league,
+        "team": _text(teams[pos]),
+        "metrics": {c: _num(v) for c, v in zip(METRIC_KEYS, metrics[pos])},
+        "league_rank": league_rank,
+        "league_size": league_n,
+        "team_rank": team_rank,
+        "team_size": team_n,
+        "similar": [{"player": names[r], "team": _text(teams[r]), "distance": _num(d)} for r, d in zip(rows, dist)],
+    }
+
+
+def player_page(payload: dict, axis_range: tuple, generated: str) -> str:
+    m = payload["metrics"]
+    cards = "".join(
+        f'<div>{k}<b class="{"neg" if k == "OCI" and (m[k] or 0) < 0 else ""}">{_fmt(m[k])}</b></div>'
+        for k in METRIC_KEYS)
+    lr, ln, tr, tn = payload["league_rank"], payload["league_size"], payload["team_rank"], payload["team_size"]
+    ranks = (f"<p>리그 {lr}위 / {ln}명 · 상위 {100.0 * (ln - lr + 1) / ln:.1f}%</p>" if lr else "<p>리그 순위 정보 없음</p>")
+    ranks += f"<p>{html.escape(str(payload['team']))} {tr}위 / {tn}명</p>" if tr else "<p>팀 순위 정보 없음</p>"
+    similar = "".join(
+        f'<li><a href="{_href(slug(s["player"]))}.html">{html.escape(str(s["player"]))}</a> '
+        f'({html.escape(str(s["team"]))}) · 거리 {_fmt(s["distance"])}</li>' for s in payload["similar"])
+    body = (f'<div class="kpi">{cards}</div>{ranks}'
+            f'{radar_svg(m, axis_range)}'
+            f'<h2>비슷한 유형의 선수</h2><ul>{similar}</ul>')
+    team = str(payload["team"])
+    return _page(f"{payload['player']} ({team})", body, "../../", generated,
+                 crumbs=[(payload["league"], "../index.html"), (team, f"../teams/{_href(slug(team))}.html")])
+
+
+def _render_players(task) -> int:
+    league, players, out_dir, generated = task
+    idx = _INDICES[league]
+    axis_range, arrays = idx.axis_range(), player_arrays(idx)
+    for player in players:
+        payload = player_payload(idx, league, player, arrays)
+        _write(Path(out_dir) / slug(league) / "players" / slug(player), payload,
+               player_page(payload, axis_range, generated))
+    return len(players)
+
+
+# ============================ 리그 / 팀 페이지 ============================
+def _render_league(idx: LeagueIndex, league: str, out_dir: Path, generated: str) -> int:
+    base = out_dir / slug(league)
+    rows = _ranked_rows(idx)
+    top10 = [{"team": t, "count": int(n)} for t, n in idx.top10_counts.itertuples(index=False, name=None)]
+    payload = {"league": league, "version": list(idx.version), "teams": idx.teams,
+               "rankings": [{"rank": r, "player": p, "team": t, "OCI": v} for r, p, t, v in rows],
+               "top10_counts": top10}
+    team_links = " · ".join(f'<a href="teams/{_href(slug(t))}.html">{html.escape(t)}</a>' for t in idx.teams)
+    top10_html = "".join(f"<li>{html.escape(str(d['team']))}: {d['count']}명</li>" for d in top10)
+    body = (f"<p>{team_links}</p><h2>팀별 Top10 포함 선수 수</h2><ul>{top10_html}</ul>"
+            f"<h2>OCI 순위</h2>{_rank_table(rows, '')}")
+    _write(base / "index", payload, _page(f"{league} OCI 랭킹", body, "../", generated))
+
+    for team in idx.teams:
+        rows = _ranked_rows(idx, team)
+        payload = {"league": league, "team": team, "players": idx.team_players(team),
+                   "rankings": [{"rank": r, "player": p, "team": t, "OCI": v} for r, p, t, v in rows]}
+        _write(base / "teams" / slug(team), payload,
+               _page(f"{team} — {league}", _rank_table(rows, "../"), "../../", generated,
+                     crumbs=[(league, "../index.html")]))
+    return 1 + len(idx.teams)
+
+
+# ============================ 빌드 ============================
+def default_leagues() -> dict:
+    """{리그 이름: 지표 파일} — 대시보드와 같은 레지스트리"""
+    return {name: spec.path() for name, spec in league_registry().items()}
+
+
+def build_report(out_dir="report", leagues=None, workers=None, chunk=CHUNK) -> int:
+    """리그 × 팀 × 선수 페이지를 out_dir 에 생성 (통째로 교체), 페이지 수 반환
+
+    leagues: {리그 이름: 지표 파일} (None 이면 default_leagues)
+    workers: 프로세스 수 (None 이면 CPU 수, 1 이면 현재 프로세스에서 실행)
+    """
+    out_dir = Path(out_dir)
+    tmp = out_dir.with_name(out_dir.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    generated = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    indices = {name: read_league_index(path) for name, path in (leagues or default_leagues()).items()
+               if Path(path).exists()}
+    pages = sum(_render_league(idx, name, tmp, generated) for name, idx in indices.items())
+
+    tasks = []
+    for name, idx in indices.items():
+        players = idx.team_players()
+        tasks += [(name, players[i:i + chunk], str(tmp), generated) for i in range(0, len(players), chunk)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        _init_worker(indices)
+        pages += sum(_render_players(t) for t in tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), initializer=_init_worker,
+                                 initargs=(indices,)) as pool:
+            pages += sum(pool.map(_render_players, tasks))
+
+    (tmp / "style.css").write_text(_STYLE, encoding="utf-8")
+    manifest = {"generated": generated, "pages": pages,
+                "leagues": {name: {"version": list(idx.version), "players": len(idx.team_players()),
+                                   "teams": idx.teams} for name, idx in indices.items()}}
+    (tmp / "manifest.json").write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    links = "".join(f'<li><a href="{_href(slug(n))}/index.html">{html.escape(n)}</a> '
+                    f'<span class="muted">{len(idx.team_players())}명</span></li>' for n, idx in indices.items())
+    (tmp / "index.html").write_text(_page("OCI 스카우팅 리포트", f"<ul>{links}</ul>", "", generated),
+                                    encoding="utf-8")
+
+    # 이전 스냅샷과 교체
+    old = out_dir.with_name(out_dir.name + ".old")
+    shutil.rmtree(old, ignore_errors=True)
+    if out_dir.exists():
+        out_dir.rename(old)
+    tmp.rename(out_dir)
+    shutil.rmtree(old, ignore_errors=True)
+    return pages
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="OCI 정적 리포트(HTML/JSON) 생성")
+    parser.add_argument("--out", default="report")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="작업 하나당 선수 페이지 수")
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    pages = build_report(args.out, workers=args.workers, chunk=args.chunk)
+    print(f"리포트 {pages}페이지 → {args.out} ({time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,480 @@
+# oci_sections.py
+# ---------------------------------------------------------
+# OCI 스카우팅 리포트 (Streamlit) 화면 구성 — 통합 대시보드 하나
+# - dashbord.py (표준화 지표로 시작) / v1_dashbord.py (0~1 정규화로 시작) 는 main() 만 호출
+# - 보기 모드: 표준화 지표(z-score) / 0~1 정규화 — 사이드바에서 전환, 같은 섹션을 공유
+# - 리그 = oci_data.league_registry() 의 LeagueSpec (남자부/여자부 + oci_leagues.json)
+#   신뢰구간·추이·검증 보고서는 리그 스펙(시즌·라운드) 기준 — 없는 리그는 해당 섹션을 숨김
+# - 슬라이더·선택을 바꾸면 그 섹션만 다시 그리도록 fragment 로 분리
+# - 내보내기: OCI_API_URL 이 있으면 API 스트리밍 링크, 없으면 임시 파일에 조각 단위로 기록 후 다운로드
+#   (Streamlit 다운로드 버튼은 파일 내용을 세션 미디어 저장소에 올림 — 큰 파일은 API 링크 권장)
+#
+# 사용 예)
+#   streamlit run dashbord.py
+#   streamlit run v1_dashbord.py
+# ---------------------------------------------------------
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from urllib.parse import quote, urlencode
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import oci_figures
+from oci_timing import lap, start_run, timed, timer, timing_panel
+from oci_export import FORMATS, write_export
+from oci_data import league_registry, load_history, load_intervals, load_league, load_validation
+from league_index import RADAR_COLS
+from metrics import DEFAULT_ROUNDS, DEFAULT_SEASON, INDEX_COLS, LEAGUES, WEIGHTS, validate, weights
+
+# 보기 모드 → 0~1 정규화 여부
+VIEW_MODES = {"표준화 지표": False, "0~1 정규화": True}
+
+# 내보내기: API 주소(있으면 스트리밍 링크) / 임시 파일 위치와 보관 개수
+EXPORT_API = os.environ.get("OCI_API_URL", "").rstrip("/")
+EXPORT_DIR = Path(tempfile.gettempdir()) / "oci_export"
+EXPORT_KEEP = 16
+
+KPI_CSS = """
+<style>
+.kpi-grid-left{display:grid;grid-template-columns:repeat(4,minmax(0,1fr));gap:12px}
+.kpi{padding:16px;border-radius:16px;background:#f8f9fb;border:1px solid #e9edf5}
+.kpi .label{font-size:13px;color:#6b7280;margin-bottom:6px}
+.kpi .value{font-size:28px;font-weight:800;color:#111827;line-height:1}
+.kpi .sub{font-size:12px;color:#9ca3af;margin-top:4px}
+.kpi .tag{display:inline-flex;align-items:center;gap:6px;padding:4px 10px;border-radius:999px;background:#fff;border:1px solid #e5e7eb;font-size:12px;color:#374151;margin-top:6px}
+.kpi .emoji{font-size:18px}
+
+.kpi.span2{grid-column:span 2}         /* 상단 2분할 */
+.kpi-oci{padding:22px;border-radius:20px;background:linear-gradient(135deg,#eef2ff,#e0f2fe);border:1px solid #cfe8ff}
+.kpi-oci.negative{background:linear-gradient(135deg,#fff1f2,#fee2e2);border-color:#fecaca}
+.kpi-oci .label{font-size:14px;color:#334155}
+.kpi-oci .value{font-size:40px}
+.kpi-oci .sub{font-size:13px}
+</style>
+"""
+
+POWER_RANKING_CSS = """
+<style>
+.pr-wide{margin-top:18px;padding:22px 28px;border-radius:18px;
+         background:linear-gradient(135deg,#f0f9ff,#e0f2fe);
+         border:1px solid #bae6fd;}
+.pr-title{font-size:17px;font-weight:700;color:#0f172a;margin-bottom:12px;display:flex;align-items:center;gap:6px}
+.pr-grid{display:grid;grid-template-columns:1fr 1fr;gap:20px;align-items:center;text-align:center;}
+.pr-item{background:#ffffffb3;padding:16px;border-radius:14px;border:1px solid #dbeafe;}
+.pr-value{font-size:38px;font-weight:800;color:#0f172a;line-height:1.1}
+.pr-sub{font-size:14px;color:#475569;margin-top:4px}
+.pr-badge{display:inline-flex;align-items:center;gap:6px;
+          background:#fff;border:1px solid #cbd5e1;
+          padding:4px 10px;border-radius:999px;font-size:12px;color:#334155;margin-top:14px}
+</style>
+"""
+
+
+def _fmt(x, nd=3):
+    return "NA" if pd.isna(x) else f"{x:.{nd}f}"
+
+
+# ============================ KPI (2단 + 4단 + OCI 대형) ============================
+def kpi_section(idx, league, sel_team, sel_player):
+    st.subheader("🏐 선수 KPI (선택 선수의 실제 지표값)")
+    st.markdown(KPI_CSS, unsafe_allow_html=True)
+    if not (sel_player and idx.has_player(sel_player, sel_team)):
+        st.info("선수를 선택하세요.")
+        return
+    prow = idx.row(sel_player)
+    v_oci, v_adi, v_aer, v_er, v_aei = (prow.get(c, np.nan) for c in ("OCI", "ADI", "AER", "ER", "AEI"))
+
+    # 전체 영역을 좌/우로 나눔: 왼쪽(2행 그리드), 오른쪽(OCI 대형)
+    col_left, col_right = st.columns([2,1], gap="large")
+
+    # ----- 왼쪽: 상단 2분할(선수/팀) + 하단 4분할(ADI/AER/ER/AEI)
+    with col_left:
+        st.markdown(f"""
+        <div class="kpi-grid-left">
+          <!-- 상단 2분할 -->
+          <div class="kpi span2">
+            <div class="label">선수</div>
+            <div class="value">{prow['선수']}</div>
+            <div class="tag"><span class="emoji">🧑🏻‍🦱</span>선수명</div>
+          </div>
+          <div class="kpi span2">
+            <div class="label">팀</div>
+            <div class="value">{prow['팀']}</div>
+            <div class="tag"><span class="emoji">🏟️</span>소속팀</div>
+          </div>
+
+          <!-- 하단 4분할 -->
+          <div class="kpi">
+            <div class="label">ADI (다양성)</div>
+            <div class="value">{_fmt(v_adi)}</div>
+            <div class="sub">공격 루트 분산도</div>
+          </div>
+          <div class="kpi">
+            <div class="label">AER (참여도)</div>
+            <div class="value">{_fmt(v_aer)}</div>
+            <div class="sub">공격 관여 비율</div>
+          </div>
+          <div class="kpi">
+            <div class="label">ER (낮을수록↑)</div>
+            <div class="value">{_fmt(v_er)}</div>
+            <div class="sub">범실·실패 영향</div>
+          </div>
+          <div class="kpi">
+            <div class="label">AEI (효율기여)</div>
+            <div class="value">{_fmt(v_aei)}</div>
+            <div class="sub">팀 효율에 대한 기여</div>
+          </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # ----- 오른쪽: OCI 대형 카드
+    with col_right:
+        oci_cls = "kpi-oci negative" if (pd.notna(v_oci) and v_oci < 0) else "kpi-oci"
+        st.markdown(f"""
+        <div class="{oci_cls}">
+          <div class="label">🏐 OCI (종합 파워랭킹 점수)</div>
+          <div class="value">{_fmt(v_oci)}</div>
+          <div class="sub">효율·다양성·참여·안정성 통합 지표</div>
+          <div class="tag"><span class="emoji">📈</span>{league} 영향력</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+# ============================ Power Ranking 미니박스 ============================
+def power_ranking_box(idx, league, sel_player):
+    # 리그/팀 내 순위는 인덱스에서 O(1) 조회 (검색 결과가 없으면 (None, 인원))
+    league_rank, total_n = idx.league_rank(sel_player)
+    pct = 100.0 * (total_n - league_rank + 1) / total_n if league_rank else None
+    team_rank, team_n = idx.team_rank(sel_player)
+
+    league_txt = f"리그 {league_rank}위 / {total_n}명" if league_rank else "리그 순위 정보 없음"
+    pct_txt = f"상위 {_fmt(pct, 1)}%" if pct else ""
+    team_txt = f"{idx.row(sel_player)['팀']} {team_rank}위 / {team_n}명" if team_rank else "팀 순위 정보 없음"
+
+    st.markdown(POWER_RANKING_CSS, unsafe_allow_html=True)
+    st.markdown(f"""
+    <div class="pr-wide">
+      <div class="pr-title">🏆 Power Ranking</div>
+      <div class="pr-grid">
+        <div class="pr-item">
+          <div class="pr-value">{f'{league_rank} 위' if league_rank else 'NA'}</div>
+          <div class="pr-sub">{league_txt} · {pct_txt}</div>
+        </div>
+        <div class="pr-item">
+          <div class="pr-value">{f'{team_rank} 위' if team_rank else 'NA'}</div>
+          <div class="pr-sub">팀 내 순위 · {team_txt}</div>
+        </div>
+      </div>
+      <div class="pr-badge">📊 {league} 리그 파워랭킹 기준</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+# ============================ 레이더 ============================
+def radar_section(idx, sel_team, sel_player):
+    st.subheader("📈 선수 프로파일 (레이더)")
+    if sel_player and idx.has_player(sel_player, sel_team):
+        # 데이터 버전·팀·선수가 같으면 캐시된 Figure 재사용 (축 범위: 팀별 사전 계산)
+        st.plotly_chart(oci_figures.profile_radar(idx, sel_team, sel_player), use_container_width=True)
+    else:
+        st.info("선수를 선택하세요.")
+
+
+# ============================ OCI Top/Bottom ============================
+# 리그에 부트스트랩 구간(python -m metrics --bootstrap N)이 있으면 순위 구간 표시
+def with_rank_interval(rank_df, intervals):
+    if intervals is None:
+        return rank_df
+    ci = intervals.set_index("선수")
+    names = rank_df["선수"].astype(object)   # category 끼리 map 하면 결과가 category 가 될 수 있음
+    lo = names.map(ci["순위_하한"])
+    hi = names.map(ci["순위_상한"])
+    label = lo.map("{:.0f}".format) + "–" + hi.map("{:.0f}".format)
+    return rank_df.assign(**{"순위 95% 구간": label.where(lo.notna() & hi.notna(), "NA")})
+
+# fragment: Top/Bottom N 슬라이더를 바꾸면 이 섹션만 다시 그림
+# error_bars: OCI 오차 막대 (구간은 표준화 OCI 기준 → 0~1 정규화 보기에서는 순위 구간만)
+@st.fragment
+@timed("ranking")
+def ranking_section(idx, league, sel_team, n_view, intervals, error_bars=True):
+    st.subheader(f"🏆 {league} OCI 랭킹")
+    if not len(idx.rank_rows(sel_team)):
+        st.warning("⚠️ OCI 값을 찾을 수 없습니다.")
+        return
+    top_n = st.slider(
+        "Top/Bottom N",
+        min_value=5,
+        max_value=max(5, min(15, n_view)),
+        value=min(10, n_view) if n_view >= 10 else n_view
+    )
+    bars = intervals if error_bars else None
+    c1, c2 = st.columns(2)
+    with c1:
+        st.markdown("**Top 랭킹**")
+        st.plotly_chart(oci_figures.rank_bar(idx, sel_team, top_n, intervals=bars), use_container_width=True)
+        st.dataframe(with_rank_interval(idx.ranking(sel_team, top_n), intervals), hide_index=True)
+    with c2:
+        st.markdown("**Bottom 랭킹**")
+        st.plotly_chart(oci_figures.rank_bar(idx, sel_team, top_n, bottom=True, intervals=bars), use_container_width=True)
+        st.dataframe(with_rank_interval(idx.ranking(sel_team, top_n, bottom=True), intervals), hide_index=True)
+
+
+# ============================ OCI 가중치 실험 ============================
+# fragment: 가중치를 바꾸면 이 섹션만 다시 계산 (캐시된 지표 행렬 @ 가중치 벡터 한 번)
+def _apply_preset():
+    w = weights.load_presets()[st.session_state["w_preset"]]
+    for c in INDEX_COLS:
+        st.session_state[f"w_{c}"] = float(w[c])
+
+def _edit_preset(action):
+    # 버튼 콜백: 프래그먼트가 다시 그려지기 전에 실행 → 프리셋 목록에 바로 반영
+    try:
+        if action == "save":
+            weights.save_preset(st.session_state["w_name"],
+                                {c: st.session_state[f"w_{c}"] for c in INDEX_COLS})
+        else:
+            weights.delete_preset(st.session_state["w_name"])
+    except ValueError as e:
+        st.session_state["w_error"] = str(e)
+
+@st.fragment
+@timed("weights")
+def weights_section(idx, sel_team):
+    st.subheader("⚖️ OCI 가중치 실험")
+    presets = weights.load_presets()
+    for c in INDEX_COLS:
+        st.session_state.setdefault(f"w_{c}", float(WEIGHTS[c]))
+    st.selectbox("가중치 프리셋", list(presets), key="w_preset", on_change=_apply_preset)
+    w = {c: col.slider(c, min_value=-1.0, max_value=1.0, step=0.05, key=f"w_{c}")
+         for c, col in zip(INDEX_COLS, st.columns(len(INDEX_COLS)))}
+
+    with st.expander("프리셋 저장 / 삭제"):
+        st.text_input("프리셋 이름", key="w_name")
+        c1, c2 = st.columns(2)
+        c1.button("현재 가중치로 저장", on_click=_edit_preset, args=("save",))
+        c2.button("프리셋 삭제", on_click=_edit_preset, args=("delete",))
+        if "w_error" in st.session_state:
+            st.error(st.session_state.pop("w_error"))
+
+    rank_df = idx.reweighted_ranking(w, sel_team, top_n=15)
+    st.dataframe(rank_df, use_container_width=True, hide_index=True)
+    st.caption("ER 은 음수 가중치 = 감점 · 변동: 기존 OCI 순위 대비 상승(+)/하락(−)")
+
+
+# ============================ 팀별 Top10 인원 수 ============================
+def team_top10_section(idx, league):
+    st.subheader(f"🏟️ {league} 팀별 Top10 포함 선수 수")
+    # 전체(필터 무시) 기준 Top10 집계 (사전 집계, 그림도 캐시)
+    c3, c4 = st.columns([2,1])
+    with c3:
+        st.plotly_chart(oci_figures.team_top10_bar(idx), use_container_width=True)
+    with c4:
+        st.dataframe(idx.top10_counts, use_container_width=True)
+
+
+# ============================ 선수 비교 ============================
+# fragment: 비교 선수 선택을 바꾸면 이 섹션만 다시 그림
+@st.fragment
+@timed("compare")
+def compare_section(idx, sel_team):
+    st.subheader("🔍 선수 비교")
+    # 선택지 = 고른 선수 + 검색 결과 (검색어가 바뀌어 위젯이 새로 그려져도 고른 선수 유지)
+    picked = [p for p in st.session_state.get("compare_picked", []) if idx.has_player(p)]
+    query = st.text_input("비교 선수 검색", placeholder="이름 또는 초성 (예: ㅂㅇㄴ)")
+    options = idx.player_options(sel_team, query, keep=picked)
+    compare_players = st.multiselect("비교 선수(최대 2명)", options, default=picked, max_selections=2)
+    st.session_state["compare_picked"] = compare_players
+    if len(compare_players) == 0:
+        st.info("비교할 선수를 선택하세요. (최대 2명)")
+        return
+
+    cols_exist = [c for c in ["선수","팀","OCI"] + list(RADAR_COLS) if c in idx.df.columns]
+    comp_df = idx.df.iloc[[idx.row_of[p] for p in compare_players]][cols_exist]
+    st.dataframe(comp_df, use_container_width=True, hide_index=True)
+
+    # 비교 레이더 (축 범위: 팀별 사전 계산)
+    st.plotly_chart(oci_figures.compare_radar(idx, sel_team, tuple(compare_players)),
+                    use_container_width=True)
+
+    if len(compare_players) == 2:
+        r1, r2 = (idx.row(p) for p in compare_players)
+        deltas = {c: float(r1.get(c, np.nan)) - float(r2.get(c, np.nan)) for c in ("OCI", *RADAR_COLS)}
+        ddf = pd.DataFrame({"지표": list(deltas.keys()), "Δ(1-2)": list(deltas.values())})
+        st.dataframe(ddf, use_container_width=True)
+
+
+# ============================ 유사 선수 ============================
+# fragment: 인원 수를 바꾸면 이 섹션만 다시 그림 (KDTree 는 데이터 버전당 한 번 구성)
+@st.fragment
+@timed("similar")
+def similar_section(idx, sel_player):
+    st.subheader("👥 비슷한 유형의 선수")
+    if not idx.has_player(sel_player):
+        st.info("선수를 선택하세요.")
+        return
+    k = st.slider("유사 선수 수", min_value=3, max_value=15, value=5)
+    st.markdown(f"**{sel_player}** 와 지표 벡터가 가까운 선수 (리그 전체)")
+    st.dataframe(idx.similar(sel_player, k), use_container_width=True)
+    st.caption("거리: ADI·AER·ER·AEI 를 리그 안에서 표준화한 벡터의 유클리드 거리 (작을수록 비슷)")
+
+
+# ============================ 시즌·라운드별 추이 ============================
+# fragment: 구간/지표 선택을 바꾸면 이 섹션만 다시 그림
+# hist: 리그 스펙의 대회 이력 (store/history 사전 집계본을 대회 기준으로 거른 것)
+@st.fragment
+@timed("trend")
+def trend_section(hist_df, sel_player):
+    st.subheader("📉 시즌·라운드별 추이")
+    hist_p = hist_df[hist_df["선수"] == sel_player]
+    if hist_p.empty:
+        st.info("선택한 선수의 추이 데이터가 없습니다.")
+        return
+    span = st.radio("구간", ["라운드별", "누적"], horizontal=True)
+    if span == "라운드별":
+        hist_p = hist_p[hist_p["round_start"] == hist_p["round_end"]]
+    else:
+        hist_p = hist_p[hist_p["round_start"] == 1]
+    hist_p = hist_p.assign(구간=hist_p["season_year"].astype(str) + " " + hist_p["round"] + "R")
+    trend_metrics = st.multiselect("지표", ["OCI","ADI","AER","ER","AEI"], default=["OCI"])
+    import plotly.express as px   # 추이 데이터가 있을 때만
+    fig_trend = px.line(
+        hist_p, x="구간", y=trend_metrics, markers=True, height=420,
+        title=f"{sel_player} 지표 추이"
+    )
+    fig_trend.update_layout(xaxis_title="시즌 · 라운드", yaxis_title="표준화 지표")
+    st.plotly_chart(fig_trend, use_container_width=True)
+
+
+# ============================ 전체 화면 ============================
+def _export_url(spec, team, fmt, scaled):
+    """API 가 같은 표를 내보낼 수 있을 때(기본 시즌·라운드, 표준화 지표)만 스트리밍 링크"""
+    if not EXPORT_API or scaled or spec.file or spec.gender not in LEAGUES \
+            or (spec.season, spec.rounds) != (DEFAULT_SEASON, DEFAULT_ROUNDS):
+        return None
+    query = urlencode({"team": team, "format": FORMATS[fmt][0].lstrip(".")})
+    return f"{EXPORT_API}/leagues/{quote(spec.gender)}/export?{query}"
+
+
+def _export_path(idx, team, fmt) -> Path:
+    """(데이터 버전, 팀, 형식)당 임시 파일 하나 — 이미 있으면 재사용, 오래된 파일은 EXPORT_KEEP 개만 남김"""
+    key = hashlib.sha1(repr((idx.version, team, fmt)).encode("utf-8")).hexdigest()[:20]
+    path = EXPORT_DIR / f"{key}{FORMATS[fmt][0]}"
+    if not path.exists():
+        write_export(idx.view(team), path, fmt)
+        old = sorted(EXPORT_DIR.glob("*.*"), key=lambda p: p.stat().st_mtime, reverse=True)[EXPORT_KEEP:]
+        for p in old:
+            if p != path and p.suffix != ".part":
+                p.unlink(missing_ok=True)
+    return path
+
+
+@st.fragment
+@timed("export")
+def export_section(idx, spec, team, file_stem: str, scaled=False):
+    """형식 선택 → API 링크, 또는 [파일 만들기] 클릭 시에만 임시 파일 생성 → 다운로드 버튼"""
+    c1, c2 = st.columns([2, 1])
+    with c1:
+        fmt = st.radio("내보내기 형식", list(FORMATS), horizontal=True)
+    url = _export_url(spec, team, fmt, scaled)
+    if url is not None:
+        with c2:
+            st.link_button(f"{fmt} 다운로드 (현재 필터 적용)", url)
+        return
+    request = (idx.version, team, fmt)
+    with c2:
+        if st.button("파일 만들기 (현재 필터 적용)"):
+            st.session_state["_oci_export"] = request
+    if st.session_state.get("_oci_export") != request:
+        return
+    ext, mime = FORMATS[fmt]
+    with st.spinner("파일 생성 중..."):
+        path = _export_path(idx, team, fmt)
+    with path.open("rb") as f:
+        st.download_button(
+            label=f"{fmt} 다운로드 (현재 필터 적용)",
+            data=f,
+            file_name=f"{file_stem}{ext}",
+            mime=mime,
+        )
+
+
+def main(app="dashbord", scaled=False):
+    """통합 대시보드 한 번 실행 (scaled: 0~1 정규화 보기로 시작)"""
+    st.set_page_config(page_title="OCI 스카우팅 리포트", layout="wide")
+    start_run(app)  # 구간별 소요 시간 계측 (관리자 패널/로그/카운터)
+
+    # ---- 리그 선택 & 데이터 로드
+    # 리그별 지표: store/index Parquet 이 있으면 그것, 없으면 {리그}_지표.csv (레지스트리에 file 지정 시 그 파일)
+    # 캐시 로더: 파일이 바뀌지 않았다면 재실행 시 I/O·전처리 없이 공유 인덱스 반환
+    st.sidebar.title("⚙️ 필터")
+    registry = league_registry()
+    league = st.sidebar.radio("리그 선택", list(registry), horizontal=True)
+    mode = st.sidebar.radio("지표 보기", list(VIEW_MODES), index=int(scaled), horizontal=True)
+    scaled = VIEW_MODES[mode]
+    spec = registry[league]
+    with timer("league"):              # 캐시 미스면 읽기·전처리·인덱스 구성, 히트면 stat 만
+        idx = load_league(spec, scaled=scaled)
+    intervals = load_intervals(spec)   # 리그 슬라이스에 신뢰구간이 없으면 None
+    hist_df = load_history(spec)       # 리그 대회 이력이 없으면 None
+    lap("load")
+
+    # 수집 단계 검증 보고서 (store/validation) — 지표는 이미 검증됨, 경고만 요약 표시
+    report = load_validation(spec)
+    if report is not None and (report["level"] != "info").any():
+        with st.sidebar.expander(f"🧪 데이터 검증: {validate.summary(report)}"):
+            st.dataframe(report, use_container_width=True, hide_index=True)
+
+    # ---- 사이드바
+    sel_team = st.sidebar.selectbox("팀 선택", ["전체"] + idx.teams, index=0)
+    view_df = idx.view(sel_team)
+
+    # 선수 선택지: 전체 명단 대신 검색 결과 (이름·초성·오타, 예: ㅂㅇㄴ → 비예나), 검색어가 없으면 팀 선수
+    query = st.sidebar.text_input("선수 검색", placeholder="이름 또는 초성 (예: ㅂㅇㄴ)")
+    players = idx.player_options(sel_team, query)
+    empty = "(검색 결과 없음)" if query.strip() else "(데이터 없음)"
+    sel_player = st.sidebar.selectbox("선수 선택 (프로파일/KPI)", players if players else [empty])
+    lap("filter")
+
+    # ---- 헤더
+    st.title(f"🏐 OCI 스카우팅 리포트 — {league}")
+    if scaled:
+        st.caption("데이터: ADI(다양성) · AER(참여도) · ER(안정성) · AEI(효율기여) · OCI(종합점수) — 리그 안 0~1 정규화")
+    else:
+        st.caption("데이터: 선수별 공격지표 (선수, 팀, ADI, AER, ER, AEI, OCI) — 표준화 값")
+    st.markdown("---")
+
+    kpi_section(idx, league, sel_team, sel_player)
+    power_ranking_box(idx, league, sel_player)
+    lap("kpi")
+    radar_section(idx, sel_team, sel_player)
+    lap("radar")
+    st.markdown("---")
+
+    ranking_section(idx, league, sel_team, len(view_df), intervals, error_bars=not scaled)
+    st.markdown("---")
+    weights_section(idx, sel_team)
+    st.markdown("---")
+    team_top10_section(idx, league)
+    lap("team_top10")
+    st.markdown("---")
+    compare_section(idx, sel_team)
+    st.markdown("---")
+    similar_section(idx, sel_player)
+    st.markdown("---")
+    if hist_df is not None:
+        trend_section(hist_df, sel_player)
+        st.markdown("---")
+
+    # ---- 현재 필터 테이블 & 다운로드
+    st.subheader("📄 현재 필터 테이블")
+    st.dataframe(view_df, use_container_width=True, hide_index=True)   # 공유 DF 의 뷰 그대로 (복사 없음)
+    lap("table")
+
+    # 내보내기: API 링크 또는 클릭 시에만 생성 (CSV / Parquet / Excel)
+    export_section(idx, spec, sel_team, f"{league}_OCI_scouting_filtered", scaled)
+
+    timing_panel()
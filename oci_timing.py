@@ -0,0 +1,148 @@
+# oci_timing.py
+# ---------------------------------------------------------
+# 대시보드 구간별 소요 시간 계측
+# - lap("load") : 직전 기록 시점부터 지금까지를 해당 구간으로 기록 (스크립트 흐름용)
+# - @timed("ranking") / with timer("ranking") : 함수·블록 단위 (fragment 용)
+# - 기록 대상
+#   · 세션: 마지막 재실행의 구간별 ms (관리자 사이드바 패널)
+#   · 로그: 구간마다 JSON 한 줄 (logger "oci.timing")
+#   · 카운터: 프로세스 전체 누적 (Prometheus 텍스트 형식)
+#     OCI_METRICS_FILE 환경변수가 있으면 재실행마다 그 파일에 기록
+#     (node_exporter textfile collector 등으로 수집)
+# - 관리자 패널: OCI_ADMIN_TOKEN 환경변수 설정 + URL ?admin=<토큰>
+# ---------------------------------------------------------
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import streamlit as st
+
+logger = logging.getLogger("oci.timing")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+_TIMINGS = "_oci_timings"
+_LAP = "_oci_lap"
+_APP = "_oci_app"
+
+
+# ============================ 프로세스 카운터 ============================
+class StageCounters:
+    """구간별 누적 소요 시간/호출 수 (모든 세션 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seconds = {}
+        self._calls = {}
+
+    def observe(self, app: str, stage: str, seconds: float) -> None:
+        key = (app, stage)
+        with self._lock:
+            self._seconds[key] = self._seconds.get(key, 0.0) + seconds
+            self._calls[key] = self._calls.get(key, 0) + 1
+
+    def prometheus_text(self) -> str:
+        with self._lock:
+            items = sorted(self._seconds.items())
+            calls = dict(self._calls)
+        lines = [
+            "# HELP oci_stage_seconds_total Cumulative time spent per dashboard stage.",
+            "# TYPE oci_stage_seconds_total counter",
+        ]
+        lines += [f'oci_stage_seconds_total{{app="{a}",stage="{s}"}} {v:.6f}' for (a, s), v in items]
+        lines += [
+            "# HELP oci_stage_calls_total Number of times each dashboard stage ran.",
+            "# TYPE oci_stage_calls_total counter",
+        ]
+        lines += [f'oci_stage_calls_total{{app="{a}",stage="{s}"}} {calls[(a, s)]}' for (a, s), _ in items]
+        return "\n".join(lines) + "\n"
+
+
+@st.cache_resource
+def counters() -> StageCounters:
+    return StageCounters()
+
+
+# ============================ 기록 ============================
+def _record(stage: str, seconds: float) -> None:
+    app = st.session_state.get(_APP, "oci")
+    st.session_state.setdefault(_TIMINGS, {})[stage] = seconds * 1000
+    st.session_state[_LAP] = time.perf_counter()
+    counters().observe(app, stage, seconds)
+    logger.info(json.dumps(
+        {"event": "stage_timing", "app": app, "stage": stage, "ms": round(seconds * 1000, 3)},
+        ensure_ascii=False,
+    ))
+
+
+def start_run(app: str) -> None:
+    """스크립트 맨 위에서 호출: 이번 재실행 기록 초기화"""
+    st.session_state[_APP] = app
+    st.session_state[_TIMINGS] = {}
+    st.session_state[_LAP] = time.perf_counter()
+
+
+def lap(stage: str) -> None:
+    """직전 기록 시점부터 지금까지를 stage 로 기록"""
+    start = st.session_state.get(_LAP, time.perf_counter())
+    _record(stage, time.perf_counter() - start)
+
+
+@contextmanager
+def timer(stage: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(stage, time.perf_counter() - start)
+
+
+def timed(stage: str):
+    """함수 실행 시간을 stage 로 기록하는 데코레이터"""
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timer(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+# ============================ 출력 ============================
+def export_metrics() -> None:
+    """OCI_METRICS_FILE 이 설정돼 있으면 Prometheus 텍스트 파일 갱신"""
+    path = os.environ.get("OCI_METRICS_FILE")
+    if not path:
+        return
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(counters().prometheus_text(), encoding="utf-8")
+    tmp.replace(path)
+
+
+def is_admin() -> bool:
+    token = os.environ.get("OCI_ADMIN_TOKEN")
+    return bool(token) and st.query_params.get("admin") == token
+
+
+def timing_panel() -> None:
+    """스크립트 맨 아래에서 호출: 메트릭 내보내기 + (관리자) 사이드바 패널"""
+    export_metrics()
+    if not is_admin():
+        return
+    timings = st.session_state.get(_TIMINGS, {})
+    with st.sidebar.expander("⏱️ 구간별 소요 시간 (마지막 재실행)", expanded=False):
+        rows = [{"구간": k, "ms": round(v, 2)} for k, v in timings.items()]
+        rows.append({"구간": "합계", "ms": round(sum(timings.values()), 2)})
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+        st.code(counters().prometheus_text(), language="text")
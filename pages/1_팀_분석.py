@@ -0,0 +1,95 @@
+# pages/1_팀_분석.py
+# ---------------------------------------------------------
+# 팀 분석 페이지 (streamlit run dashbord.py 사이드바의 페이지 목록)
+# - 입력: 슬라이스(시즌 × 라운드)별 팀 집계 (store/team_agg, 없으면 data/*.csv 기본 슬라이스)
+# - 여러 시즌/라운드를 묶을 때는 선수 테이블 없이 집계 통계만 합산
+# - 팀별 지표 분포(평균 ± 표준편차, 최소~최대), 공격 유형 구성, 공격 뎁스
+# ---------------------------------------------------------
+
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from metrics import ATTACK_TYPES, teams
+from oci_data import league_registry, load_team_aggregates
+from oci_timing import lap, start_run, timing_panel
+
+st.set_page_config(page_title="팀 분석", layout="wide")
+start_run("team_page")
+
+# ============================ 데이터 로드 & 슬라이스 선택 ============================
+st.sidebar.title("⚙️ 필터")
+genders = list(dict.fromkeys(spec.gender for spec in league_registry().values()))
+league = st.sidebar.radio("리그 선택", genders, horizontal=True)
+aggs = load_team_aggregates(league)
+if aggs.empty:
+    st.warning("팀 집계가 없습니다. `python -m metrics` 로 지표를 먼저 생성하세요.")
+    st.stop()
+
+seasons = aggs.drop_duplicates("season").sort_values("season_year")["season"].tolist()
+sel_season = st.sidebar.selectbox("시즌", ["전체"] + seasons, index=len(seasons))
+scope = aggs if sel_season == "전체" else aggs[aggs["season"] == sel_season]
+
+PER_ROUND = "라운드별 합산"
+round_keys = scope.drop_duplicates("round").sort_values(["round_start", "round_end"])["round"].tolist()
+round_opts = ([PER_ROUND] if (scope["round_start"] == scope["round_end"]).any() else []) + round_keys
+sel_round = st.sidebar.selectbox("라운드 구간", round_opts)
+if sel_round == PER_ROUND:
+    scope = scope[scope["round_start"] == scope["round_end"]]
+else:
+    scope = scope[scope["round"] == sel_round]
+
+# 슬라이스가 여러 개면 집계 통계만 합산 (선수-슬라이스 단위)
+summary = teams.summarize(teams.merge_aggregates(scope))
+lap("aggregate")
+
+# ============================ 헤더 ============================
+st.title(f"🏟️ 팀 분석 — {league}")
+st.caption(f"시즌: {sel_season} · 라운드: {sel_round} · 슬라이스 {scope[['season', 'round']].drop_duplicates().shape[0]}개")
+st.markdown("---")
+
+# ============================ 팀 요약 ============================
+st.subheader("📋 팀 요약")
+summary_cols = ["팀", "인원", "OCI_평균", "ADI_평균", "AER_평균", "ER_평균", "AEI_평균", "유효_공격수", "최다시도_비중"]
+st.dataframe(summary[summary_cols].round(3), use_container_width=True, hide_index=True)
+st.caption("유효 공격수 = (Σ시도)² / Σ시도² — 공격 시도가 고르게 나뉠수록 인원 수에 가까움")
+lap("summary")
+
+st.markdown("---")
+
+# ============================ 지표 분포 ============================
+st.subheader("📈 팀별 지표 분포")
+metric = st.radio("지표", list(teams.AGG_METRICS), horizontal=True, index=len(teams.AGG_METRICS) - 1)
+fig = go.Figure()
+fig.add_trace(go.Scatter(
+    x=summary["팀"], y=summary[f"{metric}_평균"], mode="markers", name="평균 ± 표준편차",
+    marker=dict(size=12), error_y=dict(type="data", array=summary[f"{metric}_표준편차"]),
+))
+fig.add_trace(go.Scatter(x=summary["팀"], y=summary[f"{metric}_최대"], mode="markers", name="최대",
+                         marker=dict(symbol="triangle-up", size=9)))
+fig.add_trace(go.Scatter(x=summary["팀"], y=summary[f"{metric}_최소"], mode="markers", name="최소",
+                         marker=dict(symbol="triangle-down", size=9)))
+fig.update_layout(height=420, yaxis_title=metric)
+st.plotly_chart(fig, use_container_width=True)
+lap("distribution")
+
+st.markdown("---")
+
+# ============================ 공격 유형 구성 & 뎁스 ============================
+c1, c2 = st.columns(2)
+with c1:
+    st.subheader("🧩 공격 유형 구성")
+    mix = summary.melt(id_vars="팀", value_vars=[f"비중_{t}" for t in ATTACK_TYPES],
+                       var_name="유형", value_name="비중")
+    mix["유형"] = mix["유형"].str.removeprefix("비중_")
+    fig_mix = px.bar(mix, x="팀", y="비중", color="유형", height=420)
+    fig_mix.update_layout(barmode="stack", yaxis_tickformat=".0%")
+    st.plotly_chart(fig_mix, use_container_width=True)
+with c2:
+    st.subheader("🧱 공격 뎁스")
+    fig_depth = px.bar(summary, x="팀", y="유효_공격수", text="인원",
+                       color="최다시도_비중", color_continuous_scale="OrRd", height=420)
+    fig_depth.update_traces(texttemplate="인원 %{text}", textposition="outside")
+    st.plotly_chart(fig_depth, use_container_width=True)
+lap("mix_depth")
+
+timing_panel()
@@ -0,0 +1,196 @@
+# player_search.py
+# ---------------------------------------------------------
+# 선수 이름 검색 인덱스 (사이드바 선수 선택 / 비교 선수 선택)
+# - 이름마다 검색 키 3개: 이름(소문자, 공백 제거), 자모 분해, 초성
+#   → 입력 중인 음절("비ㅇ" → 비예나), 초성("ㅂㅇㄴ" → 비예나) 도 접두사로 찾음
+# - 접두사: 키별 정렬 배열에서 이분 탐색 두 번 (노드 객체 없이 배열로 펼친 trie)
+# - 부분 일치: 키를 구분자로 이어 붙인 문자열에서 str.find (C 루프)
+# - 오타: 자모 2-gram 역색인 → 겹치는 2-gram 수로 Dice 점수 (np.bincount 한 번)
+# - 순위: 정확 > 이름 접두사 > 자모 접두사 > 초성 접두사 > 부분 일치 > 오타,
+#   같은 단계는 priority(대시보드는 리그 OCI 순위) 순
+# - 데이터 버전당 한 번 구성 (LeagueIndex.search_index), 조회는 후보 배열 연산만
+#
+# 사용 예)
+#   index = SearchIndex(["비예나", "레오", "허수봉"])
+#   index.search("ㅂㅇㄴ")     # ['비예나']
+#   index.search("비에나")     # ['비예나'] (오타)
+# ---------------------------------------------------------
+
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+
+import numpy as np
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+# 겹모음/겹받침은 입력 순서대로 풀어 둠 (입력 중인 "달" 이 "닭" 의 접두사가 되도록)
+COMPOUND = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+HANGUL_BASE, HANGUL_LAST = 0xAC00, 0xD7A3
+
+# 검색 단계 (작을수록 위)
+EXACT, NAME_PREFIX, JAMO_PREFIX, CHOSEONG_PREFIX, SUBSTRING, FUZZY = range(6)
+KEY_KINDS = ("name", "jamo", "choseong")
+FUZZY_MIN = 0.5       # 자모 2-gram Dice 계수 하한
+SEARCH_LIMIT = 20
+
+_SEP = "\x00"         # 이어 붙인 키 사이 구분자 (부분 일치가 두 이름에 걸치지 않도록)
+
+
+def normalize(text: str) -> str:
+    """NFC + 소문자 + 공백 제거"""
+    return "".join(unicodedata.normalize("NFC", str(text)).lower().split())
+
+
+@lru_cache(maxsize=None)
+def _char_jamo(ch: str) -> tuple:
+    """글자 하나 → (자모 분해, 초성) — 한글 음절이 아니면 (겹자모만 풀고, 그대로)"""
+    code = ord(ch) - HANGUL_BASE
+    if not 0 <= code <= HANGUL_LAST - HANGUL_BASE:
+        return COMPOUND.get(ch, ch), ch
+    cho, rest = divmod(code, 21 * 28)
+    jung, jong = divmod(rest, 28)
+    jamo = CHOSEONG[cho] + COMPOUND.get(JUNGSEONG[jung], JUNGSEONG[jung])
+    jamo += COMPOUND.get(JONGSEONG[jong], JONGSEONG[jong])
+    return jamo, CHOSEONG[cho]
+
+
+def jamo(text: str) -> str:
+    """'비예나' → 'ㅂㅣㅇㅖㄴㅏ' (normalize 된 문자열)"""
+    return "".join(_char_jamo(ch)[0] for ch in text)
+
+
+def choseong(text: str) -> str:
+    """'비예나' → 'ㅂㅇㄴ' (한글 음절이 아닌 글자는 그대로)"""
+    return "".join(_char_jamo(ch)[1] for ch in text)
+
+
+def _bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _mixed_match(key: str, query: str) -> bool:
+    """음절 + 낱자 자음 섞인 검색어("비ㅇㄴ"): 음절은 그대로, 자음은 초성으로 비교"""
+    return all(k == c or (c in CHOSEONG and _char_jamo(k)[1] == c) for k, c in zip(key, query))
+
+
+class SearchIndex:
+    """이름 목록 → 접두사/초성/부분 일치/오타 검색 (이름 순서 = id)
+
+    priority: 같은 검색 단계 안의 정렬 기준 (작을수록 위, 기본은 목록 순서)
+    """
+
+    def __init__(self, names, priority=None):
+        self.names = np.asarray(list(names), dtype=object)
+        n = len(self.names)
+        self.priority = np.arange(n) if priority is None else np.asarray(priority)
+        keys = {"name": [normalize(x) for x in self.names]}
+        keys["jamo"] = [jamo(k) for k in keys["name"]]
+        keys["choseong"] = [choseong(k) for k in keys["name"]]
+        self._name_keys = keys["name"]
+        self._exact = {}
+        for i, k in enumerate(keys["name"]):
+            self._exact.setdefault(k, []).append(i)
+
+        # 접두사: (정렬된 키 목록, 키 위치 → id)
+        self._sorted = {}
+        for kind in KEY_KINDS:
+            order = sorted(range(n), key=keys[kind].__getitem__)
+            self._sorted[kind] = ([keys[kind][i] for i in order], np.asarray(order, dtype=np.int64))
+
+        # 부분 일치: 이름/초성을 이어 붙인 문자열 + 각 키의 시작 위치
+        self._joined = {}
+        for kind in ("name", "choseong"):
+            starts = np.cumsum([0] + [len(k) + 1 for k in keys[kind][:-1]]) if n else np.empty(0, int)
+            self._joined[kind] = (_SEP.join(keys[kind]), starts)
+
+        # 오타: 자모 2-gram → id 배열
+        postings = {}
+        self._gram_count = np.zeros(n, dtype=np.int64)
+        for i, k in enumerate(keys["jamo"]):
+            grams = _bigrams(k)
+            self._gram_count[i] = len(grams)
+            for g in grams:
+                postings.setdefault(g, []).append(i)
+        self._postings = {g: np.asarray(ids, dtype=np.int64) for g, ids in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # ----------------------------- 단계별 후보 -----------------------------
+    def _prefix(self, kind: str, prefix: str) -> np.ndarray:
+        keys, ids = self._sorted[kind]
+        lo = bisect_left(keys, prefix)
+        hi = bisect_left(keys, prefix + "\U0010ffff", lo)
+        return ids[lo:hi]
+
+    def _substring(self, kind: str, part: str) -> np.ndarray:
+        text, starts = self._joined[kind]
+        hits, at = [], text.find(part)
+        while at >= 0:
+            hits.append(at)
+            at = text.find(part, at + 1)
+        return np.searchsorted(starts, np.asarray(hits, dtype=np.int64), side="right") - 1
+
+    def _fuzzy(self, query_jamo: str) -> tuple:
+        """(id 배열, Dice 점수) — 점수 FUZZY_MIN 이상"""
+        grams = [self._postings[g] for g in _bigrams(query_jamo) if g in self._postings]
+        if not grams:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        overlap = np.bincount(np.concatenate(grams), minlength=len(self))
+        dice = 2 * overlap / (len(_bigrams(query_jamo)) + self._gram_count).clip(min=1)
+        ids = np.flatnonzero(dice >= FUZZY_MIN)
+        return ids, dice[ids]
+
+    # ----------------------------- 검색 -----------------------------
+    def search(self, query: str, limit=SEARCH_LIMIT, mask=None) -> list:
+        """검색어 → 이름 목록 (최대 limit, 순위순), mask: 후보로 허용할 id (bool 배열)"""
+        q = normalize(query)
+        if not q or not len(self):
+            return []
+        n = len(self)
+        tier = np.full(n, FUZZY + 1, dtype=np.int64)
+        q_jamo = jamo(q)
+
+        def mark(ids, level):
+            tier[ids] = np.minimum(tier[ids], level)
+
+        mark(np.asarray(self._exact.get(q, []), dtype=np.int64), EXACT)
+        mark(self._prefix("name", q), NAME_PREFIX)
+        mark(self._prefix("jamo", q_jamo), JAMO_PREFIX)
+        # 초성 검색: 검색어에 낱자 자음이 있을 때만 — 음절이 섞여 있으면("비ㅇㄴ") 음절 자리도 맞는지 확인
+        consonants = [ch in CHOSEONG for ch in q]
+        q_cho = choseong(q)
+        if any(consonants):
+            ids = self._prefix("choseong", q_cho)
+            if not all(consonants):
+                ids = ids[np.fromiter((_mixed_match(self._name_keys[i], q) for i in ids), bool, len(ids))]
+            mark(ids, CHOSEONG_PREFIX)
+        if mask is not None:
+            tier[~mask] = FUZZY + 1
+        # 부분 일치는 접두사 결과 뒤에 오므로, 접두사만으로 limit 을 채우면 생략
+        if np.count_nonzero(tier <= CHOSEONG_PREFIX) < limit:
+            mark(self._substring("name", q), SUBSTRING)
+            if all(consonants):
+                mark(self._substring("choseong", q_cho), SUBSTRING)
+            if mask is not None:
+                tier[~mask] = FUZZY + 1
+
+        found = np.flatnonzero(tier <= SUBSTRING)
+        score = np.zeros(n)
+        if len(found) < limit and len(q_jamo) >= 3:
+            ids, dice = self._fuzzy(q_jamo)
+            fresh = tier[ids] > FUZZY
+            if mask is not None:
+                fresh &= mask[ids]
+            tier[ids[fresh]] = FUZZY
+            score[ids[fresh]] = -dice[fresh]
+            found = np.flatnonzero(tier <= FUZZY)
+
+        order = np.lexsort((self.priority[found], score[found], tier[found]))
+        return self.names[found[order[:limit]]].tolist()